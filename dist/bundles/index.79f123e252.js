@@ -0,0 +1,329 @@
+const HeroFeature = {
+init: async function () {
+const heroContainer = $(".hero-bg-container");
+if (heroContainer.length === 0) return;
+const masterData = await Data.loadMasterData();
+if (!masterData || !masterData.assets_manifest) {
+console.error("❌ [Hero] Failed to load assets_manifest");
+return;
+}
+const images = masterData.assets_manifest["home-page/hero-images"] || [];
+if (images.length === 0) return;
+heroContainer.empty();
+images.forEach((img, index) => {
+heroContainer.append(`
+<div class="hero-bg ${index === 0 ? 'active' : ''}"
+style="background-image: url('${Utils.assetInfo(masterData, 'home-page/hero-images', img).src}');
+opacity: ${index === 0 ? 1 : 0};">
+</div>
+`);
+});
+const heroBgs = $(".hero-bg");
+const isMobile = window.innerWidth <= 768;
+if (isMobile) {
+if (heroBgs.length <= 1) return;
+let current = 0;
+setInterval(() => {
+heroBgs.eq(current).removeClass("active").css("opacity", 0);
+current = (current + 1) % heroBgs.length;
+heroBgs.eq(current).addClass("active").css("opacity", 1);
+}, 4000);
+} else {
+heroBgs.css({
+opacity: 1,
+transition: "none",
+}).addClass("active");
+}
+$(document).on("click", ".btn-ga-hero", function() {
+Analytics.trackInteraction('hero_cta', 'hero_main_button');
+});
+}
+};;
+const LogosFeature = {
+init: async function () {
+console.log("Initializing Logos feature...");
+const container = $("#logos-container");
+if (container.length === 0) return;
+const masterData = await Data.loadMasterData();
+if (!masterData || !masterData.assets_manifest) {
+console.error("❌ [Logos] Failed to load assets_manifest");
+return;
+}
+const logos = masterData.assets_manifest["home-page/logos"] || [];
+if (logos.length === 0) return;
+container.empty();
+logos.forEach(logo => {
+const asset = Utils.assetInfo(masterData, 'home-page/logos', logo);
+container.append(`
+<div class="brand-logo-item">
+${Utils.picture(asset, logo)}
+</div>
+`);
+});
+}
+};;
+const HomeServicesFeature = {
+init: async function() {
+const container = $("#home-categories-container");
+if (container.length === 0) return;
+const [categories, indexes] = await Promise.all([Data.fetch("categories"), Data.indexes()]);
+const homeCategories = (indexes.home_categories || []).map(i => categories[i]);
+this.renderCategories(container, homeCategories, indexes);
+},
+renderCategories: function(container, categories, indexes) {
+container.empty();
+categories.forEach(category => {
+const slug = category.name.trim().replace(/\s+/g, "-").toLowerCase();
+container.append(`
+<a href="${category.href}" class="category-card" data-ga-category="${slug}">
+<div class="category-card-bg" style="background-image: url('${Utils.resolvedAsset(indexes, category.image_url).src}')"></div>
+<div class="category-card-content">
+<h3>${category.name}</h3>
+<p>${category.description}</p>
+</div>
+</a>
+`);
+});
+$(document).on("click", "#home-categories-container .category-card", function() {
+const slug = $(this).data("ga-category");
+Analytics.trackInteraction('home_category', slug);
+});
+}
+};;
+const PortfolioFeature = {
+init: async function() {
+const container = $("#portfolio-carousel");
+if (container.length === 0) return;
+const masterData = await Data.loadMasterData();
+if (!masterData || !masterData.assets_manifest) {
+console.error("❌ [Portfolio] Failed to load assets_manifest");
+return;
+}
+const assets = masterData.assets_manifest || {};
+const images = assets['portfolio'] || [];
+if (images.length === 0) {
+console.warn("Portfolio manifest empty. Run sync_engine.py to update.");
+return;
+}
+this.renderPortfolio(container, images, masterData);
+},
+renderPortfolio: function(container, images, masterData) {
+container.empty();
+const processed = new Set();
+const pairs = [];
+const singles = [];
+const usedInPair = new Set();
+images.forEach(img => {
+const name = img.toLowerCase();
+if (name.includes('_before')) {
+const baseName = name.split('_before')[0];
+const afterImage = images.find(i => i.toLowerCase().startsWith(baseName + '_after'));
+if (afterImage) {
+pairs.push({ before: img, after: afterImage });
+usedInPair.add(img);
+usedInPair.add(afterImage);
+}
+}
+});
+images.forEach(img => {
+if (!usedInPair.has(img)) {
+singles.push(img);
+}
+});
+pairs.forEach(pair => {
+const before = Utils.assetInfo(masterData, 'portfolio', pair.before, '50vw');
+const after = Utils.assetInfo(masterData, 'portfolio', pair.after, '50vw');
+container.append(`
+<div class="portfolio-item transformation-pair">
+<div class="transformation-side before">
+${Utils.picture(before, 'Before')}
+<span class="label">Before</span>
+</div>
+<div class="transformation-side after">
+${Utils.picture(after, 'After')}
+<span class="label">After</span>
+</div>
+</div>
+`);
+});
+singles.forEach(img => {
+const asset = Utils.assetInfo(masterData, 'portfolio', img);
+container.append(`
+<div class="portfolio-item">
+${Utils.picture(asset, 'Portfolio Work')}
+</div>
+`);
+});
+}
+};;
+const ReviewsFeature = {
+init: async function (options = {}) {
+let reviews = await Data.fetch("reviews");
+if (reviews.length === 0) {
+$("#reviews-container").html('<p class="text-center">Reviews are currently being updated.</p>');
+return;
+}
+if (options.shuffle) {
+reviews = reviews.sort(() => 0.5 - Math.random());
+}
+if (options.limit) {
+reviews = reviews.slice(0, options.limit);
+}
+const container = $("#reviews-container");
+container.empty();
+reviews.forEach((review) => {
+container.append(`
+<div class="review-card">
+<span class="review-author">${review.author}</span>
+<p>"${review.text.replace(/"/g, "")}"</p>
+</div>
+`);
+});
+this.bindReviewToggle();
+this.setupScrollIndicator(reviews.length);
+},
+setupScrollIndicator: function(count) {
+const hintContainer = $(".scroll-hint");
+if (hintContainer.length === 0) return;
+hintContainer.empty();
+const dotCount = Math.min(count, 5);
+for (let i = 0; i < dotCount; i++) {
+hintContainer.append(`<div class="scroll-dot ${i === 0 ? 'active' : ''}"></div>`);
+}
+const grid = $("#reviews-container");
+const dots = $(".scroll-dot");
+let hasTrackedEnd = false;
+grid.on("scroll", () => {
+const scrollLeft = grid.scrollLeft();
+const maxScroll = grid[0].scrollWidth - grid.width();
+const progress = scrollLeft / maxScroll;
+const activeIndex = Math.min(Math.floor(progress * dotCount), dotCount - 1);
+dots.removeClass("active");
+dots.eq(activeIndex).addClass("active");
+if (progress > 0.95 && !hasTrackedEnd) {
+hasTrackedEnd = true;
+Analytics.trackScrollEnd('reviews_carousel');
+}
+});
+},
+bindReviewToggle: function() {
+$(document).off("click", ".review-card").on("click", ".review-card", function() {
+const card = $(this);
+const isExpanding = !card.hasClass("expanded");
+card.toggleClass("expanded");
+if (isExpanding) {
+Analytics.trackInteraction('review_expansion', card.find('.review-author').text());
+}
+const navHeight = $("nav").outerHeight() || 0;
+const extraPadding = CONFIG.SETTINGS.SCROLL_OFFSET;
+if (isExpanding) {
+setTimeout(() => {
+$("html, body").animate({
+scrollTop: card.offset().top - navHeight - extraPadding
+}, 400);
+}, 100);
+} else {
+card.scrollTop(0);
+$("html, body").animate({
+scrollTop: card.offset().top - navHeight - extraPadding
+}, 200);
+}
+});
+}
+};;
+const SubscribeFeature = {
+init: function (config) {
+const container = $("#subscribe-container");
+const form = $("#mc-embedded-subscribe-form, .subscribe-form");
+const success = $("#subscribe-success");
+if (form.length === 0) return;
+window.fnames = new Array();
+window.ftypes = new Array();
+fnames[0] = "EMAIL"; ftypes[0] = "email";
+fnames[2] = "NAME"; ftypes[2] = "text";
+if (!$('script[src*="mc-validate.js"]').length) {
+$(document).on('appReady', function() {
+const script = document.createElement("script");
+script.src = "//s3.amazonaws.com/downloads.mailchimp.com/js/mc-validate.js";
+script.type = "text/javascript";
+script.async = true;
+document.body.appendChild(script);
+});
+}
+form.off("submit").on("submit", function (e) {
+if (!$("#legal-checkbox").is(":checked")) {
+e.preventDefault();
+e.stopPropagation();
+alert("Please agree to the terms and conditions to subscribe.");
+return false;
+}
+Analytics.trackLead('newsletter_signup', 'footer_subscribe');
+setTimeout(() => {
+container.fadeOut(600, function() {
+success.fadeIn(600);
+setTimeout(() => {
+success.fadeOut(600, function() {
+form[0].reset();
+container.fadeIn(600);
+});
+}, 20000);
+});
+}, 500);
+});
+}
+};;
+const DialogsFeature = {
+init: async function () {
+const masterData = await Data.loadMasterData();
+const dialogs = masterData.dialogs || [];
+if (dialogs.length === 0) return;
+dialogs.forEach((config, index) => {
+this.scheduleDialog(config, index);
+});
+},
+scheduleDialog: function (config, index) {
+const waitTime = (parseInt(config.timeInSeconds) || 5) * 1000;
+const storageKey = `dismissed_dialog_${btoa(config.title).substring(0, 10)}`;
+if (sessionStorage.getItem(storageKey)) return;
+setTimeout(() => {
+this.renderDialog(config, storageKey, index);
+}, waitTime);
+},
+renderDialog: function (config, storageKey, index) {
+const dialogId = `dialog-${index}`;
+if ($(`#${dialogId}`).length > 0) return;
+const dialogHtml = `
+<div class="luxury-dialog" id="${dialogId}">
+<button class="dialog-close" aria-label="Close">&times;</button>
+<div class="dialog-content">
+<span class="section-subtitle" style="font-size: 0.6rem; letter-spacing: 2px;">Style Plan(it) Alert</span>
+<h3>${config.title}</h3>
+<p>${config.description}</p>
+<a href="${config.action}" target="_blank" class="btn btn-primary-accent" style="width: 100%; text-align: center; margin-top: 10px;">${config.cta}</a>
+</div>
+</div>
+`;
+$('body').append(dialogHtml);
+const bottomOffset = 30 + (index * 20); // Slight stagger effect
+const leftOffset = 30 + (index * 20);
+$(`#${dialogId}`).css({
+'bottom': `${bottomOffset}px`,
+'left': `${leftOffset}px`,
+'z-index': 2000 + index
+});
+setTimeout(() => {
+$(`#${dialogId}`).addClass('visible');
+}, 100);
+$(`#${dialogId} .dialog-close`).on('click', () => {
+this.dismissDialog(dialogId, storageKey);
+});
+},
+dismissDialog: function (dialogId, storageKey) {
+const dialog = $(`#${dialogId}`);
+dialog.removeClass('visible');
+sessionStorage.setItem(storageKey, 'true');
+setTimeout(() => {
+dialog.remove();
+}, 600);
+}
+};
@@ -0,0 +1,185 @@
+const LearnFeature = {
+articles: [],
+init: async function() {
+console.log("🔍 [Learn] Init started...");
+const container = $("#wiki-article-container");
+if (container.length === 0) return;
+if (window.innerWidth < 1024) {
+$(".wiki-layout-wrapper").addClass("sidebar-collapsed");
+}
+this.articles = await Data.fetch("articles");
+if (this.articles.length === 0) {
+container.html('<p class="text-center">The Style Wiki is being updated. Please check back soon.</p>');
+return;
+}
+this.renderSidebar();
+this.bindEvents();
+const hash = window.location.hash.substring(1);
+const defaultArticle = this.articles.find(a => this.slugify(a.title) === hash) || this.articles[0];
+this.loadArticle(defaultArticle.title);
+},
+renderSidebar: function(articles = this.articles) {
+const list = $("#wiki-article-list");
+list.empty();
+if (articles.length === 0) {
+list.append('<li class="wiki-no-results">No articles match your search.</li>');
+return;
+}
+articles.forEach(article => {
+const slug = this.slugify(article.title);
+list.append(`
+<li>
+<a href="#${slug}" class="wiki-nav-link" data-title="${article.title}">
+${article.title}
+</a>
+</li>
+`);
+});
+},
+filterSidebar: async function(text) {
+this.searchText = text;
+if (!text.trim()) {
+this.renderSidebar();
+return;
+}
+const index = await Data.searchIndex();
+if (text !== this.searchText) return; // a newer keystroke already re-rendered
+const matches = index
+? Search.query(index, text, index.docs.length)
+.filter(hit => hit.section === "articles")
+.map(hit => this.articles[hit.position])
+.filter(Boolean)
+: this.articles.filter(a => a.title.toLowerCase().includes(text.trim().toLowerCase()));
+this.renderSidebar(matches);
+},
+loadArticle: function(title) {
+const article = this.articles.find(a => a.title === title);
+if (!article) return;
+const container = $("#wiki-article-container");
+const slug = this.slugify(article.title);
+$(".wiki-nav-link").removeClass("active");
+$(`.wiki-nav-link[data-title="${title}"]`).addClass("active");
+Analytics.trackInteraction('wiki_view', slug);
+const isDarkMode = container.hasClass("dark-mode");
+container.hide().html(`
+<div class="wiki-article-view">
+<span class="section-subtitle">${article.category || 'Article'}</span>
+<h1 class="article-title">${article.title}</h1>
+<div class="article-meta">
+<span class="read-time"><i class="far fa-clock"></i> ${article.read_time || '5 min'} read</span>
+</div>
+<div class="article-body">
+${article.content}
+</div>
+<div class="article-footer">
+<hr>
+<div class="article-cta">
+<h4>Ready to apply this to your own brand?</h4>
+<a href="https://cal.com/styleplanit/15min" target="_blank" class="btn btn-primary-accent">Book a Discovery Call</a>
+</div>
+</div>
+</div>
+`);
+if (isDarkMode) container.addClass("dark-mode");
+container.fadeIn(400);
+const scrollTarget = window.innerWidth < 768 ? container.offset().top - 100 : 0;
+if (scrollTarget > 0) {
+$("html, body").animate({ scrollTop: scrollTarget }, 500);
+} else {
+window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+if (window.innerWidth < 1024) {
+$(".wiki-layout-wrapper").addClass("sidebar-collapsed");
+}
+},
+bindEvents: function() {
+const self = this;
+$(document).on("click", ".wiki-nav-link", function(e) {
+const title = $(this).data("title");
+self.loadArticle(title);
+});
+$(document).on("focus", "#wiki-search", () => Data.searchIndex());
+$(document).on("input", "#wiki-search", function() {
+self.filterSidebar($(this).val());
+});
+$(document).on("click", "#wiki-sidebar-toggle", function() {
+$(".wiki-layout-wrapper").toggleClass("sidebar-collapsed");
+});
+$(document).on("click", "#wiki-sidebar-close", function() {
+$(".wiki-layout-wrapper").addClass("sidebar-collapsed");
+});
+$(document).on("click", "#dark-mode-toggle", function() {
+const container = $("#wiki-article-container");
+container.toggleClass("dark-mode");
+const icon = $(this).find("i");
+if (container.hasClass("dark-mode")) {
+icon.removeClass("fa-moon").addClass("fa-sun");
+$(this).attr("title", "Toggle Light Mode");
+} else {
+icon.removeClass("fa-sun").addClass("fa-moon");
+$(this).attr("title", "Toggle Dark Mode");
+}
+});
+},
+slugify: function(text) {
+return text.toString().toLowerCase().trim()
+.replace(/\s+/g, '-')
+.replace(/[^\w\-]+/g, '')
+.replace(/\-\-+/g, '-');
+}
+};;
+const DialogsFeature = {
+init: async function () {
+const masterData = await Data.loadMasterData();
+const dialogs = masterData.dialogs || [];
+if (dialogs.length === 0) return;
+dialogs.forEach((config, index) => {
+this.scheduleDialog(config, index);
+});
+},
+scheduleDialog: function (config, index) {
+const waitTime = (parseInt(config.timeInSeconds) || 5) * 1000;
+const storageKey = `dismissed_dialog_${btoa(config.title).substring(0, 10)}`;
+if (sessionStorage.getItem(storageKey)) return;
+setTimeout(() => {
+this.renderDialog(config, storageKey, index);
+}, waitTime);
+},
+renderDialog: function (config, storageKey, index) {
+const dialogId = `dialog-${index}`;
+if ($(`#${dialogId}`).length > 0) return;
+const dialogHtml = `
+<div class="luxury-dialog" id="${dialogId}">
+<button class="dialog-close" aria-label="Close">&times;</button>
+<div class="dialog-content">
+<span class="section-subtitle" style="font-size: 0.6rem; letter-spacing: 2px;">Style Plan(it) Alert</span>
+<h3>${config.title}</h3>
+<p>${config.description}</p>
+<a href="${config.action}" target="_blank" class="btn btn-primary-accent" style="width: 100%; text-align: center; margin-top: 10px;">${config.cta}</a>
+</div>
+</div>
+`;
+$('body').append(dialogHtml);
+const bottomOffset = 30 + (index * 20); // Slight stagger effect
+const leftOffset = 30 + (index * 20);
+$(`#${dialogId}`).css({
+'bottom': `${bottomOffset}px`,
+'left': `${leftOffset}px`,
+'z-index': 2000 + index
+});
+setTimeout(() => {
+$(`#${dialogId}`).addClass('visible');
+}, 100);
+$(`#${dialogId} .dialog-close`).on('click', () => {
+this.dismissDialog(dialogId, storageKey);
+});
+},
+dismissDialog: function (dialogId, storageKey) {
+const dialog = $(`#${dialogId}`);
+dialog.removeClass('visible');
+sessionStorage.setItem(storageKey, 'true');
+setTimeout(() => {
+dialog.remove();
+}, 600);
+}
+};
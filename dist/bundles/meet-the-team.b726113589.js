@@ -0,0 +1,86 @@
+const TeamFeature = {
+init: async function () {
+const container = $("#team-container");
+if (container.length === 0) return;
+const masterData = await Data.loadMasterData();
+const team = masterData.team || [];
+const teamImages = (masterData.indexes && masterData.indexes.team_images) || [];
+if (!team || team.length === 0) {
+container.html('<p class="text-center">Team details coming soon.</p>');
+return;
+}
+container.empty();
+team.forEach((person, index) => {
+const isEven = index % 2 === 0;
+const alignmentClass = isEven ? "image-left" : "image-right";
+const image = Utils.assetInfo(masterData, 'meet-team-page', teamImages[index]);
+container.append(`
+<div class="profile-card ${alignmentClass}">
+<div class="profile-image">
+${Utils.picture(image, person.name)}
+</div>
+<div class="profile-text">
+<h3>${person.name}</h3>
+<span class="role">${person.role}</span>
+<p class="bio">${person.bio}</p>
+</div>
+</div>
+`);
+});
+}
+};;
+const DialogsFeature = {
+init: async function () {
+const masterData = await Data.loadMasterData();
+const dialogs = masterData.dialogs || [];
+if (dialogs.length === 0) return;
+dialogs.forEach((config, index) => {
+this.scheduleDialog(config, index);
+});
+},
+scheduleDialog: function (config, index) {
+const waitTime = (parseInt(config.timeInSeconds) || 5) * 1000;
+const storageKey = `dismissed_dialog_${btoa(config.title).substring(0, 10)}`;
+if (sessionStorage.getItem(storageKey)) return;
+setTimeout(() => {
+this.renderDialog(config, storageKey, index);
+}, waitTime);
+},
+renderDialog: function (config, storageKey, index) {
+const dialogId = `dialog-${index}`;
+if ($(`#${dialogId}`).length > 0) return;
+const dialogHtml = `
+<div class="luxury-dialog" id="${dialogId}">
+<button class="dialog-close" aria-label="Close">&times;</button>
+<div class="dialog-content">
+<span class="section-subtitle" style="font-size: 0.6rem; letter-spacing: 2px;">Style Plan(it) Alert</span>
+<h3>${config.title}</h3>
+<p>${config.description}</p>
+<a href="${config.action}" target="_blank" class="btn btn-primary-accent" style="width: 100%; text-align: center; margin-top: 10px;">${config.cta}</a>
+</div>
+</div>
+`;
+$('body').append(dialogHtml);
+const bottomOffset = 30 + (index * 20); // Slight stagger effect
+const leftOffset = 30 + (index * 20);
+$(`#${dialogId}`).css({
+'bottom': `${bottomOffset}px`,
+'left': `${leftOffset}px`,
+'z-index': 2000 + index
+});
+setTimeout(() => {
+$(`#${dialogId}`).addClass('visible');
+}, 100);
+$(`#${dialogId} .dialog-close`).on('click', () => {
+this.dismissDialog(dialogId, storageKey);
+});
+},
+dismissDialog: function (dialogId, storageKey) {
+const dialog = $(`#${dialogId}`);
+dialog.removeClass('visible');
+sessionStorage.setItem(storageKey, 'true');
+setTimeout(() => {
+dialog.remove();
+}, 600);
+}
+};
@@ -0,0 +1,130 @@
+const ReviewsFeature = {
+init: async function (options = {}) {
+let reviews = await Data.fetch("reviews");
+if (reviews.length === 0) {
+$("#reviews-container").html('<p class="text-center">Reviews are currently being updated.</p>');
+return;
+}
+if (options.shuffle) {
+reviews = reviews.sort(() => 0.5 - Math.random());
+}
+if (options.limit) {
+reviews = reviews.slice(0, options.limit);
+}
+const container = $("#reviews-container");
+container.empty();
+reviews.forEach((review) => {
+container.append(`
+<div class="review-card">
+<span class="review-author">${review.author}</span>
+<p>"${review.text.replace(/"/g, "")}"</p>
+</div>
+`);
+});
+this.bindReviewToggle();
+this.setupScrollIndicator(reviews.length);
+},
+setupScrollIndicator: function(count) {
+const hintContainer = $(".scroll-hint");
+if (hintContainer.length === 0) return;
+hintContainer.empty();
+const dotCount = Math.min(count, 5);
+for (let i = 0; i < dotCount; i++) {
+hintContainer.append(`<div class="scroll-dot ${i === 0 ? 'active' : ''}"></div>`);
+}
+const grid = $("#reviews-container");
+const dots = $(".scroll-dot");
+let hasTrackedEnd = false;
+grid.on("scroll", () => {
+const scrollLeft = grid.scrollLeft();
+const maxScroll = grid[0].scrollWidth - grid.width();
+const progress = scrollLeft / maxScroll;
+const activeIndex = Math.min(Math.floor(progress * dotCount), dotCount - 1);
+dots.removeClass("active");
+dots.eq(activeIndex).addClass("active");
+if (progress > 0.95 && !hasTrackedEnd) {
+hasTrackedEnd = true;
+Analytics.trackScrollEnd('reviews_carousel');
+}
+});
+},
+bindReviewToggle: function() {
+$(document).off("click", ".review-card").on("click", ".review-card", function() {
+const card = $(this);
+const isExpanding = !card.hasClass("expanded");
+card.toggleClass("expanded");
+if (isExpanding) {
+Analytics.trackInteraction('review_expansion', card.find('.review-author').text());
+}
+const navHeight = $("nav").outerHeight() || 0;
+const extraPadding = CONFIG.SETTINGS.SCROLL_OFFSET;
+if (isExpanding) {
+setTimeout(() => {
+$("html, body").animate({
+scrollTop: card.offset().top - navHeight - extraPadding
+}, 400);
+}, 100);
+} else {
+card.scrollTop(0);
+$("html, body").animate({
+scrollTop: card.offset().top - navHeight - extraPadding
+}, 200);
+}
+});
+}
+};;
+const DialogsFeature = {
+init: async function () {
+const masterData = await Data.loadMasterData();
+const dialogs = masterData.dialogs || [];
+if (dialogs.length === 0) return;
+dialogs.forEach((config, index) => {
+this.scheduleDialog(config, index);
+});
+},
+scheduleDialog: function (config, index) {
+const waitTime = (parseInt(config.timeInSeconds) || 5) * 1000;
+const storageKey = `dismissed_dialog_${btoa(config.title).substring(0, 10)}`;
+if (sessionStorage.getItem(storageKey)) return;
+setTimeout(() => {
+this.renderDialog(config, storageKey, index);
+}, waitTime);
+},
+renderDialog: function (config, storageKey, index) {
+const dialogId = `dialog-${index}`;
+if ($(`#${dialogId}`).length > 0) return;
+const dialogHtml = `
+<div class="luxury-dialog" id="${dialogId}">
+<button class="dialog-close" aria-label="Close">&times;</button>
+<div class="dialog-content">
+<span class="section-subtitle" style="font-size: 0.6rem; letter-spacing: 2px;">Style Plan(it) Alert</span>
+<h3>${config.title}</h3>
+<p>${config.description}</p>
+<a href="${config.action}" target="_blank" class="btn btn-primary-accent" style="width: 100%; text-align: center; margin-top: 10px;">${config.cta}</a>
+</div>
+</div>
+`;
+$('body').append(dialogHtml);
+const bottomOffset = 30 + (index * 20); // Slight stagger effect
+const leftOffset = 30 + (index * 20);
+$(`#${dialogId}`).css({
+'bottom': `${bottomOffset}px`,
+'left': `${leftOffset}px`,
+'z-index': 2000 + index
+});
+setTimeout(() => {
+$(`#${dialogId}`).addClass('visible');
+}, 100);
+$(`#${dialogId} .dialog-close`).on('click', () => {
+this.dismissDialog(dialogId, storageKey);
+});
+},
+dismissDialog: function (dialogId, storageKey) {
+const dialog = $(`#${dialogId}`);
+dialog.removeClass('visible');
+sessionStorage.setItem(storageKey, 'true');
+setTimeout(() => {
+dialog.remove();
+}, 600);
+}
+};
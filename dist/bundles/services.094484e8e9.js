@@ -0,0 +1,385 @@
+const ReviewsFeature = {
+init: async function (options = {}) {
+let reviews = await Data.fetch("reviews");
+if (reviews.length === 0) {
+$("#reviews-container").html('<p class="text-center">Reviews are currently being updated.</p>');
+return;
+}
+if (options.shuffle) {
+reviews = reviews.sort(() => 0.5 - Math.random());
+}
+if (options.limit) {
+reviews = reviews.slice(0, options.limit);
+}
+const container = $("#reviews-container");
+container.empty();
+reviews.forEach((review) => {
+container.append(`
+<div class="review-card">
+<span class="review-author">${review.author}</span>
+<p>"${review.text.replace(/"/g, "")}"</p>
+</div>
+`);
+});
+this.bindReviewToggle();
+this.setupScrollIndicator(reviews.length);
+},
+setupScrollIndicator: function(count) {
+const hintContainer = $(".scroll-hint");
+if (hintContainer.length === 0) return;
+hintContainer.empty();
+const dotCount = Math.min(count, 5);
+for (let i = 0; i < dotCount; i++) {
+hintContainer.append(`<div class="scroll-dot ${i === 0 ? 'active' : ''}"></div>`);
+}
+const grid = $("#reviews-container");
+const dots = $(".scroll-dot");
+let hasTrackedEnd = false;
+grid.on("scroll", () => {
+const scrollLeft = grid.scrollLeft();
+const maxScroll = grid[0].scrollWidth - grid.width();
+const progress = scrollLeft / maxScroll;
+const activeIndex = Math.min(Math.floor(progress * dotCount), dotCount - 1);
+dots.removeClass("active");
+dots.eq(activeIndex).addClass("active");
+if (progress > 0.95 && !hasTrackedEnd) {
+hasTrackedEnd = true;
+Analytics.trackScrollEnd('reviews_carousel');
+}
+});
+},
+bindReviewToggle: function() {
+$(document).off("click", ".review-card").on("click", ".review-card", function() {
+const card = $(this);
+const isExpanding = !card.hasClass("expanded");
+card.toggleClass("expanded");
+if (isExpanding) {
+Analytics.trackInteraction('review_expansion', card.find('.review-author').text());
+}
+const navHeight = $("nav").outerHeight() || 0;
+const extraPadding = CONFIG.SETTINGS.SCROLL_OFFSET;
+if (isExpanding) {
+setTimeout(() => {
+$("html, body").animate({
+scrollTop: card.offset().top - navHeight - extraPadding
+}, 400);
+}, 100);
+} else {
+card.scrollTop(0);
+$("html, body").animate({
+scrollTop: card.offset().top - navHeight - extraPadding
+}, 200);
+}
+});
+}
+};;
+const ServicesFeature = {
+options: {},
+allServices: [],
+categories: [],
+indexes: {},
+init: async function (options = {}) {
+console.log("🔍 [Services] Init started with options:", options);
+this.options = options;
+const [services, categories, indexes] = await Promise.all([
+Data.fetch("services"),
+Data.fetch("categories"),
+Data.indexes()
+]);
+this.allServices = services;
+this.categories = categories;
+this.indexes = indexes;
+console.log("🔍 [Services] Data fetched. Total services:", services.length, "Total categories:", categories.length);
+if (this.allServices.length === 0) {
+console.warn("⚠️ [Services] No services found in data.");
+$(".service-content").html('<p class="text-center section-padding">Service menu is temporarily unavailable. Please check back later.</p>');
+return;
+}
+const byCategory = indexes.services_by_category || {};
+let displayCategories = this.categories.filter(c => (byCategory[c.name] || []).length > 0);
+if (options.filter) {
+console.log("🔍 [Services] Applying filter:", options.filter, "Mode:", options.mode);
+if (options.mode === "exclude") {
+displayCategories = displayCategories.filter(c => c.name !== options.filter);
+} else {
+displayCategories = displayCategories.filter(c => c.name === options.filter);
+}
+}
+const activeCategoryNames = displayCategories.map(c => c.name);
+console.log("🔍 [Services] Active categories in view:", activeCategoryNames);
+const categorySelector = $("#services-category-selector");
+if (categorySelector.length > 0) {
+console.log("🔍 [Services] Rendering category selector...");
+this.renderCategorySelector(displayCategories);
+}
+console.log("🔍 [Services] Rendering grids...");
+this.renderServiceGrids(activeCategoryNames);
+this.bindEvents();
+const hash = window.location.hash.substring(1).toLowerCase();
+if (hash && activeCategoryNames.map(n => this.slugify(n)).includes(hash)) {
+console.log("🔍 [Services] Hash detected:", hash);
+const targetCategory = displayCategories.find(c => this.slugify(c.name) === hash);
+if (targetCategory) {
+this.switchCategory(targetCategory.name, false);
+}
+} else if (this.options.autoExpand || this.options.mode === "include") {
+console.log("🔍 [Services] Auto-display mode active.");
+if (activeCategoryNames.length > 0) {
+this.switchCategory(activeCategoryNames[0], true);
+}
+} else if (categorySelector.length > 0) {
+console.log("🔍 [Services] Landing reset state.");
+$("#services").hide();
+$(".category-card").removeClass("active");
+$("#services-category-selector").removeClass("active-selection");
+}
+if (this.options.autoExpand) {
+setTimeout(() => {
+$(".service-card").first().click();
+}, 100);
+}
+},
+renderCategorySelector: function (categories) {
+const container = $("#services-category-selector");
+if (container.length === 0) return;
+container.empty();
+categories.forEach(category => {
+const slug = this.slugify(category.name);
+container.append(`
+<div class="category-card" data-category="${category.name}" data-ga-category="${slug}">
+<div class="category-card-bg" style="background-image: url('${Utils.resolvedAsset(this.indexes, category.image_url).src}')"></div>
+<div class="category-card-content">
+<h3>${category.name}</h3>
+<p>${category.description}</p>
+</div>
+</div>
+`);
+});
+},
+renderServiceGrids: function (categoryNames) {
+const serviceContent = $(".service-content");
+if (serviceContent.length === 0) return;
+serviceContent.empty();
+categoryNames.forEach((category) => {
+const categoryId = this.slugify(category);
+const grid = $(
+`<div id="grid-${categoryId}" class="services-grid"></div>`,
+);
+(this.indexes.services_by_category[category] || [])
+.forEach((position) => {
+const service = this.allServices[position];
+const chipsHtml = this.renderServiceChips(this.indexes.service_inclusions[position]);
+const image = Utils.resolvedAsset(this.indexes, service.image_url);
+const serviceSlug = this.slugify(service.title);
+grid.append(`
+<div class="service-card" data-title="${service.title}" data-ga-service="${serviceSlug}" data-ga-category="${categoryId}">
+<div class="service-card-image">
+<img src="${image.src}" ${image.attrs} alt="${service.title}">
+</div>
+<div class="service-card-content">
+<h3>${service.title}</h3>
+<p class="short-desc">${service.short_description}</p>
+<div class="service-chips">${chipsHtml}</div>
+</div>
+</div>
+`);
+});
+serviceContent.append(grid);
+});
+},
+renderServiceChips: function (items) {
+if (!items || items.length === 0) return "";
+return items
+.map((item) => {
+const icon = this.getServiceIcon(item);
+return `<i class="fas ${icon}" data-title="${item}"></i>`;
+})
+.join("");
+},
+getServiceIcon: function (item) {
+const map = {
+"Color Analysis": "fa-palette",
+"Personal Style Analysis": "fa-user-tie",
+"Body Shape Analysis": "fa-bezier-curve",
+"Wardrobing": "fa-tags",
+"Lifestyle Analysis": "fa-mug-hot",
+"Virtual Shopping": "fa-laptop",
+"Lookbook Curation": "fa-book-open",
+"Shopping List": "fa-list-ul",
+"In-Person Shopping": "fa-shopping-bag",
+"Event Styling": "fa-magic",
+"Moodboard curation": "fa-images",
+"Luxury charge": "fa-gem",
+};
+return map[item] || "fa-check-circle";
+},
+switchCategory: function(categoryName, noScroll = false) {
+const slug = this.slugify(categoryName);
+Analytics.trackCategorySwitch(categoryName, slug);
+if ($("#services").is(":hidden")) {
+$("#services").fadeIn(400);
+}
+$(".services-grid").removeClass("active");
+$(`#grid-${slug}`).addClass("active");
+$("#active-category-title").text(categoryName);
+$(".category-card").removeClass("active");
+$(`.category-card[data-category="${categoryName}"]`).addClass("active");
+$("#services-category-selector").addClass("active-selection");
+$("#service-details-container").hide().empty();
+$(".service-card").removeClass("active");
+if (!noScroll) {
+const navHeight = $("nav").outerHeight() || 0;
+$("html, body").animate({
+scrollTop: $("#services").offset().top - navHeight
+}, 600);
+}
+},
+showServiceDetails: function(serviceTitle) {
+const position = this.indexes.service_by_title[serviceTitle];
+const service = this.allServices[position];
+if (!service) return;
+const serviceSlug = this.slugify(service.title);
+const categorySlug = this.slugify(service.category);
+Analytics.trackServiceView(service.title, serviceSlug, service.category);
+const detailsContainer = $("#service-details-container");
+const chipsHtml = this.renderServiceChips(this.indexes.service_inclusions[position]);
+const config = this.indexes.config || {};
+const inclusionsTitle = config.SERVICE_INCLUSIONS_TITLE || "What's Included?";
+const inquireText = config.STEP_2_BUTTON_TEXT || "Inquire Now";
+const closeBtnText = config.EXPERIENCE_CLOSE_BTN || "Close & Return to List";
+detailsContainer.html(`
+<div class="active-service-details">
+<div class="details-grid">
+<div class="details-brand-pillar">
+<span class="brand-mark">SP</span>
+</div>
+<div class="details-text">
+<span class="section-subtitle">${service.category}</span>
+<h3>${service.title}</h3>
+<p class="long-desc">${service.long_description}</p>
+<span class="inclusions-title">${inclusionsTitle}</span>
+<div class="service-chips">${chipsHtml}</div>
+<div class="details-footer">
+<div class="cta-row">
+<a href="${config.STEP_2_BUTTON_HREF || 'https://cal.com/styleplanit/15min'}"
+target="_blank"
+class="btn btn-primary-accent btn-ga-inquiry"
+data-ga-service="${serviceSlug}"
+data-ga-category="${categorySlug}">${inquireText}</a>
+</div>
+<button class="btn-secondary btn-close-details">${closeBtnText}</button>
+</div>
+</div>
+</div>
+</div>
+`).fadeIn(400);
+const navHeight = $("nav").outerHeight() || 0;
+$("html, body").animate({
+scrollTop: detailsContainer.offset().top - navHeight - 40
+}, 600);
+},
+bindEvents: function () {
+const self = this;
+$(document).on("click", "#services-category-selector .category-card", function() {
+const category = $(this).data("category");
+self.switchCategory(category);
+});
+$(document).on("click", "#btn-return-to-categories", function() {
+Analytics.trackInteraction('navigation', 'return_to_categories');
+const navHeight = $("nav").outerHeight() || 0;
+$("html, body").animate({
+scrollTop: $("#experience-intro").offset().top - navHeight
+}, 600, function() {
+$("#services").fadeOut(300);
+$(".category-card").removeClass("active");
+$("#services-category-selector").removeClass("active-selection");
+});
+});
+$(document).on("click", ".service-card", function(e) {
+if ($(e.target).closest('.service-chips').length > 0) return;
+$(".service-card").removeClass("active");
+$(this).addClass("active");
+const title = $(this).data("title");
+self.showServiceDetails(title);
+});
+$(document).on("click", ".btn-ga-inquiry", function() {
+const service = $(this).data("ga-service");
+const category = $(this).data("ga-category");
+Analytics.trackLead('inquiry_button', 'service_details', {
+service_id: service,
+category_id: category
+});
+});
+$(document).on("click", ".btn-close-details", function() {
+$("#service-details-container").fadeOut(300, function() {
+$(this).empty();
+$(".service-card").removeClass("active");
+const navHeight = $("nav").outerHeight() || 0;
+const target = $(".services-grid.active");
+if (target.length > 0) {
+$("html, body").animate({
+scrollTop: target.offset().top - navHeight - 100
+}, 500);
+}
+});
+});
+},
+slugify: function(text) {
+return text.trim().replace(/\s+/g, "-").toLowerCase();
+}
+};;
+const DialogsFeature = {
+init: async function () {
+const masterData = await Data.loadMasterData();
+const dialogs = masterData.dialogs || [];
+if (dialogs.length === 0) return;
+dialogs.forEach((config, index) => {
+this.scheduleDialog(config, index);
+});
+},
+scheduleDialog: function (config, index) {
+const waitTime = (parseInt(config.timeInSeconds) || 5) * 1000;
+const storageKey = `dismissed_dialog_${btoa(config.title).substring(0, 10)}`;
+if (sessionStorage.getItem(storageKey)) return;
+setTimeout(() => {
+this.renderDialog(config, storageKey, index);
+}, waitTime);
+},
+renderDialog: function (config, storageKey, index) {
+const dialogId = `dialog-${index}`;
+if ($(`#${dialogId}`).length > 0) return;
+const dialogHtml = `
+<div class="luxury-dialog" id="${dialogId}">
+<button class="dialog-close" aria-label="Close">&times;</button>
+<div class="dialog-content">
+<span class="section-subtitle" style="font-size: 0.6rem; letter-spacing: 2px;">Style Plan(it) Alert</span>
+<h3>${config.title}</h3>
+<p>${config.description}</p>
+<a href="${config.action}" target="_blank" class="btn btn-primary-accent" style="width: 100%; text-align: center; margin-top: 10px;">${config.cta}</a>
+</div>
+</div>
+`;
+$('body').append(dialogHtml);
+const bottomOffset = 30 + (index * 20); // Slight stagger effect
+const leftOffset = 30 + (index * 20);
+$(`#${dialogId}`).css({
+'bottom': `${bottomOffset}px`,
+'left': `${leftOffset}px`,
+'z-index': 2000 + index
+});
+setTimeout(() => {
+$(`#${dialogId}`).addClass('visible');
+}, 100);
+$(`#${dialogId} .dialog-close`).on('click', () => {
+this.dismissDialog(dialogId, storageKey);
+});
+},
+dismissDialog: function (dialogId, storageKey) {
+const dialog = $(`#${dialogId}`);
+dialog.removeClass('visible');
+sessionStorage.setItem(storageKey, 'true');
+setTimeout(() => {
+dialog.remove();
+}, 600);
+}
+};
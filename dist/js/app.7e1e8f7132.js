@@ -0,0 +1,63 @@
+const App = {
+init: async function (config) {
+this.initNavigation();
+await this.initGlobalFeatures(config);
+},
+initNavigation: function () {
+$(document).on("click", ".menu-toggle", function () {
+var expanded = $(this).attr("aria-expanded") === "true";
+$(this).attr("aria-expanded", String(!expanded));
+$(".nav-links").toggleClass("active");
+});
+$(document).on("click", ".nav-links a", function () {
+$(".nav-links").removeClass("active");
+$(".menu-toggle").attr("aria-expanded", "false");
+});
+},
+initGlobalFeatures: async function (config) {
+if (typeof HeroFeature !== 'undefined') {
+await HeroFeature.init();
+}
+if (typeof LogosFeature !== 'undefined') {
+LogosFeature.init();
+}
+if (typeof HomeServicesFeature !== 'undefined') {
+HomeServicesFeature.init();
+}
+if (typeof PortfolioFeature !== 'undefined') {
+PortfolioFeature.init();
+}
+if (typeof ReviewsFeature !== 'undefined') {
+const isReviewsPage = window.location.pathname.includes('reviews');
+if (isReviewsPage) {
+ReviewsFeature.init();
+} else {
+ReviewsFeature.init({ shuffle: true, limit: 3 });
+}
+}
+if (typeof TeamFeature !== 'undefined') {
+TeamFeature.init();
+}
+if (typeof ServicesFeature !== 'undefined' && ($("#services").length > 0 || $("#experience-intro").length > 0)) {
+ServicesFeature.init({ filter: "Icon Service", mode: "exclude" });
+}
+if (typeof IconServiceFeature !== 'undefined') {
+IconServiceFeature.init();
+}
+if (typeof LearnFeature !== 'undefined' && window.location.pathname.includes('learn')) {
+LearnFeature.init();
+}
+if (typeof SubscribeFeature !== 'undefined') {
+SubscribeFeature.init(config);
+}
+if (typeof DialogsFeature !== 'undefined') {
+DialogsFeature.init();
+}
+$(document).on("click", ".btn-ga-whatsapp", function() {
+Analytics.trackLead('whatsapp_floating', 'social_inquiry');
+});
+$(document).on("click", ".btn-ga-book", function() {
+Analytics.trackLead('schedule_consultation_floating', 'appointment_booking');
+});
+}
+};
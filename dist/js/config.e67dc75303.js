@@ -0,0 +1,7 @@
+const CONFIG = {
+DATA_PATH: '/configs/site-data.json',
+SHARDS_PATH: '/configs/shards/',
+SETTINGS: {
+SCROLL_OFFSET: 40 // Aesthetic padding for smooth scroll
+}
+};
@@ -0,0 +1,42 @@
+const Analytics = {
+trackEvent: function(eventName, params = {}) {
+if (window.gtag) {
+gtag('event', eventName, params);
+} else {
+console.debug(`[Analytics] gtag not found. Event "${eventName}" would have been sent:`, params);
+}
+},
+trackCategorySwitch: function(categoryName, slug) {
+this.trackEvent('select_content', {
+content_type: 'service_category',
+item_id: slug,
+category_name: categoryName
+});
+},
+trackServiceView: function(serviceTitle, serviceSlug, categoryName) {
+this.trackEvent('view_item', {
+item_id: serviceSlug,
+item_name: serviceTitle,
+item_category: categoryName
+});
+},
+trackLead: function(method, type, extraParams = {}) {
+this.trackEvent('generate_lead', {
+method: method,
+content_type: type,
+...extraParams
+});
+},
+trackInteraction: function(type, id, extraParams = {}) {
+this.trackEvent('select_content', {
+content_type: type,
+item_id: id,
+...extraParams
+});
+},
+trackScrollEnd: function(carouselName) {
+this.trackEvent('scroll_to_end', {
+content_type: carouselName
+});
+}
+};
@@ -0,0 +1,41 @@
+const HeroFeature = {
+init: async function () {
+const heroContainer = $(".hero-bg-container");
+if (heroContainer.length === 0) return;
+const masterData = await Data.loadMasterData();
+if (!masterData || !masterData.assets_manifest) {
+console.error("❌ [Hero] Failed to load assets_manifest");
+return;
+}
+const images = masterData.assets_manifest["home-page/hero-images"] || [];
+if (images.length === 0) return;
+heroContainer.empty();
+images.forEach((img, index) => {
+heroContainer.append(`
+<div class="hero-bg ${index === 0 ? 'active' : ''}"
+style="background-image: url('${Utils.assetInfo(masterData, 'home-page/hero-images', img).src}');
+opacity: ${index === 0 ? 1 : 0};">
+</div>
+`);
+});
+const heroBgs = $(".hero-bg");
+const isMobile = window.innerWidth <= 768;
+if (isMobile) {
+if (heroBgs.length <= 1) return;
+let current = 0;
+setInterval(() => {
+heroBgs.eq(current).removeClass("active").css("opacity", 0);
+current = (current + 1) % heroBgs.length;
+heroBgs.eq(current).addClass("active").css("opacity", 1);
+}, 4000);
+} else {
+heroBgs.css({
+opacity: 1,
+transition: "none",
+}).addClass("active");
+}
+$(document).on("click", ".btn-ga-hero", function() {
+Analytics.trackInteraction('hero_cta', 'hero_main_button');
+});
+}
+};
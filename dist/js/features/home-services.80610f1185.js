@@ -0,0 +1,28 @@
+const HomeServicesFeature = {
+init: async function() {
+const container = $("#home-categories-container");
+if (container.length === 0) return;
+const [categories, indexes] = await Promise.all([Data.fetch("categories"), Data.indexes()]);
+const homeCategories = (indexes.home_categories || []).map(i => categories[i]);
+this.renderCategories(container, homeCategories, indexes);
+},
+renderCategories: function(container, categories, indexes) {
+container.empty();
+categories.forEach(category => {
+const slug = category.name.trim().replace(/\s+/g, "-").toLowerCase();
+container.append(`
+<a href="${category.href}" class="category-card" data-ga-category="${slug}">
+<div class="category-card-bg" style="background-image: url('${Utils.resolvedAsset(indexes, category.image_url).src}')"></div>
+<div class="category-card-content">
+<h3>${category.name}</h3>
+<p>${category.description}</p>
+</div>
+</a>
+`);
+});
+$(document).on("click", "#home-categories-container .category-card", function() {
+const slug = $(this).data("ga-category");
+Analytics.trackInteraction('home_category', slug);
+});
+}
+};
@@ -0,0 +1,23 @@
+const LogosFeature = {
+init: async function () {
+console.log("Initializing Logos feature...");
+const container = $("#logos-container");
+if (container.length === 0) return;
+const masterData = await Data.loadMasterData();
+if (!masterData || !masterData.assets_manifest) {
+console.error("❌ [Logos] Failed to load assets_manifest");
+return;
+}
+const logos = masterData.assets_manifest["home-page/logos"] || [];
+if (logos.length === 0) return;
+container.empty();
+logos.forEach(logo => {
+const asset = Utils.assetInfo(masterData, 'home-page/logos', logo);
+container.append(`
+<div class="brand-logo-item">
+${Utils.picture(asset, logo)}
+</div>
+`);
+});
+}
+};
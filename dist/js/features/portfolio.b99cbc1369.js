@@ -0,0 +1,66 @@
+const PortfolioFeature = {
+init: async function() {
+const container = $("#portfolio-carousel");
+if (container.length === 0) return;
+const masterData = await Data.loadMasterData();
+if (!masterData || !masterData.assets_manifest) {
+console.error("❌ [Portfolio] Failed to load assets_manifest");
+return;
+}
+const assets = masterData.assets_manifest || {};
+const images = assets['portfolio'] || [];
+if (images.length === 0) {
+console.warn("Portfolio manifest empty. Run sync_engine.py to update.");
+return;
+}
+this.renderPortfolio(container, images, masterData);
+},
+renderPortfolio: function(container, images, masterData) {
+container.empty();
+const processed = new Set();
+const pairs = [];
+const singles = [];
+const usedInPair = new Set();
+images.forEach(img => {
+const name = img.toLowerCase();
+if (name.includes('_before')) {
+const baseName = name.split('_before')[0];
+const afterImage = images.find(i => i.toLowerCase().startsWith(baseName + '_after'));
+if (afterImage) {
+pairs.push({ before: img, after: afterImage });
+usedInPair.add(img);
+usedInPair.add(afterImage);
+}
+}
+});
+images.forEach(img => {
+if (!usedInPair.has(img)) {
+singles.push(img);
+}
+});
+pairs.forEach(pair => {
+const before = Utils.assetInfo(masterData, 'portfolio', pair.before, '50vw');
+const after = Utils.assetInfo(masterData, 'portfolio', pair.after, '50vw');
+container.append(`
+<div class="portfolio-item transformation-pair">
+<div class="transformation-side before">
+${Utils.picture(before, 'Before')}
+<span class="label">Before</span>
+</div>
+<div class="transformation-side after">
+${Utils.picture(after, 'After')}
+<span class="label">After</span>
+</div>
+</div>
+`);
+});
+singles.forEach(img => {
+const asset = Utils.assetInfo(masterData, 'portfolio', img);
+container.append(`
+<div class="portfolio-item">
+${Utils.picture(asset, 'Portfolio Work')}
+</div>
+`);
+});
+}
+};
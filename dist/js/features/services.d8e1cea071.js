@@ -0,0 +1,255 @@
+const ServicesFeature = {
+options: {},
+allServices: [],
+categories: [],
+indexes: {},
+init: async function (options = {}) {
+console.log("🔍 [Services] Init started with options:", options);
+this.options = options;
+const [services, categories, indexes] = await Promise.all([
+Data.fetch("services"),
+Data.fetch("categories"),
+Data.indexes()
+]);
+this.allServices = services;
+this.categories = categories;
+this.indexes = indexes;
+console.log("🔍 [Services] Data fetched. Total services:", services.length, "Total categories:", categories.length);
+if (this.allServices.length === 0) {
+console.warn("⚠️ [Services] No services found in data.");
+$(".service-content").html('<p class="text-center section-padding">Service menu is temporarily unavailable. Please check back later.</p>');
+return;
+}
+const byCategory = indexes.services_by_category || {};
+let displayCategories = this.categories.filter(c => (byCategory[c.name] || []).length > 0);
+if (options.filter) {
+console.log("🔍 [Services] Applying filter:", options.filter, "Mode:", options.mode);
+if (options.mode === "exclude") {
+displayCategories = displayCategories.filter(c => c.name !== options.filter);
+} else {
+displayCategories = displayCategories.filter(c => c.name === options.filter);
+}
+}
+const activeCategoryNames = displayCategories.map(c => c.name);
+console.log("🔍 [Services] Active categories in view:", activeCategoryNames);
+const categorySelector = $("#services-category-selector");
+if (categorySelector.length > 0) {
+console.log("🔍 [Services] Rendering category selector...");
+this.renderCategorySelector(displayCategories);
+}
+console.log("🔍 [Services] Rendering grids...");
+this.renderServiceGrids(activeCategoryNames);
+this.bindEvents();
+const hash = window.location.hash.substring(1).toLowerCase();
+if (hash && activeCategoryNames.map(n => this.slugify(n)).includes(hash)) {
+console.log("🔍 [Services] Hash detected:", hash);
+const targetCategory = displayCategories.find(c => this.slugify(c.name) === hash);
+if (targetCategory) {
+this.switchCategory(targetCategory.name, false);
+}
+} else if (this.options.autoExpand || this.options.mode === "include") {
+console.log("🔍 [Services] Auto-display mode active.");
+if (activeCategoryNames.length > 0) {
+this.switchCategory(activeCategoryNames[0], true);
+}
+} else if (categorySelector.length > 0) {
+console.log("🔍 [Services] Landing reset state.");
+$("#services").hide();
+$(".category-card").removeClass("active");
+$("#services-category-selector").removeClass("active-selection");
+}
+if (this.options.autoExpand) {
+setTimeout(() => {
+$(".service-card").first().click();
+}, 100);
+}
+},
+renderCategorySelector: function (categories) {
+const container = $("#services-category-selector");
+if (container.length === 0) return;
+container.empty();
+categories.forEach(category => {
+const slug = this.slugify(category.name);
+container.append(`
+<div class="category-card" data-category="${category.name}" data-ga-category="${slug}">
+<div class="category-card-bg" style="background-image: url('${Utils.resolvedAsset(this.indexes, category.image_url).src}')"></div>
+<div class="category-card-content">
+<h3>${category.name}</h3>
+<p>${category.description}</p>
+</div>
+</div>
+`);
+});
+},
+renderServiceGrids: function (categoryNames) {
+const serviceContent = $(".service-content");
+if (serviceContent.length === 0) return;
+serviceContent.empty();
+categoryNames.forEach((category) => {
+const categoryId = this.slugify(category);
+const grid = $(
+`<div id="grid-${categoryId}" class="services-grid"></div>`,
+);
+(this.indexes.services_by_category[category] || [])
+.forEach((position) => {
+const service = this.allServices[position];
+const chipsHtml = this.renderServiceChips(this.indexes.service_inclusions[position]);
+const image = Utils.resolvedAsset(this.indexes, service.image_url);
+const serviceSlug = this.slugify(service.title);
+grid.append(`
+<div class="service-card" data-title="${service.title}" data-ga-service="${serviceSlug}" data-ga-category="${categoryId}">
+<div class="service-card-image">
+<img src="${image.src}" ${image.attrs} alt="${service.title}">
+</div>
+<div class="service-card-content">
+<h3>${service.title}</h3>
+<p class="short-desc">${service.short_description}</p>
+<div class="service-chips">${chipsHtml}</div>
+</div>
+</div>
+`);
+});
+serviceContent.append(grid);
+});
+},
+renderServiceChips: function (items) {
+if (!items || items.length === 0) return "";
+return items
+.map((item) => {
+const icon = this.getServiceIcon(item);
+return `<i class="fas ${icon}" data-title="${item}"></i>`;
+})
+.join("");
+},
+getServiceIcon: function (item) {
+const map = {
+"Color Analysis": "fa-palette",
+"Personal Style Analysis": "fa-user-tie",
+"Body Shape Analysis": "fa-bezier-curve",
+"Wardrobing": "fa-tags",
+"Lifestyle Analysis": "fa-mug-hot",
+"Virtual Shopping": "fa-laptop",
+"Lookbook Curation": "fa-book-open",
+"Shopping List": "fa-list-ul",
+"In-Person Shopping": "fa-shopping-bag",
+"Event Styling": "fa-magic",
+"Moodboard curation": "fa-images",
+"Luxury charge": "fa-gem",
+};
+return map[item] || "fa-check-circle";
+},
+switchCategory: function(categoryName, noScroll = false) {
+const slug = this.slugify(categoryName);
+Analytics.trackCategorySwitch(categoryName, slug);
+if ($("#services").is(":hidden")) {
+$("#services").fadeIn(400);
+}
+$(".services-grid").removeClass("active");
+$(`#grid-${slug}`).addClass("active");
+$("#active-category-title").text(categoryName);
+$(".category-card").removeClass("active");
+$(`.category-card[data-category="${categoryName}"]`).addClass("active");
+$("#services-category-selector").addClass("active-selection");
+$("#service-details-container").hide().empty();
+$(".service-card").removeClass("active");
+if (!noScroll) {
+const navHeight = $("nav").outerHeight() || 0;
+$("html, body").animate({
+scrollTop: $("#services").offset().top - navHeight
+}, 600);
+}
+},
+showServiceDetails: function(serviceTitle) {
+const position = this.indexes.service_by_title[serviceTitle];
+const service = this.allServices[position];
+if (!service) return;
+const serviceSlug = this.slugify(service.title);
+const categorySlug = this.slugify(service.category);
+Analytics.trackServiceView(service.title, serviceSlug, service.category);
+const detailsContainer = $("#service-details-container");
+const chipsHtml = this.renderServiceChips(this.indexes.service_inclusions[position]);
+const config = this.indexes.config || {};
+const inclusionsTitle = config.SERVICE_INCLUSIONS_TITLE || "What's Included?";
+const inquireText = config.STEP_2_BUTTON_TEXT || "Inquire Now";
+const closeBtnText = config.EXPERIENCE_CLOSE_BTN || "Close & Return to List";
+detailsContainer.html(`
+<div class="active-service-details">
+<div class="details-grid">
+<div class="details-brand-pillar">
+<span class="brand-mark">SP</span>
+</div>
+<div class="details-text">
+<span class="section-subtitle">${service.category}</span>
+<h3>${service.title}</h3>
+<p class="long-desc">${service.long_description}</p>
+<span class="inclusions-title">${inclusionsTitle}</span>
+<div class="service-chips">${chipsHtml}</div>
+<div class="details-footer">
+<div class="cta-row">
+<a href="${config.STEP_2_BUTTON_HREF || 'https://cal.com/styleplanit/15min'}"
+target="_blank"
+class="btn btn-primary-accent btn-ga-inquiry"
+data-ga-service="${serviceSlug}"
+data-ga-category="${categorySlug}">${inquireText}</a>
+</div>
+<button class="btn-secondary btn-close-details">${closeBtnText}</button>
+</div>
+</div>
+</div>
+</div>
+`).fadeIn(400);
+const navHeight = $("nav").outerHeight() || 0;
+$("html, body").animate({
+scrollTop: detailsContainer.offset().top - navHeight - 40
+}, 600);
+},
+bindEvents: function () {
+const self = this;
+$(document).on("click", "#services-category-selector .category-card", function() {
+const category = $(this).data("category");
+self.switchCategory(category);
+});
+$(document).on("click", "#btn-return-to-categories", function() {
+Analytics.trackInteraction('navigation', 'return_to_categories');
+const navHeight = $("nav").outerHeight() || 0;
+$("html, body").animate({
+scrollTop: $("#experience-intro").offset().top - navHeight
+}, 600, function() {
+$("#services").fadeOut(300);
+$(".category-card").removeClass("active");
+$("#services-category-selector").removeClass("active-selection");
+});
+});
+$(document).on("click", ".service-card", function(e) {
+if ($(e.target).closest('.service-chips').length > 0) return;
+$(".service-card").removeClass("active");
+$(this).addClass("active");
+const title = $(this).data("title");
+self.showServiceDetails(title);
+});
+$(document).on("click", ".btn-ga-inquiry", function() {
+const service = $(this).data("ga-service");
+const category = $(this).data("ga-category");
+Analytics.trackLead('inquiry_button', 'service_details', {
+service_id: service,
+category_id: category
+});
+});
+$(document).on("click", ".btn-close-details", function() {
+$("#service-details-container").fadeOut(300, function() {
+$(this).empty();
+$(".service-card").removeClass("active");
+const navHeight = $("nav").outerHeight() || 0;
+const target = $(".services-grid.active");
+if (target.length > 0) {
+$("html, body").animate({
+scrollTop: target.offset().top - navHeight - 100
+}, 500);
+}
+});
+});
+},
+slugify: function(text) {
+return text.trim().replace(/\s+/g, "-").toLowerCase();
+}
+};
@@ -0,0 +1,31 @@
+const TeamFeature = {
+init: async function () {
+const container = $("#team-container");
+if (container.length === 0) return;
+const masterData = await Data.loadMasterData();
+const team = masterData.team || [];
+const teamImages = (masterData.indexes && masterData.indexes.team_images) || [];
+if (!team || team.length === 0) {
+container.html('<p class="text-center">Team details coming soon.</p>');
+return;
+}
+container.empty();
+team.forEach((person, index) => {
+const isEven = index % 2 === 0;
+const alignmentClass = isEven ? "image-left" : "image-right";
+const image = Utils.assetInfo(masterData, 'meet-team-page', teamImages[index]);
+container.append(`
+<div class="profile-card ${alignmentClass}">
+<div class="profile-image">
+${Utils.picture(image, person.name)}
+</div>
+<div class="profile-text">
+<h3>${person.name}</h3>
+<span class="role">${person.role}</span>
+<p class="bio">${person.bio}</p>
+</div>
+</div>
+`);
+});
+}
+};
@@ -0,0 +1,326 @@
+const Utils = {
+parseCSV: function(data) {
+const lines = data.split('\n').filter(line => line.trim() !== '');
+if (lines.length < 1) return [];
+const parseCSVRow = (line) => {
+const result = [];
+let currentField = '';
+let inQuotes = false;
+for (let i = 0; i < line.length; i++) {
+const char = line[i];
+if (char === '"') {
+if (inQuotes && i + 1 < line.length && line[i + 1] === '"') {
+currentField += '"';
+i++;
+} else {
+inQuotes = !inQuotes;
+}
+} else if (char === ',' && !inQuotes) {
+result.push(currentField.trim());
+currentField = '';
+} else {
+currentField += char;
+}
+}
+result.push(currentField.trim());
+return result;
+};
+const header = parseCSVRow(lines[0]);
+const results = [];
+for (let i = 1; i < lines.length; i++) {
+const values = parseCSVRow(lines[i]);
+const row = {};
+for (let j = 0; j < header.length; j++) {
+row[header[j]] = values[j] !== undefined ? values[j] : '';
+}
+results.push(row);
+}
+return results;
+},
+applyConfig: function(config) {
+if (!config || Object.keys(config).length === 0) return;
+document.querySelectorAll('[text-config-key]').forEach(element => {
+const key = element.getAttribute('text-config-key');
+if (config[key] !== undefined) {
+if (key === 'LOGO_TEXT') {
+element.innerHTML = config[key];
+} else {
+element.textContent = config[key];
+}
+}
+});
+document.querySelectorAll('[href-config-key]').forEach(element => {
+const key = element.getAttribute('href-config-key');
+if (config[key] !== undefined) {
+let value = config[key];
+if (key === 'WHATSAPP_NUMBER' && !value.startsWith('http')) {
+value = `https://wa.me/${value.replace(/\D/g, '')}`;
+}
+element.href = value;
+}
+});
+document.querySelectorAll('[placeholder-config-key]').forEach(element => {
+const key = element.getAttribute('placeholder-config-key');
+if (config[key] !== undefined) element.placeholder = config[key];
+});
+document.querySelectorAll('[src-config-key]').forEach(element => {
+const key = element.getAttribute('src-config-key');
+if (config[key] !== undefined) element.src = config[key];
+});
+document.querySelectorAll('[property-config-key]').forEach(element => {
+const key = element.getAttribute('property-config-key');
+if (config[key] !== undefined) element.setAttribute('content', config[key]);
+});
+document.querySelectorAll('[style-bg-config-key]').forEach(element => {
+const key = element.getAttribute('style-bg-config-key');
+if (config[key] !== undefined) {
+element.style.backgroundImage = 'url("' + config[key] + '")';
+}
+});
+if (config['PAGE_DESCRIPTION']) {
+this.updateMeta('description', config['PAGE_DESCRIPTION']);
+this.updateMeta('og:description', config['PAGE_DESCRIPTION'], 'property');
+}
+if (config['PAGE_TITLE']) {
+this.updateMeta('og:title', config['PAGE_TITLE'], 'property');
+}
+if (config['OG_IMAGE']) {
+this.updateMeta('og:image', config['OG_IMAGE'], 'property');
+}
+},
+getConfig: async function() {
+const config = (await Data.indexes()).config || {};
+this.applyConfig(config);
+return config;
+},
+assetInfo: function(masterData, folder, file, sizes = '100vw') {
+const path = folder === 'root' ? file : `${folder}/${file}`;
+const meta = (masterData && masterData.assets_meta) ? masterData.assets_meta[path] : null;
+const src = `assets/images/${path}`;
+if (!meta) return { src: src, attrs: '', sources: '' };
+const versionedSrc = `${src}?v=${meta.hash}`;
+let attrs = (meta.width && meta.height) ? `width="${meta.width}" height="${meta.height}"` : '';
+const srcset = (type) => (meta.variants || []).filter(v => v.type === type)
+.map(v => `/${v.src} ${v.width}w`).concat(`${versionedSrc} ${meta.width}w`);
+const webp = srcset('image/webp');
+if (webp.length > 1) {
+attrs += ` srcset="${webp.join(', ')}" sizes="${sizes}"`;
+}
+const avif = srcset('image/avif');
+const sources = avif.length > 1 ? `<source type="image/avif" srcset="${avif.join(', ')}" sizes="${sizes}">` : '';
+return { src: versionedSrc, attrs: attrs, sources: sources };
+},
+picture: function(asset, alt) {
+const img = `<img src="${asset.src}" ${asset.attrs} alt="${alt}">`;
+return asset.sources ? `<picture>${asset.sources}${img}</picture>` : img;
+},
+resolvedAsset: function(indexes, ref) {
+const asset = (indexes && indexes.assets) ? indexes.assets[ref] : null;
+if (!asset) return { src: ref, attrs: '' };
+const attrs = (asset.width && asset.height) ? `width="${asset.width}" height="${asset.height}"` : '';
+return { src: asset.src, attrs: attrs };
+},
+updateMeta: function(name, content, attr = 'name') {
+if (!document.head) return; // Ensure head is available
+let el = document.querySelector(`meta[${attr}="${name}"]`);
+if (!el) {
+el = document.createElement('meta');
+el.setAttribute(attr, name);
+document.head.appendChild(el);
+}
+el.setAttribute('content', content);
+}
+};
+const Data = {
+masterData: null,
+currentPage: function() {
+return window.location.pathname.replace(/^\/+|\/+$/g, '').replace(/\.html$/, '') || 'index';
+},
+cacheKey: function() {
+return `site_data_cache:${this.currentPage()}`;
+},
+cacheTimestampKey: function() {
+return `cache_timestamp:${this.currentPage()}`;
+},
+loadMasterData: async function() {
+if (this.masterData) return this.masterData;
+try {
+const cached = localStorage.getItem(this.cacheKey());
+const cacheTime = localStorage.getItem(this.cacheTimestampKey());
+const now = new Date().getTime();
+const dayInMs = 24 * 60 * 60 * 1000;
+const cachedData = cached ? JSON.parse(cached) : null;
+if (cachedData && cachedData.indexes && cacheTime && (now - cacheTime < dayInMs)) {
+this.masterData = cachedData;
+this.refreshMasterData();
+return this.masterData;
+}
+return await this.refreshMasterData();
+} catch (e) {
+console.error("Critical error loading site data", e);
+return null;
+}
+},
+loadShards: async function() {
+const response = await fetch(`${CONFIG.SHARDS_PATH}index.json?v=${new Date().getTime()}`);
+if (!response.ok) throw new Error(`Status ${response.status}`);
+const index = await response.json();
+const sections = index.pages[this.currentPage()] || Object.keys(index.sections);
+const entries = await Promise.all(sections.map(async (section) => {
+const shard = await fetch(`${CONFIG.SHARDS_PATH}${index.sections[section]}`);
+if (!shard.ok) throw new Error(`Shard ${section}: status ${shard.status}`);
+return [section, await shard.json()];
+}));
+return Object.fromEntries(entries);
+},
+refreshMasterData: async function() {
+try {
+let freshData = null;
+try {
+freshData = await this.loadShards();
+} catch (e) {
+console.warn("Site data shards unavailable, loading full site-data.json", e);
+const response = await fetch(`${CONFIG.DATA_PATH}?v=${new Date().getTime()}`);
+if (response.ok) freshData = await response.json();
+}
+if (freshData) {
+const now = new Date().getTime();
+let newVersion = "0.0.0";
+if (freshData.version && freshData.version.length > 0) {
+newVersion = freshData.version[0].value || freshData.version[0].version;
+}
+const cachedVersion = localStorage.getItem('app_version');
+if (cachedVersion && cachedVersion !== newVersion) {
+console.log(`New version detected: ${newVersion}. Purging cache and reloading...`);
+if (navigator.serviceWorker && navigator.serviceWorker.controller) {
+const registration = await navigator.serviceWorker.getRegistration();
+if (registration) await registration.update().catch(() => null);
+}
+Object.keys(localStorage)
+.filter(key => key.startsWith('site_data_cache') || key.startsWith('cache_timestamp'))
+.forEach(key => localStorage.removeItem(key));
+localStorage.setItem('app_version', newVersion);
+window.location.reload();
+return freshData;
+}
+localStorage.setItem('app_version', newVersion);
+localStorage.setItem(this.cacheKey(), JSON.stringify(freshData));
+localStorage.setItem(this.cacheTimestampKey(), now);
+this.masterData = freshData;
+return freshData;
+}
+} catch (e) {
+console.warn("Failed to refresh site data from server", e);
+}
+return this.masterData;
+},
+fetch: async function(type) {
+const master = await this.loadMasterData();
+return (master && master[type]) ? master[type] : [];
+},
+indexes: async function() {
+const master = await this.loadMasterData();
+return (master && master.indexes) ? master.indexes : {};
+},
+searchIndex: function() {
+if (!this.searchIndexPromise) {
+this.searchIndexPromise = (async () => {
+const response = await fetch(`${CONFIG.SHARDS_PATH}index.json?v=${new Date().getTime()}`);
+if (!response.ok) throw new Error(`Status ${response.status}`);
+const name = ((await response.json()).lazy || {}).search;
+if (!name) throw new Error("No search shard in the index");
+const shard = await fetch(`${CONFIG.SHARDS_PATH}${name}`);
+if (!shard.ok) throw new Error(`Shard search: status ${shard.status}`);
+return await shard.json();
+})().catch(e => {
+console.warn("Search index unavailable", e);
+this.searchIndexPromise = null;
+return null;
+});
+}
+return this.searchIndexPromise;
+},
+checkVersion: async function() {
+await this.loadMasterData();
+}
+};
+const Search = {
+STOPWORDS: new Set(("a an and are as at be but by for from has have he her his how i if in into is it its ll me my " +
+"no not of on or our re she so that the their them then there they this to us ve was we were what when " +
+"which who will with you your").split(" ")),
+SUFFIXES: [
+["ational", "ate"], ["ization", "ize"], ["iveness", "ive"], ["fulness", "ful"], ["ousness", "ous"],
+["sses", "ss"], ["ies", "y"], ["ing", ""], ["edly", ""], ["ed", ""], ["ment", ""], ["ness", ""],
+["ly", ""], ["s", ""]
+],
+stem: function(word) {
+for (const [suffix, replacement] of this.SUFFIXES) {
+if (word.endsWith(suffix) && word.length - suffix.length >= 3) {
+if (suffix === "s" && "isu".includes(word[word.length - 2])) break;
+word = word.slice(0, word.length - suffix.length) + replacement;
+break;
+}
+}
+if (word.endsWith("e") && word.length > 4) word = word.slice(0, -1);
+const last = word[word.length - 1];
+if (word.length > 3 && last === word[word.length - 2] && !"lsz".includes(last) && !/[0-9]/.test(last)) {
+word = word.slice(0, -1);
+}
+return word;
+},
+tokens: function(text) {
+const folded = String(text || "").toLowerCase().normalize("NFKD").replace(/[\u0300-\u036f]/g, "");
+return (folded.match(/[a-z0-9]+/g) || []).filter(token => token.length >= 2 && !this.STOPWORDS.has(token));
+},
+analyze: function(text) {
+return this.tokens(text).map(token => this.stem(token));
+},
+query: function(index, text, limit = 10) {
+const words = this.tokens(text);
+if (!index || words.length === 0) return [];
+if (!index.sortedTerms) index.sortedTerms = Object.keys(index.terms).sort();
+let totals = null;
+words.forEach((word, i) => {
+if (totals && totals.size === 0) return;
+const stemmed = this.stem(word);
+const terms = i === words.length - 1 ? this.prefixTerms(index, word) : (Object.prototype.hasOwnProperty.call(index.terms, stemmed) ? [stemmed] : []);
+const scores = new Map();
+terms.forEach(term => {
+const postings = index.terms[term];
+const idf = Math.log(1 + index.docs.length / (postings.length / 2));
+for (let p = 0; p < postings.length; p += 2) {
+scores.set(postings[p], Math.max(scores.get(postings[p]) || 0, postings[p + 1] * idf));
+}
+});
+totals = totals === null ? scores
+: new Map([...scores].filter(([doc]) => totals.has(doc)).map(([doc, score]) => [doc, totals.get(doc) + score]));
+});
+return [...totals].sort((a, b) => (b[1] - a[1]) || (a[0] - b[0])).slice(0, limit)
+.map(([doc, score]) => ({ section: index.docs[doc][0], position: index.docs[doc][1], score: score }));
+},
+prefixTerms: function(index, word) {
+const found = new Set([...this.expand(index.sortedTerms, this.stem(word)), ...this.expand(index.sortedTerms, word)]);
+for (let end = 3; end < word.length; end++) {
+const base = word.slice(0, end), rest = word.slice(end);
+const tails = [rest, rest[0] === base[base.length - 1] || rest[0] === "e" ? rest.slice(1) : rest];
+for (const [suffix, replacement] of this.SUFFIXES) {
+if (!tails.some(tail => suffix.startsWith(tail))) continue;
+const term = base + replacement;
+[term, term.endsWith("e") ? term.slice(0, -1) : term].forEach(candidate => {
+if (Object.prototype.hasOwnProperty.call(index.terms, candidate)) found.add(candidate);
+});
+}
+}
+return [...found];
+},
+expand: function(sortedTerms, prefix) {
+let lo = 0, hi = sortedTerms.length;
+while (lo < hi) {
+const mid = (lo + hi) >> 1;
+if (sortedTerms[mid] < prefix) lo = mid + 1; else hi = mid;
+}
+const terms = [];
+for (let i = lo; i < sortedTerms.length && sortedTerms[i].startsWith(prefix); i++) terms.push(sortedTerms[i]);
+return terms;
+}
+};
@@ -21,7 +21,7 @@ const HeroFeature = {
     images.forEach((img, index) => {
         heroContainer.append(`
             <div class="hero-bg ${index === 0 ? 'active' : ''}" 
-                 style="background-image: url('assets/images/home-page/hero-images/${img}'); 
+                 style="background-image: url('${Utils.assetInfo(masterData, 'home-page/hero-images', img).src}'); 
                         opacity: ${index === 0 ? 1 : 0};">
             </div>
         `);
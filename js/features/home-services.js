@@ -6,22 +6,19 @@ const HomeServicesFeature = {
         const container = $("#home-categories-container");
         if (container.length === 0) return;
 
-        const categories = await Data.fetch("categories");
-        const homeCategories = categories.filter(c => {
-            const val = String(c.showOnHomePage).toUpperCase();
-            return val === 'TRUE';
-        });
+        const [categories, indexes] = await Promise.all([Data.fetch("categories"), Data.indexes()]);
+        const homeCategories = (indexes.home_categories || []).map(i => categories[i]);
 
-        this.renderCategories(container, homeCategories);
+        this.renderCategories(container, homeCategories, indexes);
     },
 
-    renderCategories: function(container, categories) {
+    renderCategories: function(container, categories, indexes) {
         container.empty();
         categories.forEach(category => {
             const slug = category.name.trim().replace(/\s+/g, "-").toLowerCase();
             container.append(`
                 <a href="${category.href}" class="category-card" data-ga-category="${slug}">
-                    <div class="category-card-bg" style="background-image: url('${category.image_url}')"></div>
+                    <div class="category-card-bg" style="background-image: url('${Utils.resolvedAsset(indexes, category.image_url).src}')"></div>
                     <div class="category-card-content">
                         <h3>${category.name}</h3>
                         <p>${category.description}</p>
@@ -31,11 +31,16 @@ const LearnFeature = {
         this.loadArticle(defaultArticle.title);
     },
 
-    renderSidebar: function() {
+    renderSidebar: function(articles = this.articles) {
         const list = $("#wiki-article-list");
         list.empty();
+
+        if (articles.length === 0) {
+            list.append('<li class="wiki-no-results">No articles match your search.</li>');
+            return;
+        }
         
-        this.articles.forEach(article => {
+        articles.forEach(article => {
             const slug = this.slugify(article.title);
             list.append(`
                 <li>
@@ -47,6 +52,28 @@ const LearnFeature = {
         });
     },
 
+    /**
+     * Filters the sidebar through the sync-time search index (lazily fetched on first search),
+     * ranked by relevance. Falls back to a title match if the index cannot be loaded.
+     */
+    filterSidebar: async function(text) {
+        this.searchText = text;
+        if (!text.trim()) {
+            this.renderSidebar();
+            return;
+        }
+        const index = await Data.searchIndex();
+        if (text !== this.searchText) return; // a newer keystroke already re-rendered
+
+        const matches = index
+            ? Search.query(index, text, index.docs.length)
+                .filter(hit => hit.section === "articles")
+                .map(hit => this.articles[hit.position])
+                .filter(Boolean)
+            : this.articles.filter(a => a.title.toLowerCase().includes(text.trim().toLowerCase()));
+        this.renderSidebar(matches);
+    },
+
     loadArticle: function(title) {
         const article = this.articles.find(a => a.title === title);
         if (!article) return;
@@ -109,6 +136,12 @@ const LearnFeature = {
             self.loadArticle(title);
         });
 
+        // Search (the index is fetched when the box is first focused)
+        $(document).on("focus", "#wiki-search", () => Data.searchIndex());
+        $(document).on("input", "#wiki-search", function() {
+            self.filterSidebar($(this).val());
+        });
+
         // Sidebar Toggle
         $(document).on("click", "#wiki-sidebar-toggle", function() {
             $(".wiki-layout-wrapper").toggleClass("sidebar-collapsed");
@@ -18,9 +18,10 @@ const LogosFeature = {
 
     container.empty();
     logos.forEach(logo => {
+        const asset = Utils.assetInfo(masterData, 'home-page/logos', logo);
         container.append(`
             <div class="brand-logo-item">
-                <img src="assets/images/home-page/logos/${logo}" alt="${logo}">
+                ${Utils.picture(asset, logo)}
             </div>
         `);
     });
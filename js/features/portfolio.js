@@ -19,10 +19,10 @@ const PortfolioFeature = {
             return;
         }
 
-        this.renderPortfolio(container, images);
+        this.renderPortfolio(container, images, masterData);
     },
 
-    renderPortfolio: function(container, images) {
+    renderPortfolio: function(container, images, masterData) {
         container.empty();
         
         const processed = new Set();
@@ -54,14 +54,16 @@ const PortfolioFeature = {
 
         // 3. Render pairs
         pairs.forEach(pair => {
+            const before = Utils.assetInfo(masterData, 'portfolio', pair.before, '50vw');
+            const after = Utils.assetInfo(masterData, 'portfolio', pair.after, '50vw');
             container.append(`
                 <div class="portfolio-item transformation-pair">
                     <div class="transformation-side before">
-                        <img src="assets/images/portfolio/${pair.before}" alt="Before">
+                        ${Utils.picture(before, 'Before')}
                         <span class="label">Before</span>
                     </div>
                     <div class="transformation-side after">
-                        <img src="assets/images/portfolio/${pair.after}" alt="After">
+                        ${Utils.picture(after, 'After')}
                         <span class="label">After</span>
                     </div>
                 </div>
@@ -70,9 +72,10 @@ const PortfolioFeature = {
 
         // 4. Render singles
         singles.forEach(img => {
+            const asset = Utils.assetInfo(masterData, 'portfolio', img);
             container.append(`
                 <div class="portfolio-item">
-                    <img src="assets/images/portfolio/${img}" alt="Portfolio Work">
+                    ${Utils.picture(asset, 'Portfolio Work')}
                 </div>
             `);
         });
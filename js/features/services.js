@@ -5,19 +5,22 @@ const ServicesFeature = {
   options: {},
   allServices: [],
   categories: [],
+  indexes: {},
 
   init: async function (options = {}) {
     console.log("🔍 [Services] Init started with options:", options);
     this.options = options;
     
-    // Fetch both in parallel for speed
-    const [services, categories] = await Promise.all([
+    // Fetch in parallel for speed
+    const [services, categories, indexes] = await Promise.all([
         Data.fetch("services"),
-        Data.fetch("categories")
+        Data.fetch("categories"),
+        Data.indexes()
     ]);
 
     this.allServices = services;
     this.categories = categories;
+    this.indexes = indexes;
     console.log("🔍 [Services] Data fetched. Total services:", services.length, "Total categories:", categories.length);
 
     if (this.allServices.length === 0) {
@@ -26,21 +29,18 @@ const ServicesFeature = {
       return;
     }
 
-    // 1. Filter services if needed
-    let displayServices = [...this.allServices];
+    // 1. Categories in view: those with services (grouped at sync time), narrowed by the filter
+    const byCategory = indexes.services_by_category || {};
+    let displayCategories = this.categories.filter(c => (byCategory[c.name] || []).length > 0);
     if (options.filter) {
       console.log("🔍 [Services] Applying filter:", options.filter, "Mode:", options.mode);
       if (options.mode === "exclude") {
-        displayServices = displayServices.filter(s => s.category !== options.filter);
+        displayCategories = displayCategories.filter(c => c.name !== options.filter);
       } else {
-        displayServices = displayServices.filter(s => s.category === options.filter);
+        displayCategories = displayCategories.filter(c => c.name === options.filter);
       }
     }
-    console.log("🔍 [Services] Services to display:", displayServices.length);
-
-    // Filter categories to only those that have services in the current view
-    const activeCategoryNames = [...new Set(displayServices.map(s => s.category))];
-    const displayCategories = this.categories.filter(c => activeCategoryNames.includes(c.name));
+    const activeCategoryNames = displayCategories.map(c => c.name);
     console.log("🔍 [Services] Active categories in view:", activeCategoryNames);
 
     // 2. Render Category Selector (Cards) - Only if container exists
@@ -52,7 +52,7 @@ const ServicesFeature = {
 
     // 3. Render all grids
     console.log("🔍 [Services] Rendering grids...");
-    this.renderServiceGrids(activeCategoryNames, displayServices);
+    this.renderServiceGrids(activeCategoryNames);
 
     // 4. Bind events
     this.bindEvents();
@@ -94,7 +94,7 @@ const ServicesFeature = {
         const slug = this.slugify(category.name);
         container.append(`
             <div class="category-card" data-category="${category.name}" data-ga-category="${slug}">
-                <div class="category-card-bg" style="background-image: url('${category.image_url}')"></div>
+                <div class="category-card-bg" style="background-image: url('${Utils.resolvedAsset(this.indexes, category.image_url).src}')"></div>
                 <div class="category-card-content">
                     <h3>${category.name}</h3>
                     <p>${category.description}</p>
@@ -104,7 +104,7 @@ const ServicesFeature = {
     });
   },
 
-  renderServiceGrids: function (categoryNames, services) {
+  renderServiceGrids: function (categoryNames) {
     const serviceContent = $(".service-content");
     if (serviceContent.length === 0) return;
 
@@ -115,15 +115,16 @@ const ServicesFeature = {
         `<div id="grid-${categoryId}" class="services-grid"></div>`,
       );
 
-      services
-        .filter((s) => s.category === category)
-        .forEach((service) => {
-          const chipsHtml = this.renderServiceChips(service.footer);
+      (this.indexes.services_by_category[category] || [])
+        .forEach((position) => {
+          const service = this.allServices[position];
+          const chipsHtml = this.renderServiceChips(this.indexes.service_inclusions[position]);
+          const image = Utils.resolvedAsset(this.indexes, service.image_url);
           const serviceSlug = this.slugify(service.title);
           grid.append(`
                     <div class="service-card" data-title="${service.title}" data-ga-service="${serviceSlug}" data-ga-category="${categoryId}">
                         <div class="service-card-image">
-                            <img src="${service.image_url}" alt="${service.title}">
+                            <img src="${image.src}" ${image.attrs} alt="${service.title}">
                         </div>
                         <div class="service-card-content">
                             <h3>${service.title}</h3>
@@ -137,9 +138,8 @@ const ServicesFeature = {
     });
   },
 
-  renderServiceChips: function (footerText) {
-    if (!footerText) return "";
-    const items = footerText.split(",").map((s) => s.trim());
+  renderServiceChips: function (items) {
+    if (!items || items.length === 0) return "";
     return items
       .map((item) => {
         const icon = this.getServiceIcon(item);
@@ -197,7 +197,8 @@ const ServicesFeature = {
   },
 
   showServiceDetails: function(serviceTitle) {
-    const service = this.allServices.find(s => s.title === serviceTitle);
+    const position = this.indexes.service_by_title[serviceTitle];
+    const service = this.allServices[position];
     if (!service) return;
 
     const serviceSlug = this.slugify(service.title);
@@ -206,12 +207,13 @@ const ServicesFeature = {
     Analytics.trackServiceView(service.title, serviceSlug, service.category);
 
     const detailsContainer = $("#service-details-container");
-    const chipsHtml = this.renderServiceChips(service.footer);
+    const chipsHtml = this.renderServiceChips(this.indexes.service_inclusions[position]);
     
     // Get inclusions title and CTA text from config
-    const inclusionsTitle = (Data.masterData.config.find(c => c.key === 'SERVICE_INCLUSIONS_TITLE') || {value: "What's Included?"}).value;
-    const inquireText = (Data.masterData.config.find(c => c.key === 'STEP_2_BUTTON_TEXT') || {value: "Inquire Now"}).value;
-    const closeBtnText = (Data.masterData.config.find(c => c.key === 'EXPERIENCE_CLOSE_BTN') || {value: "Close & Return to List"}).value;
+    const config = this.indexes.config || {};
+    const inclusionsTitle = config.SERVICE_INCLUSIONS_TITLE || "What's Included?";
+    const inquireText = config.STEP_2_BUTTON_TEXT || "Inquire Now";
+    const closeBtnText = config.EXPERIENCE_CLOSE_BTN || "Close & Return to List";
 
     detailsContainer.html(`
         <div class="active-service-details">
@@ -229,7 +231,7 @@ const ServicesFeature = {
                     
                     <div class="details-footer">
                         <div class="cta-row">
-                            <a href="${(Data.masterData.config.find(c => c.key === 'STEP_2_BUTTON_HREF') || {}).value || 'https://cal.com/styleplanit/15min'}" 
+                            <a href="${config.STEP_2_BUTTON_HREF || 'https://cal.com/styleplanit/15min'}" 
                                target="_blank" 
                                class="btn btn-primary-accent btn-ga-inquiry"
                                data-ga-service="${serviceSlug}"
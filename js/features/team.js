@@ -8,7 +8,7 @@ const TeamFeature = {
     
     const masterData = await Data.loadMasterData();
     const team = masterData.team || [];
-    const images = masterData.assets_manifest["meet-team-page"] || [];
+    const teamImages = (masterData.indexes && masterData.indexes.team_images) || [];
     
     if (!team || team.length === 0) {
       container.html('<p class="text-center">Team details coming soon.</p>');
@@ -20,15 +20,13 @@ const TeamFeature = {
       const isEven = index % 2 === 0;
       const alignmentClass = isEven ? "image-left" : "image-right";
       
-      // Try to find image matching name (e.g. "Ayushi Vyas" -> "ayushi")
-      const firstName = person.name.split(' ')[0].toLowerCase();
-      const matchedImage = images.find(img => img.toLowerCase().includes(firstName)) || images[0];
-      const imageUrl = `assets/images/meet-team-page/${matchedImage}`;
+      // Image matched to the member's first name at sync time (e.g. "Ayushi Vyas" -> "ayushi")
+      const image = Utils.assetInfo(masterData, 'meet-team-page', teamImages[index]);
 
       container.append(`
                 <div class="profile-card ${alignmentClass}">
                     <div class="profile-image">
-                        <img src="${imageUrl}" alt="${person.name}">
+                        ${Utils.picture(image, person.name)}
                     </div>
                     <div class="profile-text">
                         <h3>${person.name}</h3>
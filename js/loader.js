@@ -35,14 +35,18 @@ async function loadComponents() {
     // Initial state
     updateProgress(10);
 
+    // Fingerprinted asset manifest (scripts/build_assets.py), fetched while site data loads.
+    // Only this small file is revalidated; the hashed scripts it points to are cached forever.
+    const assetManifestPromise = fetch(`/dist/asset-manifest.json?v=${new Date().getTime()}`)
+        .then(response => response.ok ? response.json() : null)
+        .catch(() => null);
+
     // 1. Check version and start fetching master data immediately
     if (typeof Data !== 'undefined') {
-        const masterData = await Data.loadMasterData();
-        if (masterData && masterData.config) {
-            const phrasesConfig = masterData.config.find(item => item.key === 'LOADER_PHRASES');
-            if (phrasesConfig && phrasesConfig.value) {
-                phrases = phrasesConfig.value.split('|').map(p => p.trim());
-            }
+        const indexes = await Data.indexes();
+        const loaderPhrases = indexes.config_lists ? indexes.config_lists.LOADER_PHRASES : null;
+        if (loaderPhrases && loaderPhrases.length > 0) {
+            phrases = loaderPhrases;
         }
         await Data.checkVersion();
     }
@@ -94,10 +98,21 @@ async function loadComponents() {
     if ($("#wiki-article-container").length > 0) features.push('learn');
     features.push('dialogs'); 
 
-    const featurePromises = features.map((feature) => {
+    // Prefer the page bundle when it covers every detected feature, else per-feature hashed files
+    const assetManifest = await assetManifestPromise;
+    const page = typeof Data !== 'undefined' ? Data.currentPage() : null;
+    const bundle = assetManifest && assetManifest.bundles ? assetManifest.bundles[page] : null;
+    const featureSources = (bundle && features.every(feature => bundle.features.includes(feature)))
+        ? [bundle.src]
+        : features.map((feature) => {
+            const path = `js/features/${feature}.js`;
+            return (assetManifest && assetManifest.files[path]) || path;
+        });
+
+    const featurePromises = featureSources.map((src) => {
         return new Promise((resolve) => {
             const script = document.createElement('script');
-            script.src = `/js/features/${feature}.js?v=${new Date().getTime()}`;
+            script.src = `/${src}`;
             script.async = false;
             script.onload = () => resolve();
             script.onerror = () => resolve();
@@ -203,4 +218,19 @@ async function loadComponents() {
     }, 400); 
 }
 
+/**
+ * Offline cache (sw.js, generated by scripts/build_sw.py): precached pages, components, scripts,
+ * styles and images, stale-while-revalidate site data. Registered after load so it never competes
+ * with the first paint; skipped on localhost (set localStorage.sw_dev to test it there).
+ */
+function registerServiceWorker() {
+    if (!('serviceWorker' in navigator)) return;
+    const isLocal = ['localhost', '127.0.0.1'].includes(window.location.hostname);
+    if (isLocal && !localStorage.getItem('sw_dev')) return;
+    navigator.serviceWorker.register('/sw.js').catch((error) => {
+        console.warn(`[Loader] Service worker registration failed (${error.message})`);
+    });
+}
+
 document.addEventListener('DOMContentLoaded', loadComponents);
+window.addEventListener('load', registerServiceWorker);
@@ -114,16 +114,56 @@ const Utils = {
      * Centralized way to fetch and apply config in one call.
      */
     getConfig: async function() {
-        const configArray = await Data.fetch('config');
-        const config = {};
-        configArray.forEach(item => {
-            if (item.key) config[item.key] = item.value;
-        });
-        
+        const config = (await Data.indexes()).config || {};
         this.applyConfig(config);
         return config;
     },
 
+    /**
+     * Resolves an assets_manifest image to a hash-versioned URL plus width/height attributes
+     * (from assets_meta) so the browser can reserve layout space before the image loads.
+     * When WebP variants exist, attrs also carries a srcset (with the original as the widest candidate);
+     * AVIF variants become a <source> in `sources`, which Utils.picture() puts in front of the <img>.
+     */
+    assetInfo: function(masterData, folder, file, sizes = '100vw') {
+        const path = folder === 'root' ? file : `${folder}/${file}`;
+        const meta = (masterData && masterData.assets_meta) ? masterData.assets_meta[path] : null;
+        const src = `assets/images/${path}`;
+        if (!meta) return { src: src, attrs: '', sources: '' };
+
+        const versionedSrc = `${src}?v=${meta.hash}`;
+        let attrs = (meta.width && meta.height) ? `width="${meta.width}" height="${meta.height}"` : '';
+        const srcset = (type) => (meta.variants || []).filter(v => v.type === type)
+            .map(v => `/${v.src} ${v.width}w`).concat(`${versionedSrc} ${meta.width}w`);
+        const webp = srcset('image/webp');
+        if (webp.length > 1) {
+            attrs += ` srcset="${webp.join(', ')}" sizes="${sizes}"`;
+        }
+        const avif = srcset('image/avif');
+        const sources = avif.length > 1 ? `<source type="image/avif" srcset="${avif.join(', ')}" sizes="${sizes}">` : '';
+        return { src: versionedSrc, attrs: attrs, sources: sources };
+    },
+
+    /**
+     * <img> for an assetInfo() result, wrapped in a <picture> when it has AVIF sources
+     * (styles give picture display: contents, so img rules and percentage sizes still apply).
+     */
+    picture: function(asset, alt) {
+        const img = `<img src="${asset.src}" ${asset.attrs} alt="${alt}">`;
+        return asset.sources ? `<picture>${asset.sources}${img}</picture>` : img;
+    },
+
+    /**
+     * Looks up an image reference from the sheets (e.g. a service image_url) in indexes.assets,
+     * which the sync resolved against the manifest: a hash-versioned src plus width/height attributes.
+     */
+    resolvedAsset: function(indexes, ref) {
+        const asset = (indexes && indexes.assets) ? indexes.assets[ref] : null;
+        if (!asset) return { src: ref, attrs: '' };
+        const attrs = (asset.width && asset.height) ? `width="${asset.width}" height="${asset.height}"` : '';
+        return { src: asset.src, attrs: attrs };
+    },
+
     updateMeta: function(name, content, attr = 'name') {
         if (!document.head) return; // Ensure head is available
         let el = document.querySelector(`meta[${attr}="${name}"]`);
@@ -137,26 +177,50 @@ const Utils = {
 };
 
 /**
- * Data - Centralized data provider using atomic site-data.json
+ * Data - Centralized data provider using content-hashed site-data shards
+ * (falls back to the atomic site-data.json)
  */
 const Data = {
     masterData: null,
 
     /**
-     * Load the master JSON file
+     * Page name used by the shard index ('/' -> 'index', '/services.html' -> 'services')
+     */
+    currentPage: function() {
+        return window.location.pathname.replace(/^\/+|\/+$/g, '').replace(/\.html$/, '') || 'index';
+    },
+
+    /**
+     * Shards hold only the sections a page needs, so the cache is kept per page
+     */
+    cacheKey: function() {
+        return `site_data_cache:${this.currentPage()}`;
+    },
+
+    /**
+     * When this page's cache entry was written (each page's entry ages on its own)
+     */
+    cacheTimestampKey: function() {
+        return `cache_timestamp:${this.currentPage()}`;
+    },
+
+    /**
+     * Load the master data for this page
      */
     loadMasterData: async function() {
         if (this.masterData) return this.masterData;
         
         try {
             // Check cache and TTL (24 hours)
-            const cached = localStorage.getItem('site_data_cache');
-            const cacheTime = localStorage.getItem('cache_timestamp');
+            const cached = localStorage.getItem(this.cacheKey());
+            const cacheTime = localStorage.getItem(this.cacheTimestampKey());
             const now = new Date().getTime();
             const dayInMs = 24 * 60 * 60 * 1000;
 
-            if (cached && cacheTime && (now - cacheTime < dayInMs)) {
-                this.masterData = JSON.parse(cached);
+            // Caches written before site-data carried precomputed indexes are refetched
+            const cachedData = cached ? JSON.parse(cached) : null;
+            if (cachedData && cachedData.indexes && cacheTime && (now - cacheTime < dayInMs)) {
+                this.masterData = cachedData;
                 // Background refresh for next visit
                 this.refreshMasterData();
                 return this.masterData;
@@ -171,13 +235,38 @@ const Data = {
     },
 
     /**
-     * Fetch fresh JSON from repository
+     * Fetch only the sections this page needs. The index is tiny and always revalidated;
+     * shard filenames carry a content hash, so the browser can cache them permanently.
+     */
+    loadShards: async function() {
+        const response = await fetch(`${CONFIG.SHARDS_PATH}index.json?v=${new Date().getTime()}`);
+        if (!response.ok) throw new Error(`Status ${response.status}`);
+        const index = await response.json();
+        const sections = index.pages[this.currentPage()] || Object.keys(index.sections);
+
+        const entries = await Promise.all(sections.map(async (section) => {
+            const shard = await fetch(`${CONFIG.SHARDS_PATH}${index.sections[section]}`);
+            if (!shard.ok) throw new Error(`Shard ${section}: status ${shard.status}`);
+            return [section, await shard.json()];
+        }));
+        return Object.fromEntries(entries);
+    },
+
+    /**
+     * Fetch fresh data from repository
      */
     refreshMasterData: async function() {
         try {
-            const response = await fetch(`${CONFIG.DATA_PATH}?v=${new Date().getTime()}`);
-            if (response.ok) {
-                const freshData = await response.json();
+            let freshData = null;
+            try {
+                freshData = await this.loadShards();
+            } catch (e) {
+                console.warn("Site data shards unavailable, loading full site-data.json", e);
+                const response = await fetch(`${CONFIG.DATA_PATH}?v=${new Date().getTime()}`);
+                if (response.ok) freshData = await response.json();
+            }
+
+            if (freshData) {
                 const now = new Date().getTime();
                 
                 // Version check logic
@@ -191,16 +280,22 @@ const Data = {
                 // If versions mismatch, clear cache and reload to force fresh state
                 if (cachedVersion && cachedVersion !== newVersion) {
                     console.log(`New version detected: ${newVersion}. Purging cache and reloading...`);
-                    localStorage.removeItem('site_data_cache');
+                    // The service worker's caches are named by version; fetch the new worker now
+                    if (navigator.serviceWorker && navigator.serviceWorker.controller) {
+                        const registration = await navigator.serviceWorker.getRegistration();
+                        if (registration) await registration.update().catch(() => null);
+                    }
+                    Object.keys(localStorage)
+                        .filter(key => key.startsWith('site_data_cache') || key.startsWith('cache_timestamp'))
+                        .forEach(key => localStorage.removeItem(key));
                     localStorage.setItem('app_version', newVersion);
-                    localStorage.setItem('cache_timestamp', now);
                     window.location.reload(); 
                     return freshData;
                 }
 
                 localStorage.setItem('app_version', newVersion);
-                localStorage.setItem('site_data_cache', JSON.stringify(freshData));
-                localStorage.setItem('cache_timestamp', now);
+                localStorage.setItem(this.cacheKey(), JSON.stringify(freshData));
+                localStorage.setItem(this.cacheTimestampKey(), now);
                 this.masterData = freshData;
                 return freshData;
             }
@@ -218,6 +313,39 @@ const Data = {
         return (master && master[type]) ? master[type] : [];
     },
 
+    /**
+     * Lookup tables compiled at sync time (scripts/site_indexes.py): config map, pre-split
+     * lists, services by category, resolved image references. Never rebuilt in the browser.
+     */
+    indexes: async function() {
+        const master = await this.loadMasterData();
+        return (master && master.indexes) ? master.indexes : {};
+    },
+
+    /**
+     * The search index shard (scripts/search_index.py), fetched on first use only: it is listed
+     * under "lazy" in the shard index, so no page downloads it up front. Resolves to null
+     * when shards are unavailable.
+     */
+    searchIndex: function() {
+        if (!this.searchIndexPromise) {
+            this.searchIndexPromise = (async () => {
+                const response = await fetch(`${CONFIG.SHARDS_PATH}index.json?v=${new Date().getTime()}`);
+                if (!response.ok) throw new Error(`Status ${response.status}`);
+                const name = ((await response.json()).lazy || {}).search;
+                if (!name) throw new Error("No search shard in the index");
+                const shard = await fetch(`${CONFIG.SHARDS_PATH}${name}`);
+                if (!shard.ok) throw new Error(`Shard search: status ${shard.status}`);
+                return await shard.json();
+            })().catch(e => {
+                console.warn("Search index unavailable", e);
+                this.searchIndexPromise = null;
+                return null;
+            });
+        }
+        return this.searchIndexPromise;
+    },
+
     /**
      * Backward compatibility checkVersion (logic moved to refreshMasterData)
      */
@@ -225,3 +353,107 @@ const Data = {
         await this.loadMasterData();
     }
 };
+
+/**
+ * Search - Queries the inverted index built at sync time (scripts/search_index.py).
+ * analyze()/stem() mirror the Python ones so query words meet the indexed stems; change both together.
+ */
+const Search = {
+    STOPWORDS: new Set(("a an and are as at be but by for from has have he her his how i if in into is it its ll me my " +
+        "no not of on or our re she so that the their them then there they this to us ve was we were what when " +
+        "which who will with you your").split(" ")),
+    SUFFIXES: [
+        ["ational", "ate"], ["ization", "ize"], ["iveness", "ive"], ["fulness", "ful"], ["ousness", "ous"],
+        ["sses", "ss"], ["ies", "y"], ["ing", ""], ["edly", ""], ["ed", ""], ["ment", ""], ["ness", ""],
+        ["ly", ""], ["s", ""]
+    ],
+
+    stem: function(word) {
+        for (const [suffix, replacement] of this.SUFFIXES) {
+            if (word.endsWith(suffix) && word.length - suffix.length >= 3) {
+                if (suffix === "s" && "isu".includes(word[word.length - 2])) break;
+                word = word.slice(0, word.length - suffix.length) + replacement;
+                break;
+            }
+        }
+        if (word.endsWith("e") && word.length > 4) word = word.slice(0, -1);
+        const last = word[word.length - 1];
+        if (word.length > 3 && last === word[word.length - 2] && !"lsz".includes(last) && !/[0-9]/.test(last)) {
+            word = word.slice(0, -1);
+        }
+        return word;
+    },
+
+    tokens: function(text) {
+        const folded = String(text || "").toLowerCase().normalize("NFKD").replace(/[\u0300-\u036f]/g, "");
+        return (folded.match(/[a-z0-9]+/g) || []).filter(token => token.length >= 2 && !this.STOPWORDS.has(token));
+    },
+
+    analyze: function(text) {
+        return this.tokens(text).map(token => this.stem(token));
+    },
+
+    /**
+     * Documents matching every query word, best first: [{section, position, score}].
+     * The last word also matches longer indexed terms, so results follow as-you-type input.
+     */
+    query: function(index, text, limit = 10) {
+        const words = this.tokens(text);
+        if (!index || words.length === 0) return [];
+        if (!index.sortedTerms) index.sortedTerms = Object.keys(index.terms).sort();
+
+        let totals = null;
+        words.forEach((word, i) => {
+            if (totals && totals.size === 0) return;
+            const stemmed = this.stem(word);
+            const terms = i === words.length - 1 ? this.prefixTerms(index, word) : (Object.prototype.hasOwnProperty.call(index.terms, stemmed) ? [stemmed] : []);
+            const scores = new Map();
+            terms.forEach(term => {
+                const postings = index.terms[term];
+                const idf = Math.log(1 + index.docs.length / (postings.length / 2));
+                for (let p = 0; p < postings.length; p += 2) {
+                    scores.set(postings[p], Math.max(scores.get(postings[p]) || 0, postings[p + 1] * idf));
+                }
+            });
+            totals = totals === null ? scores
+                : new Map([...scores].filter(([doc]) => totals.has(doc)).map(([doc, score]) => [doc, totals.get(doc) + score]));
+        });
+
+        return [...totals].sort((a, b) => (b[1] - a[1]) || (a[0] - b[0])).slice(0, limit)
+            .map(([doc, score]) => ({ section: index.docs[doc][0], position: index.docs[doc][1], score: score }));
+    },
+
+    /**
+     * Indexed terms a partly typed word may become: prefix matches of it and of its stem, plus
+     * stems it has typed past into a stripped suffix (stylin -> styl, storie -> story)
+     */
+    prefixTerms: function(index, word) {
+        const found = new Set([...this.expand(index.sortedTerms, this.stem(word)), ...this.expand(index.sortedTerms, word)]);
+        for (let end = 3; end < word.length; end++) {
+            const base = word.slice(0, end), rest = word.slice(end);
+            const tails = [rest, rest[0] === base[base.length - 1] || rest[0] === "e" ? rest.slice(1) : rest];
+            for (const [suffix, replacement] of this.SUFFIXES) {
+                if (!tails.some(tail => suffix.startsWith(tail))) continue;
+                const term = base + replacement;
+                [term, term.endsWith("e") ? term.slice(0, -1) : term].forEach(candidate => {
+                    if (Object.prototype.hasOwnProperty.call(index.terms, candidate)) found.add(candidate);
+                });
+            }
+        }
+        return [...found];
+    },
+
+    /**
+     * Indexed terms starting with `prefix` (binary search over the sorted term list)
+     */
+    expand: function(sortedTerms, prefix) {
+        let lo = 0, hi = sortedTerms.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (sortedTerms[mid] < prefix) lo = mid + 1; else hi = mid;
+        }
+        const terms = [];
+        for (let i = lo; i < sortedTerms.length && sortedTerms[i].startsWith(prefix); i++) terms.push(sortedTerms[i]);
+        return terms;
+    }
+};
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timezone
+
+from asana_tools import AsanaClient, AsanaError, DEFAULT_PROJECT_ID
+
+"""
+🪞 LOCAL ASANA MIRROR
+Keeps the launch plan's tasks in a SQLite file (scripts/.cache/asana-<project>.sqlite3) so
+questions about the plan are answered offline. `sync` reads the project's event stream from
+the stored sync token and re-fetches only tasks modified since the mirror's high-water mark;
+the first sync, or one whose token has expired, reads the project in full. `query` filters
+the mirror by assignee, completion and due date through indexed columns, without the network.
+
+    python3 scripts/asana_mirror.py sync
+    python3 scripts/asana_mirror.py query --assignee "Deepesh Mehta" --open --due-before 2026-11-01
+"""
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".cache")
+SCHEMA_VERSION = 1
+MIRROR_FIELDS = "name,notes,completed,assignee.name,due_on,modified_at"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    gid TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    notes TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    assignee_gid TEXT,
+    assignee_name TEXT COLLATE NOCASE,
+    due_on TEXT,
+    modified_at TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_assignee ON tasks(assignee_name, completed, due_on);
+CREATE INDEX IF NOT EXISTS tasks_completed_due ON tasks(completed, due_on);
+CREATE INDEX IF NOT EXISTS tasks_due ON tasks(due_on);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+def mirror_path(project_id=DEFAULT_PROJECT_ID):
+    return os.path.join(CACHE_DIR, f"asana-{project_id}.sqlite3")
+
+def open_mirror(path):
+    """Opens (creating if needed) the mirror database; an older schema is dropped and rebuilt on the next sync."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        db.executescript("DROP TABLE IF EXISTS tasks; DROP TABLE IF EXISTS meta;")
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    db.executescript(SCHEMA)
+    return db
+
+def get_meta(db, key, default=None):
+    row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else default
+
+def set_meta(db, key, value):
+    db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+def task_row(task):
+    assignee = task.get("assignee") or {}
+    return (task["gid"], task.get("name") or "", task.get("notes"), int(bool(task.get("completed"))),
+            assignee.get("gid"), assignee.get("name"), task.get("due_on"), task.get("modified_at"))
+
+def upsert_tasks(db, tasks):
+    db.executemany("INSERT OR REPLACE INTO tasks (gid, name, notes, completed, assignee_gid, assignee_name, due_on, modified_at) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [task_row(t) for t in tasks])
+
+def event_changes(events, project_id):
+    """Collapses an event stream into (live_gids, gone_gids): the last event per task wins."""
+    latest = {}
+    for event in events:
+        resource = event.get("resource") or {}
+        if resource.get("resource_type") != "task":
+            continue
+        parent = (event.get("parent") or {}).get("gid")
+        action = event.get("action")
+        gone = action == "deleted" or (action == "removed" and parent == project_id)
+        latest[resource["gid"]] = "gone" if gone else "live"
+    live = {gid for gid, state in latest.items() if state == "live"}
+    return live, set(latest) - live
+
+def sync_mirror(client, db, project_id=DEFAULT_PROJECT_ID, full=False):
+    """
+    Brings the mirror up to date and returns stats {mode, events, upserted, deleted, requests, tasks}.
+    With a valid sync token this costs one /events request when nothing changed, plus one
+    modified_since listing (and a GET per task it missed) when something did.
+    """
+    requests_before = client.stats["requests"]
+    stats = {"mode": "delta", "events": 0, "upserted": 0, "deleted": 0}
+    token = None if full or get_meta(db, "project_id") != project_id else get_meta(db, "sync_token")
+
+    # Taking the token before a full read means edits made during the read show up in the next delta
+    events, token = client.events(project_id, token)
+    if events is None:
+        tasks = list(client.iter_tasks(project_id, MIRROR_FIELDS))
+        with db:
+            db.execute("DELETE FROM tasks")
+            upsert_tasks(db, tasks)
+        stats.update(mode="full", upserted=len(tasks))
+    else:
+        live, gone = event_changes(events, project_id)
+        fetched = {}
+        since = get_meta(db, "modified_since")
+        if live and since:
+            for task in client.iter_tasks(project_id, MIRROR_FIELDS, modified_since=since):
+                fetched[task["gid"]] = task
+        for gid in sorted(live - set(fetched)):
+            try:
+                fetched[gid] = client.get_task(gid, MIRROR_FIELDS)
+            except AsanaError as e:
+                if e.status != 404:
+                    raise
+                gone.add(gid)
+        with db:
+            upsert_tasks(db, fetched.values())
+            db.executemany("DELETE FROM tasks WHERE gid = ?", [(gid,) for gid in gone])
+        stats.update(events=len(events), upserted=len(fetched), deleted=len(gone))
+
+    with db:
+        set_meta(db, "project_id", project_id)
+        set_meta(db, "sync_token", token)
+        set_meta(db, "modified_since", db.execute("SELECT MAX(modified_at) FROM tasks").fetchone()[0])
+        set_meta(db, "synced_at", datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    stats["requests"] = client.stats["requests"] - requests_before
+    stats["tasks"] = db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+    return stats
+
+def query_tasks(db, assignee=None, completed=None, due_before=None, due_after=None, overdue=False, search=None, limit=None):
+    """Returns matching task rows ordered by due date (undated last). `assignee` is a name, a GID or "none"."""
+    clauses, params = [], []
+    if assignee:
+        if assignee.lower() in ("none", "unassigned"):
+            clauses.append("assignee_gid IS NULL")
+        elif assignee.isdigit():
+            clauses.append("assignee_gid = ?")
+            params.append(assignee)
+        else:
+            clauses.append("assignee_name = ?")
+            params.append(assignee)
+    if overdue:
+        completed = False
+        due_before = min(filter(None, [due_before, date.today().isoformat()]))
+    if completed is not None:
+        clauses.append("completed = ?")
+        params.append(int(completed))
+    if due_before:
+        clauses.append("due_on < ?")
+        params.append(due_before)
+    if due_after:
+        clauses.append("due_on > ?")
+        params.append(due_after)
+    if search:
+        clauses.append("(name LIKE ? OR notes LIKE ?)")
+        params.extend([f"%{search}%"] * 2)
+
+    sql = "SELECT gid, name, completed, assignee_gid, assignee_name, due_on, modified_at FROM tasks"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY due_on IS NULL, due_on, name"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return [dict(row) for row in db.execute(sql, params)]
+
+def print_sync_report(stats):
+    if stats["mode"] == "full":
+        print(f"🪞 Full sync: {stats['upserted']} tasks mirrored in {stats['requests']} requests")
+    else:
+        print(f"🪞 Delta sync: {stats['events']} events, {stats['upserted']} updated, {stats['deleted']} removed "
+              f"in {stats['requests']} requests ({stats['tasks']} tasks mirrored)")
+
+def print_tasks(rows):
+    print("-" * 50)
+    for t in rows:
+        status = "[x]" if t["completed"] else "[ ]"
+        due = f" due {t['due_on']}" if t["due_on"] else ""
+        print(f"{t['gid']} | {status} {t['name']} ({t['assignee_name'] or 'Unassigned'}){due}")
+    print("-" * 50)
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SQLite mirror of the Style Plan-It Asana project.")
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--project", default=DEFAULT_PROJECT_ID, help="Asana Project GID")
+    common.add_argument("--db", help="Mirror database path (default scripts/.cache/asana-<project>.sqlite3)")
+
+    sync_parser = subparsers.add_parser("sync", parents=[common], help="Fetch changes since the last sync into the mirror")
+    sync_parser.add_argument("--full", action="store_true", help="Ignore the sync token and re-read the whole project.")
+
+    query_parser = subparsers.add_parser("query", parents=[common], help="Filter mirrored tasks offline")
+    query_parser.add_argument("--assignee", help='Assignee name or GID ("none" for unassigned)')
+    state = query_parser.add_mutually_exclusive_group()
+    state.add_argument("--completed", dest="completed", action="store_const", const=True, help="Only completed tasks")
+    state.add_argument("--open", dest="completed", action="store_const", const=False, help="Only incomplete tasks")
+    query_parser.add_argument("--due-before", metavar="YYYY-MM-DD", help="Due strictly before this date")
+    query_parser.add_argument("--due-after", metavar="YYYY-MM-DD", help="Due strictly after this date")
+    query_parser.add_argument("--overdue", action="store_true", help="Incomplete and due before today")
+    query_parser.add_argument("--search", help="Substring of the task name or notes")
+    query_parser.add_argument("--limit", type=int, help="Maximum tasks to print")
+    query_parser.add_argument("--sync", action="store_true", help="Run a delta sync first (needs the network)")
+    query_parser.add_argument("--json", action="store_true", help="Print the matching tasks as JSON")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return
+
+    db = open_mirror(args.db or mirror_path(args.project))
+    try:
+        if args.command == "sync" or args.sync:
+            client = AsanaClient()
+            try:
+                stats = sync_mirror(client, db, args.project, full=args.command == "sync" and args.full)
+            finally:
+                client.close()
+            if args.command == "sync" or not args.json:
+                print_sync_report(stats)
+        if args.command == "query":
+            if get_meta(db, "project_id") != args.project:
+                print(f"❌ No mirror for project {args.project} yet. Run: python3 scripts/asana_mirror.py sync", file=sys.stderr)
+                sys.exit(1)
+            start = time.perf_counter()
+            rows = query_tasks(db, args.assignee, args.completed, args.due_before, args.due_after,
+                               args.overdue, args.search, args.limit)
+            elapsed = time.perf_counter() - start
+            if args.json:
+                print(json.dumps(rows, indent=2, ensure_ascii=False))
+                return
+            print_tasks(rows)
+            print(f"{len(rows)} tasks in {elapsed * 1000:.1f}ms (mirror synced {get_meta(db, 'synced_at')})")
+    except AsanaError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,36 @@
 #!/usr/bin/env python3
 import os
+import csv
 import json
-import urllib.request
+import http.client
 import argparse
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
 
 # Project ID for Style Plan-It Launch Plan
 DEFAULT_PROJECT_ID = "1212636326772928"
+# Override with ASANA_API_BASE (e.g. http://localhost:8766/api/1.0 for scripts/mock_asana_server.py)
 ASANA_API_BASE = "https://app.asana.com/api/1.0"
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 1.0
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_BULK_WORKERS = 8
+TASK_FIELDS = "name,completed,assignee.name,due_on,modified_at"
+# Only these are retried after a dropped connection or 5xx; a 429 means nothing was applied, so any method is retried
+IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+# How a kept-alive connection the server closed while idle fails; the request never reached it
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+class AsanaError(Exception):
+    """An Asana API call failed (HTTP error, exhausted retries or missing credentials)."""
+    def __init__(self, message, status=None, body=None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
 
 def get_asana_pat():
     """Tries to get the Asana Personal Access Token from environment or .env.asana file."""
@@ -15,7 +38,7 @@ def get_asana_pat():
     pat = os.environ.get("ASANA_PAT")
     if pat:
         return pat
-    
+
     # 2. Check .env.asana in project root
     env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env.asana")
     if os.path.exists(env_file):
@@ -26,86 +49,272 @@ def get_asana_pat():
                         return line.split("=", 1)[1].strip().strip('"').strip("'")
         except Exception as e:
             print(f"⚠️  Error reading .env.asana: {e}", file=sys.stderr)
-            
+
     return None
 
-def asana_request(endpoint, method="GET", data=None):
-    pat = get_asana_pat()
-    if not pat:
-        print("❌ Error: ASANA_PAT not found in environment or .env.asana file.", file=sys.stderr)
-        sys.exit(1)
-        
-    url = f"{ASANA_API_BASE}/{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {pat}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
-    req_data = json.dumps(data).encode("utf-8") if data else None
-    req = urllib.request.Request(url, data=req_data, headers=headers, method=method)
-    
-    try:
-        with urllib.request.urlopen(req) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8")
-        print(f"❌ Asana API Error ({e.code}): {error_body}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}", file=sys.stderr)
-        sys.exit(1)
+class AsanaClient:
+    """
+    Reusable Asana API client. The PAT is resolved once, each thread keeps one keep-alive
+    connection, list endpoints are followed page by page as generators, and 429 responses
+    are retried after their Retry-After delay. A request that fails because the server closed
+    the kept-alive connection while it was idle is resent once on a new connection.
+    """
+    def __init__(self, pat=None, base_url=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+        self.pat = pat or get_asana_pat()
+        if not self.pat:
+            raise AsanaError("ASANA_PAT not found in environment or .env.asana file.")
+        self.base = urlsplit(base_url or os.environ.get("ASANA_API_BASE") or ASANA_API_BASE)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+        self.stats = {"requests": 0, "retries": 0, "rate_limited": 0, "connections": 0}
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if self.base.scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(self.base.hostname, self.base.port, timeout=self.timeout)
+            self.local.conn = conn
+            self.local.served = False
+            with self.lock:
+                self.connections.append(conn)
+            self.count("connections")
+        return conn
+
+    def connection_reused(self):
+        """True if this thread's connection exists and has already completed a request."""
+        return getattr(self.local, "conn", None) is not None and self.local.served
+
+    def drop_connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+    def close(self):
+        with self.lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections = []
+        self.local = threading.local()
+
+    def retry_delay(self, attempt, retry_after=None):
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            return self.backoff * (2 ** attempt)
+
+    def request(self, method, endpoint, params=None, data=None):
+        """Performs one API call and returns the decoded JSON body. Raises AsanaError."""
+        path = f"{self.base.path.rstrip('/')}/{endpoint.lstrip('/')}"
+        if params:
+            path += "?" + urlencode(params)
+        body = json.dumps(data).encode("utf-8") if data is not None else None
+        headers = {
+            "Authorization": f"Bearer {self.pat}",
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+
+        attempt = 0
+        fresh_retry = True
+        while True:
+            self.count("requests")
+            reused = self.connection_reused()
+            sent = False
+            response = None
+            try:
+                conn = self.connection()
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                raw = response.read()
+                self.local.served = True
+            except (OSError, http.client.HTTPException) as e:
+                self.drop_connection()
+                # The server dropped an idle keep-alive connection: resend once on a new one, whatever the method
+                if reused and fresh_retry and response is None and (not sent or isinstance(e, STALE_CONNECTION_ERRORS)):
+                    fresh_retry = False
+                    self.count("retries")
+                    continue
+                if method in IDEMPOTENT_METHODS and attempt < self.retries:
+                    self.count("retries")
+                    time.sleep(self.retry_delay(attempt))
+                    attempt += 1
+                    continue
+                raise AsanaError(f"{method} {endpoint} failed: {e}") from e
+
+            if response.status == 429 or (response.status >= 500 and method in IDEMPOTENT_METHODS):
+                if attempt < self.retries:
+                    self.count("rate_limited" if response.status == 429 else "retries")
+                    time.sleep(self.retry_delay(attempt, response.getheader("Retry-After")))
+                    attempt += 1
+                    continue
+
+            if response.status >= 400:
+                text = raw.decode("utf-8", "replace")
+                try:
+                    message = "; ".join(err.get("message", "") for err in json.loads(text).get("errors", []))
+                except (ValueError, AttributeError):
+                    message = text
+                raise AsanaError(f"Asana API Error ({response.status}) on {method} {endpoint}: {message}", response.status, text)
+            return json.loads(raw) if raw else {}
+
+    def paginate(self, endpoint, params=None, page_size=DEFAULT_PAGE_SIZE):
+        """Yields every item of a list endpoint, following next_page.offset cursors."""
+        params = dict(params or {}, limit=page_size)
+        while True:
+            page = self.request("GET", endpoint, params)
+            yield from page.get("data", [])
+            next_page = page.get("next_page") or {}
+            if not next_page.get("offset"):
+                return
+            params["offset"] = next_page["offset"]
+
+    def iter_tasks(self, project_id=DEFAULT_PROJECT_ID, opt_fields=TASK_FIELDS, **filters):
+        params = {"project": project_id, "opt_fields": opt_fields}
+        params.update({k: v for k, v in filters.items() if v is not None})
+        return self.paginate("tasks", params)
 
-def list_tasks(project_id=DEFAULT_PROJECT_ID):
-    endpoint = f"tasks?project={project_id}&opt_fields=name,completed,assignee.name"
-    response = asana_request(endpoint)
-    tasks = response.get("data", [])
-    
+    def get_task(self, task_gid, opt_fields=TASK_FIELDS):
+        return self.request("GET", f"tasks/{task_gid}", {"opt_fields": opt_fields}).get("data", {})
+
+    def events(self, resource_gid, sync_token=None):
+        """
+        Returns (events, sync_token) for changes to a resource since sync_token, following has_more.
+        Without a token, or when it has expired (412), events is None and the returned token
+        starts a fresh window: the caller must re-read the resource in full.
+        """
+        events = []
+        while True:
+            params = {"resource": resource_gid}
+            if sync_token:
+                params["sync"] = sync_token
+            try:
+                page = self.request("GET", "events", params)
+            except AsanaError as e:
+                if e.status != 412:
+                    raise
+                try:
+                    return None, json.loads(e.body).get("sync")
+                except (TypeError, ValueError, AttributeError):
+                    raise e
+            events.extend(page.get("data", []))
+            sync_token = page.get("sync") or sync_token
+            if not page.get("has_more"):
+                return events, sync_token
+
+    def create_task(self, fields, project_id=DEFAULT_PROJECT_ID):
+        data = dict(fields, projects=[project_id])
+        return self.request("POST", "tasks", data={"data": data}).get("data", {})
+
+    def update_task(self, task_gid, fields):
+        return self.request("PUT", f"tasks/{task_gid}", data={"data": fields}).get("data", {})
+
+    def bulk_mutate(self, operations, project_id=DEFAULT_PROJECT_ID, workers=DEFAULT_BULK_WORKERS):
+        """
+        Runs [{"gid": ... or None, "fields": {...}}] concurrently: rows with a gid are updates,
+        rows without are creates. Returns one result dict per operation, in input order.
+        """
+        def run(op):
+            try:
+                if op["gid"]:
+                    task = self.update_task(op["gid"], op["fields"])
+                else:
+                    task = self.create_task(op["fields"], project_id)
+                return {"gid": task.get("gid", op["gid"]), "action": "update" if op["gid"] else "create", "error": None}
+            except AsanaError as e:
+                return {"gid": op["gid"], "action": "update" if op["gid"] else "create", "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, operations))
+
+def parse_bool(value):
+    return str(value).strip().lower() in ("true", "1", "yes", "y", "x")
+
+def load_operations(path):
+    """
+    Reads bulk mutations from a .json list or a .csv file. Columns: gid (blank = create),
+    name, notes, assignee, due_on (or due), completed. Blank cells are left untouched.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        rows = json.load(f) if path.endswith(".json") else list(csv.DictReader(f))
+
+    operations = []
+    for row in rows:
+        fields = {}
+        for key, value in row.items():
+            key = (key or "").strip()
+            if key == "gid" or value is None or str(value).strip() == "":
+                continue
+            if key == "due":
+                key = "due_on"
+            fields[key] = parse_bool(value) if key == "completed" else (value.strip() if isinstance(value, str) else value)
+        operations.append({"gid": str(row.get("gid") or "").strip() or None, "fields": fields})
+    return operations
+
+def list_tasks(client, project_id=DEFAULT_PROJECT_ID):
     print(f"\n📋  Style Plan-It Launch Plan Tasks:")
     print("-" * 50)
-    for t in tasks:
+    count = 0
+    for t in client.iter_tasks(project_id):
         status = "[x]" if t.get("completed") else "[ ]"
         assignee = t.get("assignee", {}).get("name", "Unassigned") if t.get("assignee") else "Unassigned"
         print(f"{t['gid']} | {status} {t['name']} ({assignee})")
+        count += 1
     print("-" * 50)
+    print(f"{count} tasks")
 
-def create_task(name, notes="", project_id=DEFAULT_PROJECT_ID, assignee=None, due_on=None):
-    endpoint = "tasks"
-    data = {
-        "data": {
-            "name": name,
-            "notes": notes,
-            "projects": [project_id]
-        }
-    }
+def create_task(client, name, notes="", project_id=DEFAULT_PROJECT_ID, assignee=None, due_on=None):
+    fields = {"name": name, "notes": notes}
     if assignee:
-        data["data"]["assignee"] = assignee
+        fields["assignee"] = assignee
     if due_on:
-        data["data"]["due_on"] = due_on
-        
-    response = asana_request(endpoint, method="POST", data=data)
-    task_gid = response.get("data", {}).get("gid")
+        fields["due_on"] = due_on
+
+    task_gid = client.create_task(fields, project_id).get("gid")
     if task_gid:
         print(f"✅ Task created successfully! GID: {task_gid}")
         return task_gid
     return None
 
-def update_task(task_gid, data):
-    endpoint = f"tasks/{task_gid}"
-    response = asana_request(endpoint, method="PUT", data=data)
-    if response.get("data"):
+def update_task(client, task_gid, fields):
+    task = client.update_task(task_gid, fields)
+    if task:
         print(f"✅ Task {task_gid} updated successfully!")
-        return response.get("data")
+        return task
     return None
 
+def bulk_tasks(client, path, project_id=DEFAULT_PROJECT_ID, workers=DEFAULT_BULK_WORKERS):
+    operations = load_operations(path)
+    start = time.perf_counter()
+    results = client.bulk_mutate(operations, project_id, workers)
+    elapsed = time.perf_counter() - start
+
+    failures = [r for r in results if r["error"]]
+    creates = sum(1 for r in results if r["action"] == "create" and not r["error"])
+    print(f"{'✅' if not failures else '⚠️ '} {len(results) - len(failures)}/{len(results)} mutations applied "
+          f"({creates} created, {len(results) - len(failures) - creates} updated) in {elapsed:.2f}s "
+          f"with {workers} workers, {client.stats['rate_limited']} rate-limit waits")
+    for r in failures:
+        print(f"  ❌ {r['action']} {r['gid'] or ''}: {r['error']}")
+    return not failures
+
 def main():
     parser = argparse.ArgumentParser(description="Style Plan-It Asana Helper Tool")
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-    
+
     # List command
     list_parser = subparsers.add_parser("list", help="List tasks in the project")
     list_parser.add_argument("--project", default=DEFAULT_PROJECT_ID, help="Asana Project GID")
-    
+
     # Create command
     create_parser = subparsers.add_parser("create", help="Create a new task")
     create_parser.add_argument("name", help="Task name")
@@ -119,22 +328,37 @@ def main():
     update_parser.add_argument("gid", help="Task GID")
     update_parser.add_argument("--completed", help="Set completed status (true/false)")
     update_parser.add_argument("--assignee", help="User GID to assign the task to")
-    
+
+    # Bulk command
+    bulk_parser = subparsers.add_parser("bulk", help="Create/update many tasks concurrently from a CSV or JSON file")
+    bulk_parser.add_argument("file", help="CSV/JSON rows: gid (blank = create), name, notes, assignee, due_on, completed")
+    bulk_parser.add_argument("--project", default=DEFAULT_PROJECT_ID, help="Asana Project GID for created tasks")
+    bulk_parser.add_argument("--workers", type=int, default=DEFAULT_BULK_WORKERS, help="Concurrent requests.")
+
     args = parser.parse_args()
-    
-    if args.command == "list":
-        list_tasks(args.project)
-    elif args.command == "create":
-        create_task(args.name, args.notes, args.project, args.assignee, args.due)
-    elif args.command == "update":
-        data = {"data": {}}
-        if args.completed is not None:
-            data["data"]["completed"] = args.completed.lower() == 'true'
-        if args.assignee:
-            data["data"]["assignee"] = args.assignee
-        update_task(args.gid, data)
-    else:
+    if not args.command:
         parser.print_help()
+        return
+
+    try:
+        client = AsanaClient()
+        if args.command == "list":
+            list_tasks(client, args.project)
+        elif args.command == "create":
+            create_task(client, args.name, args.notes, args.project, args.assignee, args.due)
+        elif args.command == "update":
+            fields = {}
+            if args.completed is not None:
+                fields["completed"] = args.completed.lower() == 'true'
+            if args.assignee:
+                fields["assignee"] = args.assignee
+            update_task(client, args.gid, fields)
+        elif args.command == "bulk":
+            if not bulk_tasks(client, args.file, args.project, args.workers):
+                sys.exit(1)
+    except AsanaError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
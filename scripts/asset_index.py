@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import struct
+
+"""
+🖼️ INCREMENTAL ASSETS MANIFEST
+Builds `assets_manifest` ({folder: [images]}) and `assets_meta` ({path: {bytes, width, height, hash}})
+for assets/images. A persisted index of directory mtimes and file stat tuples means only directories
+whose mtime changed are re-listed, and only files whose (size, mtime) changed are re-hashed.
+"""
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, os.pardir))
+ASSETS_ROOT = os.path.join(PROJECT_ROOT, "assets", "images")
+INDEX_PATH = os.path.join(SCRIPT_DIR, ".cache", "assets-index.json")
+INDEX_VERSION = 1
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.gif')
+HASH_LENGTH = 16
+
+def read_image_size(path):
+    """Returns (width, height) from the image header for PNG, GIF, JPEG and WebP, or (None, None)."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(32)
+            if head.startswith(b"\x89PNG\r\n\x1a\n"):
+                return struct.unpack(">II", head[16:24])
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                return struct.unpack("<HH", head[6:10])
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+                chunk = head[12:16]
+                if chunk == b"VP8 ":
+                    f.seek(26)
+                    w, h = struct.unpack("<HH", f.read(4))
+                    return w & 0x3FFF, h & 0x3FFF
+                if chunk == b"VP8L":
+                    b = head[21:25]
+                    w = 1 + (((b[1] & 0x3F) << 8) | b[0])
+                    h = 1 + (((b[3] & 0x0F) << 10) | (b[2] << 2) | ((b[1] & 0xC0) >> 6))
+                    return w, h
+                if chunk == b"VP8X":
+                    f.seek(24)
+                    b = f.read(6)
+                    return 1 + int.from_bytes(b[0:3], "little"), 1 + int.from_bytes(b[3:6], "little")
+            if head[:2] == b"\xff\xd8":
+                return read_jpeg_size(f)
+    except (OSError, struct.error, IndexError):
+        pass
+    return None, None
+
+def read_jpeg_size(f):
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None, None
+        code = marker[1]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+        length = struct.unpack(">H", f.read(2))[0]
+        # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            f.read(1)
+            h, w = struct.unpack(">HH", f.read(4))
+            return w, h
+        f.seek(length - 2, os.SEEK_CUR)
+
+def hash_file(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()[:HASH_LENGTH]
+
+def describe_image(path, st):
+    width, height = read_image_size(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "width": width, "height": height, "hash": hash_file(path)}
+
+def load_index(index_path=INDEX_PATH):
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION:
+            return index
+    except (OSError, ValueError):
+        pass
+    return {"version": INDEX_VERSION, "dirs": {}}
+
+def save_index(index, index_path=INDEX_PATH):
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    tmp_path = f"{index_path}.tmp{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path)
+
+def list_dir(abs_dir):
+    subdirs, images = [], []
+    with os.scandir(abs_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.name)
+            elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                images.append(entry.name)
+    return sorted(subdirs), sorted(images)
+
+def scan_tree(assets_root, old_dirs, stats):
+    """Walks assets_root reusing unchanged directory listings and file metadata from old_dirs."""
+    new_dirs = {}
+    pending = ["."]
+    while pending:
+        rel = pending.pop()
+        abs_dir = assets_root if rel == "." else os.path.join(assets_root, rel)
+        try:
+            dir_mtime = os.stat(abs_dir).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        cached = old_dirs.get(rel)
+        if cached and cached["mtime_ns"] == dir_mtime:
+            subdirs, images = cached["subdirs"], list(cached["files"])
+        else:
+            subdirs, images = list_dir(abs_dir)
+            stats["dirs_rescanned"] += 1
+        cached_files = cached["files"] if cached else {}
+
+        files = {}
+        for name in images:
+            path = os.path.join(abs_dir, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            prev = cached_files.get(name)
+            if prev and prev["size"] == st.st_size and prev["mtime_ns"] == st.st_mtime_ns:
+                files[name] = prev
+            else:
+                files[name] = describe_image(path, st)
+                stats["files_hashed"] += 1
+        new_dirs[rel] = {"mtime_ns": dir_mtime, "subdirs": subdirs, "files": files}
+        pending.extend(sub if rel == "." else f"{rel}/{sub}" for sub in subdirs)
+    return new_dirs
+
+def build_assets_manifest(assets_root=ASSETS_ROOT, index_path=INDEX_PATH, use_index=True):
+    """
+    Returns (assets_manifest, assets_meta, stats).
+    assets_manifest keeps the {folder: [sorted image names]} shape the JS features read;
+    assets_meta maps "folder/image" paths to {bytes, width, height, hash}.
+    """
+    stats = {"dirs_rescanned": 0, "files_hashed": 0}
+    if not os.path.exists(assets_root):
+        return {}, {}, stats
+
+    old_dirs = load_index(index_path)["dirs"] if use_index else {}
+    dirs = scan_tree(assets_root, old_dirs, stats)
+    if use_index:
+        save_index({"version": INDEX_VERSION, "dirs": dirs}, index_path)
+
+    manifest, meta = {}, {}
+    for rel in sorted(dirs):
+        files = dirs[rel]["files"]
+        if not files:
+            continue
+        folder_key = "root" if rel == "." else rel
+        manifest[folder_key] = sorted(files)
+        for name in manifest[folder_key]:
+            info = files[name]
+            path = name if rel == "." else f"{rel}/{name}"
+            meta[path] = {"bytes": info["size"], "width": info["width"], "height": info["height"], "hash": info["hash"]}
+    return manifest, meta, stats
+
+def print_scan_report(stats, manifest):
+    image_count = sum(len(images) for images in manifest.values())
+    print(f"  🖼️  Assets: {image_count} images in {len(manifest)} folders "
+          f"({stats['dirs_rescanned']} dirs rescanned, {stats['files_hashed']} files hashed)")
@@ -0,0 +1,261 @@
+import asyncio
+import email.utils
+import mimetypes
+import os
+import sys
+from urllib.parse import urlsplit
+
+import dev_server
+
+"""
+⚡ ASYNCIO DEV SERVER MODE (python3 scripts/dev_server.py --async)
+Single-threaded HTTP/1.1 server with keep-alive, zero-copy file bodies (os.sendfile via
+loop.sendfile), an in-memory cache for small hot files (components, CSS, JS, JSON) and a
+bounded number of in-flight requests. Routing, ETags, compression and ranges share the
+helpers and ResponseCache of the threaded CleanURLHandler.
+"""
+
+MAX_CONCURRENT_REQUESTS = 64
+KEEPALIVE_TIMEOUT = 15
+MAX_HEADER_LINES = 100
+HOT_FILE_MAX_BYTES = 256 * 1024
+HOT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+HOT_EXTENSIONS = (".html", ".css", ".js", ".json", ".svg")
+
+STATUS_TEXT = {200: "OK", 206: "Partial Content", 301: "Moved Permanently", 304: "Not Modified",
+               400: "Bad Request", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+               416: "Range Not Satisfiable", 500: "Internal Server Error"}
+
+class HotFileCache:
+    """Small-file bodies keyed by path and validated against (mtime_ns, size) on every hit."""
+    def __init__(self, max_bytes=HOT_CACHE_MAX_BYTES):
+        self.entries = {}
+        self.total_bytes = 0
+        self.max_bytes = max_bytes
+
+    def get(self, path, st):
+        entry = self.entries.get(path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        with open(path, "rb") as f:
+            body = f.read()
+        if entry:
+            self.total_bytes -= len(entry[2])
+        if self.total_bytes + len(body) <= self.max_bytes:
+            self.entries[path] = (st.st_mtime_ns, st.st_size, body)
+            self.total_bytes += len(body)
+        return body
+
+def guess_type(path):
+    ctype, _ = mimetypes.guess_type(path)
+    if ctype is None:
+        return "application/octet-stream"
+    if ctype.startswith("text/") or ctype in ("application/javascript", "application/json"):
+        return f"{ctype}; charset=utf-8"
+    return ctype
+
+class AsyncDevServer:
+    def __init__(self, root, max_concurrent=MAX_CONCURRENT_REQUESTS, cache=None):
+        self.root = root
+        # Passed in by dev_server.start_server: run as a script, its RESPONSE_CACHE lives in __main__, not dev_server
+        self.cache = cache or dev_server.RESPONSE_CACHE
+        self.hot_files = HotFileCache()
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def handle_connection(self, reader, writer):
+        peer = writer.get_extra_info("peername")
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, ConnectionError):
+                    break
+                if not request_line:
+                    break
+                headers = await self.read_headers(reader)
+                if headers is None:
+                    break
+                if self.is_event_stream(request_line):
+                    # Long-lived: must not hold one of the request semaphore's slots
+                    await self.stream_events(writer)
+                    break
+                async with self.semaphore:
+                    keep_alive = await self.respond(request_line.decode("latin-1").strip(), headers, writer, peer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def is_event_stream(self, request_line):
+        hub = self.cache.live_reload
+        parts = request_line.decode("latin-1").split()
+        return bool(hub) and len(parts) == 3 and parts[0] == "GET" and urlsplit(parts[1]).path == hub.path
+
+    async def stream_events(self, writer):
+        """Server-Sent Events stream of dev_watch reload batches; events arrive from the watcher thread."""
+        hub = self.cache.live_reload
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def send(payload):
+            loop.call_soon_threadsafe(events.put_nowait, payload)
+
+        await self.send(writer, 200, [("Content-Type", "text/event-stream"), ("Cache-Control", "no-cache")], False,
+                        b"retry: 1000\n\n")
+        hub.subscribe(send)
+        try:
+            while not writer.is_closing():
+                try:
+                    payload = await asyncio.wait_for(events.get(), hub.keepalive)
+                except asyncio.TimeoutError:
+                    payload = b": ping\n\n"
+                writer.write(payload)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            hub.unsubscribe(send)
+
+    async def read_headers(self, reader):
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if not line:
+                return None
+            if line in (b"\r\n", b"\n"):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return None
+
+    def wants_keep_alive(self, version, headers):
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            return connection != "close"
+        return connection == "keep-alive"
+
+    async def send(self, writer, status, headers, keep_alive, body=b""):
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+                 f"Date: {email.utils.formatdate(usegmt=True)}",
+                 "Server: StylePlanit-Async",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines.extend(f"{k}: {v}" for k, v in headers)
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def send_error(self, writer, status, keep_alive):
+        body = f"{status} {STATUS_TEXT.get(status, '')}\n".encode()
+        await self.send(writer, status, [("Content-Type", "text/plain"), ("Content-Length", str(len(body)))], keep_alive, body)
+
+    async def respond(self, request_line, headers, writer, peer):
+        parts = request_line.split()
+        if len(parts) != 3:
+            await self.send_error(writer, 400, False)
+            return False
+        method, target, version = parts
+        # Request bodies (e.g. a POST answered with 405) are never read, so they would be parsed as
+        # the next request: such a connection is closed after the response
+        has_body = headers.get("content-length", "0") not in ("", "0") or "transfer-encoding" in headers
+        keep_alive = self.wants_keep_alive(version, headers) and not has_body
+        try:
+            status = await self.serve_file(method, target, headers, writer, keep_alive)
+        except ConnectionError:
+            raise
+        except OSError as e:
+            # An unreadable file (permissions, I/O error) fails before any header was sent
+            status, keep_alive = 403 if isinstance(e, PermissionError) else 500, False
+            await self.send_error(writer, status, keep_alive)
+        sys.stderr.write(f'{peer[0] if peer else "-"} - - "{request_line}" {status}\n')
+        return keep_alive
+
+    async def serve_file(self, method, target, headers, writer, keep_alive):
+        """Sends the response for one request and returns its status code."""
+        if method not in ("GET", "HEAD"):
+            await self.send_error(writer, 405, keep_alive)
+            return 405
+        head_only = method == "HEAD"
+        url_path = urlsplit(target).path
+
+        path = self.cache.resolve(self.root, url_path)
+        if os.path.isdir(path):
+            if not url_path.endswith("/"):
+                await self.send(writer, 301, [("Location", url_path + "/"), ("Content-Length", "0")], keep_alive)
+                return 301
+            path = os.path.join(path, "index.html")
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.cache.forget(url_path)
+            await self.send_error(writer, 404, keep_alive)
+            return 404
+
+        ctype = guess_type(path)
+        live_reload = self.cache.live_reload if path.endswith(".html") else None
+        encoding = None if live_reload else dev_server.choose_encoding(headers.get("accept-encoding"), ctype, st.st_size)
+        etag = self.cache.etag(path, st)
+        if encoding:
+            etag = f'{etag[:-1]}-{encoding}"'
+        elif live_reload:
+            etag = f'{etag[:-1]}-live"'
+        common = [("ETag", etag), ("Cache-Control", dev_server.cache_control_for(path))]
+
+        if dev_server.etag_matches(headers.get("if-none-match"), etag):
+            await self.send(writer, 304, common, keep_alive)
+            return 304
+
+        common += [("Content-Type", ctype), ("Last-Modified", email.utils.formatdate(st.st_mtime, usegmt=True)),
+                   ("Accept-Ranges", "bytes")]
+        if ctype.startswith(dev_server.COMPRESSIBLE_TYPES):
+            common.append(("Vary", "Accept-Encoding"))
+
+        if live_reload:
+            body = live_reload.inject(self.hot_files.get(path, st))
+            common.append(("Content-Length", str(len(body))))
+            await self.send(writer, 200, common, keep_alive, b"" if head_only else body)
+            return 200
+
+        if encoding:
+            body = self.cache.encoded_body(path, st, encoding)
+            common += [("Content-Encoding", encoding), ("Content-Length", str(len(body)))]
+            await self.send(writer, 200, common, keep_alive, b"" if head_only else body)
+            return 200
+
+        start, end, status = 0, st.st_size - 1, 200
+        if headers.get("range") and headers.get("if-range", etag) == etag:
+            byte_range = dev_server.parse_range(headers["range"], st.st_size)
+            if byte_range == "invalid":
+                await self.send(writer, 416, [("Content-Range", f"bytes */{st.st_size}"), ("Content-Length", "0")], keep_alive)
+                return 416
+            if byte_range:
+                (start, end), status = byte_range, 206
+                common.append(("Content-Range", f"bytes {start}-{end}/{st.st_size}"))
+        length = end - start + 1
+        common.append(("Content-Length", str(length)))
+
+        if head_only:
+            await self.send(writer, status, common, keep_alive)
+        elif status == 200 and st.st_size <= HOT_FILE_MAX_BYTES and path.endswith(HOT_EXTENSIONS):
+            await self.send(writer, status, common, keep_alive, self.hot_files.get(path, st))
+        else:
+            # Opened before the headers go out, so an unreadable file can still get an error response
+            with open(path, "rb") as f:
+                await self.send(writer, status, common, keep_alive)
+                if length:
+                    try:
+                        # Zero-copy via os.sendfile on plain sockets; asyncio falls back to buffered reads otherwise
+                        await asyncio.get_running_loop().sendfile(writer.transport, f, start, length)
+                    except ConnectionError:
+                        raise
+                    except OSError as e:
+                        # Headers are already out: a failed read can only drop the connection
+                        raise ConnectionAbortedError(f"reading {path} failed: {e}") from e
+        return status
+
+async def serve(port, root, on_ready=None, cache=None):
+    server = AsyncDevServer(root, cache=cache)
+    async with await asyncio.start_server(server.handle_connection, "", port, backlog=256) as aio_server:
+        if on_ready:
+            on_ready()
+        await aio_server.serve_forever()
@@ -0,0 +1,113 @@
+import argparse
+import csv
+import gc
+import http.server
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.request
+
+import data_utils
+
+"""
+⏱️ CSV INGESTION MEMORY BENCHMARK
+Serves a large synthetic CSV from a local HTTP server and compares peak Python
+heap usage (tracemalloc) of three ingestion strategies:
+  legacy     - read() + decode() the whole body, then DictReader into a list
+  streaming  - data_utils.fetch_tab: incremental decode, rows + fingerprints in one pass
+  lazy       - data_utils.open_csv_stream: rows fingerprinted as they arrive, never materialized
+"""
+
+HEADERS = ["category", "title", "short_description", "long_description", "image_url", "footer"]
+
+def write_synthetic_csv(path, rows, seed=11):
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        for i in range(rows):
+            writer.writerow([
+                rng.choice(["Establish", "Elevate"]),
+                f"Service {i}",
+                f"Short description {rng.random():.8f}",
+                "\n".join(" ".join(f"word{rng.randint(0, 999)}" for _ in range(15)) for _ in range(3)),
+                f"assets/images/services-by-category/Elevate/img_{i}.jpg",
+                "Body Shape Analysis, Color Analysis"
+            ])
+
+def start_csv_server(csv_path):
+    class CSVHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv; charset=utf-8")
+            self.send_header("Content-Length", str(os.path.getsize(csv_path)))
+            self.end_headers()
+            with open(csv_path, "rb") as f:
+                shutil.copyfileobj(f, self.wfile)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), CSVHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+
+def legacy_ingest(base_url):
+    with urllib.request.urlopen(data_utils.build_csv_url("bench", "0", base_url)) as response:
+        csv_text = response.read().decode("utf-8")
+    rows = []
+    for row in csv.DictReader(io.StringIO(csv_text)):
+        rows.append({k.strip(): data_utils.normalize_value(v) for k, v in row.items()})
+    return len(rows)
+
+def streaming_ingest(base_url):
+    result = data_utils.fetch_tab("bench", "bench", "0", base_url=base_url, retries=0)
+    return len(result["rows"])
+
+def lazy_ingest(base_url):
+    response, rows = data_utils.open_csv_stream("bench", "0", base_url=base_url)
+    with response:
+        digests = [data_utils.row_digest(row) for row in rows]
+    data_utils.combine_digests(digests)
+    return len(digests)
+
+def measure(name, fn, base_url):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn(base_url)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<10} {count:>8} rows  peak {peak / 1024 / 1024:8.1f} MiB  {elapsed:6.2f}s")
+    return {"strategy": name, "rows": count, "peak_bytes": peak, "seconds": round(elapsed, 3)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark peak memory of CSV ingestion strategies.")
+    parser.add_argument("--rows", type=int, default=100000, help="Rows in the synthetic CSV.")
+    parser.add_argument("--json", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "bench.csv")
+        write_synthetic_csv(csv_path, args.rows)
+        print(f"⏱️  CSV ingestion benchmark ({os.path.getsize(csv_path) / 1024 / 1024:.1f} MiB, {args.rows} rows)")
+        httpd, base_url = start_csv_server(csv_path)
+        try:
+            results = [measure(name, fn, base_url) for name, fn in
+                       (("legacy", legacy_ingest), ("streaming", streaming_ingest), ("lazy", lazy_ingest))]
+        finally:
+            httpd.shutdown()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
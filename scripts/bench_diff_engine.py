@@ -0,0 +1,101 @@
+import argparse
+import json
+import random
+import time
+
+import diff_engine
+
+"""
+⏱️ DIFF ENGINE BENCHMARK
+Times diff_engine.diff_category on synthetic services-shaped categories
+(default 10k and 100k rows) with a small share of mismatched, local-only and
+sheet-only rows. --legacy also times the previous list-based key merge and
+per-key discrepancy scan (quadratic; only practical up to ~10k rows).
+"""
+
+HEADERS = ["category", "title", "short_description", "long_description", "image_url", "footer"]
+KEY_FIELDS = ["title", "category"]
+
+def make_rows(count, seed):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        rows.append({
+            "category": rng.choice(["Establish", "Elevate", "Icon Service"]),
+            "title": f"Service {i:07d}",
+            "short_description": f"Short description {rng.random():.6f}",
+            "long_description": " ".join(f"word{rng.randint(0, 999)}" for _ in range(40)),
+            "image_url": f"assets/images/services-by-category/Elevate/img_{i}.jpg",
+            "footer": "Body Shape Analysis, Color Analysis, Lookbook Curation"
+        })
+    return rows
+
+def make_dataset(count, change_ratio=0.01, seed=7):
+    """Returns (local, remote) with ~change_ratio mismatches, local-only and sheet-only rows each."""
+    rng = random.Random(seed)
+    local = make_rows(count, seed)
+    remote = [dict(row) for row in local]
+    changes = max(1, int(count * change_ratio))
+    for i in rng.sample(range(count), changes):
+        remote[i]["short_description"] = "Edited in Sheets"
+    del remote[-changes:]
+    remote.extend(make_rows(changes, seed + 1))
+    for row in remote[-changes:]:
+        row["title"] = "New " + row["title"]
+    rng.shuffle(remote)
+    return local, remote
+
+def legacy_diff(local_map, remote_map, headers):
+    """The previous algorithm: list membership for the key merge and a linear scan per key."""
+    all_keys = list(local_map.keys())
+    for k in remote_map.keys():
+        if k not in all_keys: all_keys.append(k)
+    discrepancies = []
+    for ckey in all_keys:
+        local_item, remote_item = local_map.get(ckey), remote_map.get(ckey)
+        if local_item and remote_item:
+            if any(local_item[h] != remote_item[h] for h in headers):
+                discrepancies.append({"ckey": ckey})
+        else:
+            discrepancies.append({"ckey": ckey})
+    for ckey in all_keys:
+        next((item for item in discrepancies if item["ckey"] == ckey), None)
+
+def bench(sizes, legacy=False, legacy_limit=20000):
+    results = []
+    for size in sizes:
+        local, remote = make_dataset(size)
+        start = time.perf_counter()
+        report = diff_engine.diff_category("services", local, remote, KEY_FIELDS)
+        elapsed = time.perf_counter() - start
+        entry = {"rows": size, "seconds": round(elapsed, 4), "rows_per_second": int(size / elapsed),
+                 "discrepancies": report["discrepancy_count"]}
+
+        if legacy and size <= legacy_limit:
+            local_map = diff_engine.index_rows(local, HEADERS, KEY_FIELDS)
+            remote_map = diff_engine.index_rows(remote, HEADERS, KEY_FIELDS)
+            start = time.perf_counter()
+            legacy_diff(local_map, remote_map, HEADERS)
+            entry["legacy_seconds"] = round(time.perf_counter() - start, 4)
+        results.append(entry)
+
+        legacy_note = f" | legacy {entry['legacy_seconds']:.2f}s" if "legacy_seconds" in entry else ""
+        print(f"  {size:>7} rows: {elapsed:.3f}s ({entry['rows_per_second']:,} rows/s, "
+              f"{entry['discrepancies']} discrepancies){legacy_note}")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the keyed diff engine on synthetic categories.")
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated row counts.")
+    parser.add_argument("--legacy", action="store_true", help="Also time the previous quadratic algorithm (sizes up to 20k).")
+    parser.add_argument("--json", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    print("⏱️  Diff engine benchmark")
+    results = bench([int(s) for s in args.sizes.split(",")], legacy=args.legacy)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
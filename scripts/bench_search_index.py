@@ -0,0 +1,96 @@
+import argparse
+import gzip
+import json
+import random
+import time
+
+import search_index
+import site_shards
+
+"""
+⏱️ SEARCH INDEX BENCHMARK
+Builds synthetic article sets of increasing size and compares, per query:
+  scan   - what the client did without an index: lowercase every article's title, category
+           and body and test each query word against it (linear in content size)
+  index  - search_index.SearchIndex.search over the shard built at sync time
+Also reports the build time and the minified / gzipped size of the search shard.
+"""
+
+CATEGORIES = ["Authenticity", "Colour", "Wardrobe", "Career", "Confidence", "Travel"]
+WORDS = ["style", "colour", "wardrobe", "fabric", "silhouette", "tailoring", "palette", "confidence",
+         "capsule", "closet", "layering", "texture", "occasion", "interview", "season", "shopping",
+         "accessories", "footwear", "denim", "linen", "budget", "identity", "presence", "fitting"]
+
+def synthetic_articles(count, seed=7):
+    rng = random.Random(seed)
+    vocabulary = WORDS + [f"term{i}" for i in range(2000)]
+    articles = []
+    for i in range(count):
+        paragraphs = ("<p>" + " ".join(rng.choice(vocabulary) for _ in range(60)) + "</p>" for _ in range(8))
+        articles.append({
+            "title": f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} guide {i}",
+            "category": rng.choice(CATEGORIES),
+            "content": "".join(paragraphs),
+            "read_time": "5 min",
+        })
+    return articles
+
+def synthetic_queries(count, seed=3):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        words = rng.sample(WORDS, rng.choice([1, 1, 2]))
+        if rng.random() < 0.3:
+            words[-1] = words[-1][:4]  # as-you-type prefix
+        queries.append(" ".join(words))
+    return queries
+
+def scan_search(articles, query):
+    words = query.lower().split()
+    hits = []
+    for position, article in enumerate(articles):
+        text = " ".join((article["title"], article["category"], article["content"])).lower()
+        if all(word in text for word in words):
+            hits.append(position)
+    return hits
+
+def timed(fn, queries):
+    start = time.perf_counter()
+    hits = sum(len(fn(query)) for query in queries)
+    return (time.perf_counter() - start) / len(queries), hits / len(queries)
+
+def bench(size, queries):
+    data = {"articles": synthetic_articles(size), "services": []}
+    start = time.perf_counter()
+    index = search_index.build_search_index(data)
+    build = time.perf_counter() - start
+    body = site_shards.minified_json(index)
+    engine = search_index.SearchIndex(index)
+
+    scan, scan_hits = timed(lambda q: scan_search(data["articles"], q), queries)
+    indexed, index_hits = timed(lambda q: engine.search(q, limit=size), queries)
+    print(f"  {size:>6} articles  build {build * 1000:8.1f} ms  shard {len(body) / 1024:8.1f} KB"
+          f" ({len(gzip.compress(body)) / 1024:7.1f} KB gz)  {len(index['terms']):>5} terms  "
+          f"scan {scan * 1e6:10.1f} µs  index {indexed * 1e6:8.1f} µs  ({scan / indexed:6.1f}x)")
+    return {"articles": size, "build_ms": round(build * 1000, 2), "shard_bytes": len(body),
+            "shard_gzip_bytes": len(gzip.compress(body)), "terms": len(index["terms"]),
+            "scan_us": round(scan * 1e6, 1), "index_us": round(indexed * 1e6, 1),
+            "scan_hits": round(scan_hits, 1), "index_hits": round(index_hits, 1)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the search index against a linear scan.")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated article counts.")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per size.")
+    parser.add_argument("--json", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    queries = synthetic_queries(args.queries)
+    print(f"⏱️  Search index benchmark ({args.queries} queries per size)")
+    results = [bench(int(size), queries) for size in args.sizes.split(",")]
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+import page_graph
+
+"""
+⏱️ DEV SERVER PAGE-LOAD BENCHMARK
+Replays each page's real request fan-out (page_graph: HTML + assets, site-data.json,
+component levels, feature scripts, images) wave by wave, as loader.js does, from
+--concurrency simulated browsers. Each browser uses up to --connections keep-alive
+connections like a real one. Reports p50/p95/p99 request and page-load latency,
+throughput and bytes transferred, and writes JSON results that --compare can diff.
+Starts dev_server.py itself in each --mode, or benchmarks an already running --url.
+--prerendered replays the build/ pages from scripts/prerender.py (no component waves).
+"""
+
+BROWSER_HEADERS = {"Accept-Encoding": "gzip, deflate, br", "User-Agent": "styleplanit-bench"}
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def latency_summary(seconds):
+    return {f"p{p}_ms": round(percentile(seconds, p) * 1000, 2) for p in (50, 95, 99)}
+
+class Browser:
+    """One simulated browser: a small pool of persistent connections to the server."""
+    def __init__(self, host, port, connections):
+        self.host, self.port = host, port
+        self.idle = [http.client.HTTPConnection(host, port, timeout=30) for _ in range(connections)]
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=connections)
+
+    def fetch(self, path):
+        with self.lock:
+            conn = self.idle.pop()
+        start = time.perf_counter()
+        try:
+            conn.request("GET", "/" + quote(path), headers=BROWSER_HEADERS)
+            response = conn.getresponse()
+            size = len(response.read())
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            size, status = 0, 0
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.idle.append(conn)
+        return {"path": path, "status": status, "bytes": size, "seconds": elapsed}
+
+    def load_page(self, graph):
+        start = time.perf_counter()
+        results = []
+        for wave in graph["waves"]:
+            results.extend(self.pool.map(self.fetch, wave))
+        return time.perf_counter() - start, results
+
+    def close(self):
+        self.pool.shutdown()
+        for conn in self.idle:
+            conn.close()
+
+def run_benchmark(base_url, graphs, concurrency, iterations, connections):
+    """Each of `concurrency` browsers loads every page `iterations` times. Returns the results dict."""
+    parts = urlsplit(base_url)
+    host, port = parts.hostname, parts.port or 80
+    page_times = {page: [] for page in graphs}
+    requests = []
+    lock = threading.Lock()
+
+    def browse(_):
+        browser = Browser(host, port, connections)
+        try:
+            for _ in range(iterations):
+                for page, graph in graphs.items():
+                    elapsed, results = browser.load_page(graph)
+                    with lock:
+                        page_times[page].append(elapsed)
+                        requests.extend(results)
+        finally:
+            browser.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(browse, range(concurrency)))
+    wall = time.perf_counter() - start
+
+    total_bytes = sum(r["bytes"] for r in requests)
+    errors = [r for r in requests if r["status"] not in (200, 206, 304)]
+    return {
+        "url": base_url,
+        "concurrency": concurrency,
+        "iterations": iterations,
+        "connections": connections,
+        "wall_seconds": round(wall, 3),
+        "requests": len(requests),
+        "errors": len(errors),
+        "error_paths": sorted({r["path"] for r in errors})[:20],
+        "requests_per_second": round(len(requests) / wall, 1),
+        "bytes": total_bytes,
+        "mib_per_second": round(total_bytes / wall / 1024 / 1024, 2),
+        "request_latency": latency_summary([r["seconds"] for r in requests]),
+        "pages": {page: dict(latency_summary(times), loads=len(times),
+                             requests=sum(len(w) for w in graphs[page]["waves"]), waves=len(graphs[page]["waves"]))
+                  for page, times in page_times.items()}
+    }
+
+def print_results(label, results):
+    lat = results["request_latency"]
+    print(f"\n📊 {label}: {results['requests']} requests in {results['wall_seconds']}s "
+          f"({results['requests_per_second']} req/s, {results['mib_per_second']} MiB/s, "
+          f"{results['bytes'] / 1024 / 1024:.1f} MiB, {results['errors']} errors)")
+    print(f"  request latency  p50 {lat['p50_ms']:.1f}ms  p95 {lat['p95_ms']:.1f}ms  p99 {lat['p99_ms']:.1f}ms")
+    for page, stats in results["pages"].items():
+        print(f"  {page:<16} {stats['requests']:>3} req / {stats['waves']} waves  page load "
+              f"p50 {stats['p50_ms']:.1f}ms  p95 {stats['p95_ms']:.1f}ms  p99 {stats['p99_ms']:.1f}ms")
+    if results["errors"]:
+        print(f"  ⚠️  Failed paths: {', '.join(results['error_paths'])}")
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_for_port(port, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+def start_dev_server(mode, prerendered=None):
+    port = free_port()
+    cmd = [sys.executable, os.path.join(os.path.dirname(__file__), "dev_server.py"), str(port)]
+    if mode == "async":
+        cmd.append("--async")
+    if prerendered:
+        cmd.extend(["--prerendered", prerendered])
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+    if not wait_for_port(port):
+        proc.kill()
+        raise RuntimeError(f"dev_server.py ({mode}) did not start on port {port}")
+    return proc, f"http://127.0.0.1:{port}"
+
+def compare(baseline, candidate):
+    """Prints p50/p95/p99 and throughput deltas between two result sets, per server mode."""
+    for mode in candidate:
+        if mode not in baseline:
+            continue
+        old, new = baseline[mode], candidate[mode]
+        print(f"\n🔁 {mode}: baseline → candidate")
+        rows = [("req/s", old["requests_per_second"], new["requests_per_second"])]
+        rows += [(f"request {k}", old["request_latency"][k], new["request_latency"][k]) for k in ("p50_ms", "p95_ms", "p99_ms")]
+        rows += [(f"{page} p95_ms", old["pages"][page]["p95_ms"], new["pages"][page]["p95_ms"])
+                 for page in new["pages"] if page in old["pages"]]
+        for name, a, b in rows:
+            change = f"{(b - a) / a * 100:+.1f}%" if a else "n/a"
+            print(f"  {name:<26} {a:>10} → {b:<10} {change}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dev_server.py by replaying per-page request fan-out.")
+    parser.add_argument("--mode", choices=["threaded", "async", "both"], default="both",
+                        help="Server mode(s) to start and benchmark (ignored with --url).")
+    parser.add_argument("--url", help="Benchmark an already running server instead of starting one.")
+    parser.add_argument("--pages", help="Comma-separated pages (default: every top-level page).")
+    parser.add_argument("--concurrency", type=int, default=8, help="Simulated browsers loading pages at once.")
+    parser.add_argument("--iterations", type=int, default=5, help="Times each browser loads every page.")
+    parser.add_argument("--connections", type=int, default=6, help="Parallel connections per browser.")
+    parser.add_argument("--prerendered", nargs="?", const="build", metavar="DIR",
+                        help="Benchmark the prerendered pages (default build/); starts the server with --prerendered.")
+    parser.add_argument("--json", help="Write results as JSON to this path.")
+    parser.add_argument("--compare", metavar="BASELINE_JSON", help="Print deltas against a previous --json result.")
+    args = parser.parse_args()
+
+    page_root = os.path.abspath(os.path.join(page_graph.PROJECT_ROOT, args.prerendered)) if args.prerendered else None
+    graphs = page_graph.all_page_graphs(pages=args.pages.split(",") if args.pages else None, page_root=page_root)
+    print(f"⏱️  Page-load benchmark: {len(graphs)} pages, concurrency {args.concurrency}, "
+          f"{args.iterations} iterations, {args.connections} connections/browser")
+
+    all_results = {}
+    modes = ["external"] if args.url else (["threaded", "async"] if args.mode == "both" else [args.mode])
+    for mode in modes:
+        proc = None
+        base_url = args.url
+        if not base_url:
+            proc, base_url = start_dev_server(mode, page_root)
+        try:
+            run_benchmark(base_url, graphs, 1, 1, args.connections)  # warm-up: caches, compressed bodies
+            all_results[mode] = run_benchmark(base_url, graphs, args.concurrency, args.iterations, args.connections)
+        finally:
+            if proc:
+                proc.terminate()
+                proc.wait()
+        print_results(mode, all_results[mode])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(all_results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), all_results)
+
+if __name__ == "__main__":
+    main()
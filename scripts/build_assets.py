@@ -0,0 +1,200 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+import data_utils
+import page_graph
+
+"""
+🏷️ FINGERPRINTED STATIC ASSETS
+Copies js/, js/features/ and styles/ into dist/ under content-hashed names
+(dist/js/features/hero.<hash>.js) and writes dist/asset-manifest.json, which js/loader.js
+reads to load feature scripts. Hashed names never change, so the dev server (and any CDN)
+can serve them as immutable; only the small manifest is revalidated.
+CSS @import targets are rewritten to their hashed names and relative url()s are re-based.
+--minify strips comments and indentation, --bundle concatenates each page's feature
+scripts into dist/bundles/<page>.<hash>.js, and --check exits 1 if dist/ is stale.
+"""
+
+DIST_DIR = os.path.join(page_graph.PROJECT_ROOT, "dist")
+MANIFEST_NAME = "asset-manifest.json"
+# dist/ subdirectories owned by other build steps (scripts/build_css.py); never pruned here
+FOREIGN_DIRS = ["css"]
+SOURCE_DIRS = ["js", "js/features", "styles"]
+SOURCE_EXTENSIONS = (".js", ".css")
+HASH_LENGTH = 10
+
+# @import url('x.css'), @import 'x.css' and plain url(...) references
+CSS_REF = re.compile(r"""(@import\s+)?(?:url\(\s*(['"]?)([^'")]+)\2\s*\)|(?<=@import )(['"])([^'"]+)\4)""")
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+CSS_SPACE_AROUND = re.compile(r"\s*([{};,])\s*")
+
+def list_sources(root=page_graph.PROJECT_ROOT):
+    sources = []
+    for rel_dir in SOURCE_DIRS:
+        abs_dir = os.path.join(root, rel_dir)
+        if not os.path.isdir(abs_dir):
+            continue
+        for name in sorted(os.listdir(abs_dir)):
+            if name.endswith(SOURCE_EXTENSIONS) and os.path.isfile(os.path.join(abs_dir, name)):
+                sources.append(f"{rel_dir}/{name}")
+    return sources
+
+def fingerprinted_path(rel_path, body):
+    stem, ext = os.path.splitext(rel_path)
+    return f"dist/{stem}.{hashlib.sha256(body).hexdigest()[:HASH_LENGTH]}{ext}"
+
+def is_relative_url(url):
+    return not re.match(r"^(?:[a-z]+:|/|#)", url, re.I)
+
+def minify_js(text):
+    """
+    Conservative: drops whole-line // comments, line-leading /* */ blocks and indentation; keeps line breaks (ASI).
+    Only the comment span is dropped: code after a closing */ on the same line is kept.
+    """
+    lines, in_block = [], False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if in_block:
+            if "*/" not in stripped:
+                continue
+            in_block = False
+            stripped = stripped.split("*/", 1)[1].strip()
+        while stripped.startswith("/*"):
+            if "*/" not in stripped[2:]:
+                in_block, stripped = True, ""
+                break
+            stripped = stripped[2:].split("*/", 1)[1].strip()
+        if not stripped or stripped.startswith("//"):
+            continue
+        lines.append(stripped)
+    return "\n".join(lines) + "\n"
+
+def minify_css(text):
+    text = CSS_COMMENT.sub("", text)
+    text = re.sub(r"\s+", " ", text)
+    return CSS_SPACE_AROUND.sub(r"\1", text).replace(";}", "}").strip() + "\n"
+
+def render_css(rel_path, text, resolve):
+    """Rewrites @import targets to hashed names (via resolve) and re-bases relative url()s for dist/."""
+    src_dir = os.path.dirname(rel_path)
+    out_dir = os.path.join("dist", src_dir)
+
+    def rewrite(match):
+        url = match.group(3) or match.group(5)
+        if not is_relative_url(url):
+            return match.group(0)
+        target = os.path.normpath(os.path.join(src_dir, url)).replace(os.sep, "/")
+        if match.group(1) or match.group(5):
+            hashed = resolve(target)
+            if hashed is None:
+                return match.group(0)
+            return f"{match.group(1) or ''}url('{os.path.relpath(hashed, out_dir).replace(os.sep, '/')}')"
+        quote = match.group(2)
+        return f"url({quote}{os.path.relpath(target, out_dir).replace(os.sep, '/')}{quote})"
+
+    return CSS_REF.sub(rewrite, text)
+
+def plan_assets(root=page_graph.PROJECT_ROOT, minify=False, bundle=False):
+    """Returns (manifest, outputs{dist_rel_path: bytes}) without touching the filesystem."""
+    sources = list_sources(root)
+    files, outputs = {}, {}
+
+    def resolve(rel_path):
+        if rel_path in files:
+            return files[rel_path]
+        if rel_path not in sources:
+            return None
+        files[rel_path] = None  # guards against @import cycles
+        text = page_graph.read_text(rel_path, root)
+        if rel_path.endswith(".css"):
+            text = render_css(rel_path, text, resolve)
+            text = minify_css(text) if minify else text
+        elif minify:
+            text = minify_js(text)
+        body = text.encode("utf-8")
+        files[rel_path] = fingerprinted_path(rel_path, body)
+        outputs[files[rel_path]] = body
+        return files[rel_path]
+
+    for rel_path in sources:
+        resolve(rel_path)
+
+    bundles = {}
+    if bundle:
+        for page, graph in page_graph.all_page_graphs(root).items():
+            parts = [outputs[files[f"js/features/{f}.js"]] for f in graph["features"] if files.get(f"js/features/{f}.js")]
+            body = b";\n".join(part.rstrip() for part in parts) + b"\n"
+            path = fingerprinted_path(f"bundles/{page}.js", body)
+            outputs[path] = body
+            bundles[page] = {"src": path, "features": graph["features"]}
+
+    manifest = {"files": files, "bundles": bundles, "minified": minify}
+    return manifest, outputs
+
+def load_manifest(dist_dir=DIST_DIR):
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_NAME), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_assets(manifest, outputs, dist_dir=DIST_DIR, root=page_graph.PROJECT_ROOT):
+    """Writes missing hashed files, prunes unreferenced ones and rewrites the manifest. Returns stats."""
+    stats = {"files": len(outputs), "written": 0, "pruned": 0, "bytes": sum(len(b) for b in outputs.values())}
+    for rel_path, body in outputs.items():
+        abs_path = os.path.join(root, rel_path)
+        if not os.path.exists(abs_path):
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            data_utils.write_file_atomic(abs_path, body, "wb")
+            stats["written"] += 1
+
+    keep = {os.path.join(root, p) for p in outputs} | {os.path.join(dist_dir, MANIFEST_NAME)}
+    foreign = tuple(os.path.join(dist_dir, name) for name in FOREIGN_DIRS)
+    for walk_root, _, names in os.walk(dist_dir, topdown=False):
+        if walk_root.startswith(foreign):
+            continue
+        for name in names:
+            abs_path = os.path.join(walk_root, name)
+            if abs_path not in keep:
+                os.remove(abs_path)
+                stats["pruned"] += 1
+        if walk_root != dist_dir and not os.listdir(walk_root):
+            os.rmdir(walk_root)
+
+    data_utils.write_json_canonical(os.path.join(dist_dir, MANIFEST_NAME), manifest, minified_twin=False)
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Fingerprint js/ and styles/ into dist/ and write the asset manifest.")
+    parser.add_argument("--minify", action="store_true", help="Strip comments and indentation from JS and CSS.")
+    parser.add_argument("--bundle", action="store_true", help="Also concatenate each page's feature scripts into one bundle.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if dist/ does not match the current sources (no writes).")
+    args = parser.parse_args()
+
+    existing = load_manifest()
+    if args.check:
+        if existing is None:
+            print("ℹ️  No dist/asset-manifest.json; loader.js uses the unhashed sources.")
+            return
+        manifest, outputs = plan_assets(minify=existing.get("minified", False), bundle=bool(existing.get("bundles")))
+        missing = [p for p in outputs if not os.path.exists(os.path.join(page_graph.PROJECT_ROOT, p))]
+        if manifest != existing or missing:
+            print("❌ dist/ is stale. Run: python3 scripts/build_assets.py" + (" --minify" if manifest["minified"] else "")
+                  + (" --bundle" if manifest["bundles"] else ""))
+            sys.exit(1)
+        print("✅ dist/ matches js/ and styles/.")
+        return
+
+    manifest, outputs = plan_assets(minify=args.minify, bundle=args.bundle)
+    stats = write_assets(manifest, outputs)
+    print(f"🏷️  {stats['files']} fingerprinted files ({stats['bytes'] / 1024:.1f} KB): "
+          f"{stats['written']} written, {stats['pruned']} stale files pruned")
+    for page, info in manifest["bundles"].items():
+        print(f"  📦 {page}: {info['src']} ({', '.join(info['features'])})")
+
+if __name__ == "__main__":
+    main()
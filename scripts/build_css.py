@@ -0,0 +1,343 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+
+import build_assets
+import data_utils
+import page_graph
+
+"""
+🎨 CSS BUNDLES & CRITICAL CSS
+Pages link styles/common.css (which @imports variables.css), desktop.css and mobile.css as
+separate render-blocking requests. For every page this build:
+    - flattens its local stylesheets in link order, inlining @imports once each, and
+      re-bases relative url()s to root-absolute paths so the CSS works from anywhere
+    - minifies the result into dist/css/styles.<hash>.css (pages with the same stylesheets
+      share one file, so it is cached once)
+    - extracts the critical rules: those whose selectors only use tags, classes and ids present
+      in the page shell (including the loader overlay) and the above-the-fold components
+      (CRITICAL_COMPONENTS), plus the state classes the loader and hero scripts toggle, the
+      @keyframes they animate with and :root variables; written as dist/css/<page>.critical.<hash>.css
+dist/css/manifest.json records each page's outputs, byte counts and an input key; a page is only
+rebuilt when one of its stylesheets, its HTML, a critical component or a state script changed.
+scripts/prerender.py inlines the critical CSS into build/ pages and loads the bundle without
+blocking render.
+
+    python3 scripts/build_css.py            # build (incremental), report bytes saved per page
+    python3 scripts/build_css.py --check    # exit 1 if dist/css/ is stale
+"""
+
+CSS_DIST = "dist/css"
+MANIFEST_NAME = "manifest.json"
+# Bump when the output format or the extraction rules change, so every page is rebuilt
+BUILD_VERSION = 1
+# Components rendered above the fold; their markup decides which rules are critical
+CRITICAL_COMPONENTS = ["header", "hero-section"]
+# Scripts that toggle classes on that markup before the full stylesheet may have arrived
+STATE_SCRIPTS = ["js/loader.js", "js/features/hero.js"]
+# At-rules whose body is a list of rules (filtered recursively); others are kept or dropped whole
+GROUP_AT_RULES = ("@media", "@supports", "@container", "@layer")
+
+CSS_IMPORT = re.compile(r"""@import\s+(?:url\(\s*(['"]?)([^'")]+)\1\s*\)|(['"])([^'"]+)\3)\s*;""")
+CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+HTML_TAG = re.compile(r"<([a-zA-Z][\w-]*)")
+HTML_CLASS = re.compile(r'\bclass="([^"]*)"')
+HTML_ID = re.compile(r'\bid="([^"]+)"')
+JS_CLASS = re.compile(r"""(?:classList\.(?:add|remove|toggle)|(?:add|remove|toggle)Class)\(\s*['"]([\w\s-]+)['"]""")
+SELECTOR_PSEUDO = re.compile(r"::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?")
+SELECTOR_ATTRIBUTE = re.compile(r"\[[^\]]*\]")
+SELECTOR_TAG = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+ANIMATION = re.compile(r"animation(?:-name)?:([^;}]+)")
+
+def page_stylesheets(page, root=page_graph.PROJECT_ROOT):
+    """Local stylesheets the page links, in document order."""
+    html = page_graph.read_text(f"{page}.html", root)
+    return [ref for ref in page_graph.local_refs(html) if ref.endswith(".css")]
+
+def flatten_css(rel_path, root, seen):
+    """The stylesheet with local @imports inlined in place (each file once) and url()s made root-absolute."""
+    if rel_path in seen:
+        return ""
+    seen.append(rel_path)
+    src_dir = posixpath.dirname(rel_path)
+    text = build_assets.CSS_COMMENT.sub("", page_graph.read_text(rel_path, root))
+
+    def inline(match):
+        url = match.group(2) or match.group(4)
+        if not build_assets.is_relative_url(url):
+            return match.group(0)
+        return flatten_css(posixpath.normpath(posixpath.join(src_dir, url)), root, seen)
+
+    def rebase(match):
+        quote, url = match.groups()
+        if not build_assets.is_relative_url(url):
+            return match.group(0)
+        return f"url({quote}/{posixpath.normpath(posixpath.join(src_dir, url))}{quote})"
+
+    return CSS_URL.sub(rebase, CSS_IMPORT.sub(inline, text))
+
+def scan_until(text, i, stops):
+    """Index of the first character in `stops` at or after i, skipping quoted strings and parentheses."""
+    quote, depth = None, 0
+    while i < len(text):
+        c = text[i]
+        if quote:
+            quote = None if c == quote else quote
+        elif c in "'\"":
+            quote = c
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif depth == 0 and c in stops:
+            return i
+        i += 1
+    return len(text)
+
+def parse_css(text, i=0):
+    """
+    Minified CSS -> (nodes, end). Nodes are ("rule", prelude, body), ("group", prelude, [nodes])
+    for GROUP_AT_RULES, or ("statement", text) for at-rules ending in ";".
+    """
+    nodes = []
+    while i < len(text):
+        if text[i] in " \n":
+            i += 1
+            continue
+        if text[i] == "}":
+            return nodes, i + 1
+        j = scan_until(text, i, "{;}")
+        if j == len(text) or text[j] != "{":
+            nodes.append(("statement", text[i:j].strip()))
+            i = j + 1 if j < len(text) and text[j] == ";" else j
+            continue
+        prelude = text[i:j].strip()
+        if prelude.startswith(GROUP_AT_RULES):
+            children, i = parse_css(text, j + 1)
+            nodes.append(("group", prelude, children))
+            continue
+        depth, k = 1, j + 1
+        while depth and k < len(text):
+            k = scan_until(text, k, "{}")
+            if k < len(text):
+                depth += 1 if text[k] == "{" else -1
+                k += 1
+        nodes.append(("rule", prelude, text[j + 1:k - 1]))
+        i = k
+    return nodes, i
+
+def serialize_css(nodes):
+    parts = []
+    for node in nodes:
+        if node[0] == "statement":
+            parts.append(node[1] + ";")
+        elif node[0] == "group":
+            parts.append(f"{node[1]}{{{serialize_css(node[2])}}}")
+        else:
+            parts.append(f"{node[1]}{{{node[2]}}}")
+    return "".join(parts)
+
+def used_tokens(html_parts, scripts):
+    """{"tags", "classes", "ids"} present in the markup, plus classes the scripts toggle."""
+    tokens = {"tags": {"html", "body"}, "classes": set(), "ids": set()}
+    for html in html_parts:
+        tokens["tags"].update(tag.lower() for tag in HTML_TAG.findall(html))
+        for value in HTML_CLASS.findall(html):
+            tokens["classes"].update(value.split())
+        tokens["ids"].update(HTML_ID.findall(html))
+    for script in scripts:
+        for value in JS_CLASS.findall(script):
+            tokens["classes"].update(value.split())
+    return tokens
+
+def selector_matches(selector_list, tokens):
+    """True if any selector in the list only needs tags, classes and ids present in `tokens`."""
+    for selector in selector_list.split(","):
+        selector = SELECTOR_ATTRIBUTE.sub("", SELECTOR_PSEUDO.sub("", selector))
+        if (set(re.findall(r"\.([\w-]+)", selector)) <= tokens["classes"]
+                and set(re.findall(r"#([\w-]+)", selector)) <= tokens["ids"]
+                and {tag.lower() for tag in SELECTOR_TAG.findall(selector)} <= tokens["tags"]):
+            return True
+    return False
+
+def critical_nodes(nodes, tokens):
+    kept = []
+    for node in nodes:
+        if node[0] == "group":
+            children = critical_nodes(node[2], tokens)
+            if children:
+                kept.append(("group", node[1], children))
+        elif node[0] == "rule" and node[1].startswith("@font-face"):
+            kept.append(node)
+        elif node[0] == "rule" and not node[1].startswith("@") and selector_matches(node[1], tokens):
+            kept.append(node)
+    return kept
+
+def keyframes_used(nodes, names=None):
+    names = set() if names is None else names
+    for node in nodes:
+        if node[0] == "group":
+            keyframes_used(node[2], names)
+        elif node[0] == "rule":
+            for value in ANIMATION.findall(node[2]):
+                names.update(re.split(r"[\s,]+", value.strip()))
+    return names
+
+def extract_critical(nodes, tokens):
+    """The critical subset of parsed CSS, with the @keyframes those rules animate with."""
+    kept = critical_nodes(nodes, tokens)
+    animations = keyframes_used(kept)
+    keyframes = [node for node in nodes if node[0] == "rule" and node[1].startswith(("@keyframes", "@-webkit-keyframes"))
+                 and node[1].split()[-1] in animations]
+    return kept + keyframes
+
+def critical_markup(page, root):
+    """The page HTML and the CRITICAL_COMPONENTS it pulls in (rel_path -> html)."""
+    page_html = page_graph.read_text(f"{page}.html", root)
+    markup = {f"{page}.html": page_html}
+    included = {name for level in page_graph.component_levels(page_html, root) for name in level}
+    for name in CRITICAL_COMPONENTS:
+        html = page_graph.load_component(name, root) if name in included else None
+        if html is not None:
+            markup[page_graph.component_path(name)] = html
+    return markup
+
+def digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+def plan_page(page, root=page_graph.PROJECT_ROOT):
+    """(key, build) for one page; build() returns {sources, css, critical} and is only called when stale."""
+    stylesheets = page_stylesheets(page, root)
+    seen = []
+    flat = "".join(flatten_css(rel_path, root, seen) for rel_path in stylesheets)
+    markup = critical_markup(page, root)
+    scripts = {path: page_graph.read_text(path, root) for path in STATE_SCRIPTS if os.path.exists(os.path.join(root, path))}
+    inputs = {path: digest(page_graph.read_text(path, root)) for path in seen}
+    inputs.update({path: digest(text) for path, text in {**markup, **scripts}.items()})
+    key = digest(json.dumps({"version": BUILD_VERSION, "stylesheets": stylesheets, "inputs": inputs}, sort_keys=True))
+
+    def build():
+        css = build_assets.minify_css(flat)
+        nodes, _ = parse_css(css)
+        critical = serialize_css(extract_critical(nodes, used_tokens(markup.values(), scripts.values()))) + "\n"
+        return {"stylesheets": stylesheets, "sources": seen, "css": css, "critical": critical}
+
+    return key, build
+
+def output_path(name, body):
+    return f"{CSS_DIST}/{name}.{hashlib.sha256(body).hexdigest()[:build_assets.HASH_LENGTH]}.css"
+
+def load_manifest(root=page_graph.PROJECT_ROOT):
+    try:
+        with open(os.path.join(root, CSS_DIST, MANIFEST_NAME), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def source_bytes(paths, root):
+    """(bytes, gzipped bytes) of the stylesheets as the browser fetched them before bundling."""
+    raw = b""
+    for path in paths:
+        with open(os.path.join(root, path), "rb") as f:
+            raw += f.read()
+    return len(raw), len(gzip.compress(raw))
+
+def build_css(root=page_graph.PROJECT_ROOT, pages=None, force=False, check=False):
+    """
+    Builds stale pages (all with force). Returns (manifest, stats) where stats has
+    built/unchanged page lists, written/pruned file counts and stale (pages whose key or
+    files do not match; with check=True nothing is written).
+    """
+    existing = load_manifest(root) or {}
+    previous = existing.get("pages", {}) if existing.get("version") == BUILD_VERSION else {}
+    full_build = not pages
+    pages = pages or page_graph.list_pages(root)
+    manifest = {"version": BUILD_VERSION, "pages": {p: e for p, e in previous.items() if not full_build or p in pages}}
+    outputs = {}
+    stats = {"built": [], "unchanged": [], "stale": [p for p in previous if full_build and p not in pages],
+             "written": 0, "pruned": 0}
+
+    for page in pages:
+        key, build = plan_page(page, root)
+        entry = previous.get(page)
+        if (not force and entry and entry["key"] == key
+                and all(os.path.exists(os.path.join(root, entry[k])) for k in ("bundle", "critical"))):
+            stats["unchanged"].append(page)
+            continue
+        stats["stale"].append(page)
+        if check:
+            continue
+        result = build()
+        css, critical = result["css"].encode("utf-8"), result["critical"].encode("utf-8")
+        raw, raw_gzip = source_bytes(result["sources"], root)
+        entry = {
+            "key": key,
+            "stylesheets": result["stylesheets"],
+            "sources": result["sources"],
+            "bundle": output_path("styles", css),
+            "critical": output_path(f"{page}.critical", critical),
+            "bytes": {"source": raw, "source_gzip": raw_gzip, "bundle": len(css),
+                      "bundle_gzip": len(gzip.compress(css)), "critical": len(critical)},
+        }
+        outputs[entry["bundle"]], outputs[entry["critical"]] = css, critical
+        manifest["pages"][page] = entry
+        stats["built"].append(page)
+
+    if check:
+        return manifest, stats
+
+    for rel_path, body in outputs.items():
+        abs_path = os.path.join(root, rel_path)
+        if not os.path.exists(abs_path):
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            data_utils.write_file_atomic(abs_path, body, "wb")
+            stats["written"] += 1
+
+    css_dir = os.path.join(root, CSS_DIST)
+    keep = {posixpath.basename(entry[k]) for entry in manifest["pages"].values() for k in ("bundle", "critical")} | {MANIFEST_NAME}
+    for name in os.listdir(css_dir) if os.path.isdir(css_dir) else []:
+        if name not in keep:
+            os.remove(os.path.join(css_dir, name))
+            stats["pruned"] += 1
+    data_utils.write_json_canonical(os.path.join(css_dir, MANIFEST_NAME), manifest, minified_twin=False)
+    return manifest, stats
+
+def print_css_report(manifest, stats):
+    print(f"🎨 CSS: {len(stats['built'])} pages built, {len(stats['unchanged'])} unchanged; "
+          f"{stats['written']} files written, {stats['pruned']} pruned")
+    for page, entry in manifest["pages"].items():
+        b = entry["bytes"]
+        saved = b["source"] - b["bundle"]
+        print(f"  📄 {page:<16} {len(entry['sources'])} requests, {b['source'] / 1024:5.1f} KB ({b['source_gzip'] / 1024:4.1f} KB gz)"
+              f" -> 1 request, {b['bundle'] / 1024:5.1f} KB ({b['bundle_gzip'] / 1024:4.1f} KB gz)"
+              f"; saved {saved / 1024:4.1f} KB ({saved / b['source'] * 100:2.0f}%); critical inline {b['critical'] / 1024:4.1f} KB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Bundle, minify and extract critical CSS per page into dist/css/.")
+    parser.add_argument("--pages", help="Comma-separated pages to build (default: every top-level page).")
+    parser.add_argument("--force", action="store_true", help="Rebuild every page even if its inputs are unchanged.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if dist/css/ does not match the current sources (no writes).")
+    args = parser.parse_args()
+
+    pages = args.pages.split(",") if args.pages else None
+    if args.check:
+        if load_manifest() is None:
+            print("ℹ️  No dist/css/manifest.json; pages use the unbundled stylesheets.")
+            return
+        _, stats = build_css(pages=pages, check=True)
+        if stats["stale"]:
+            print(f"❌ dist/css/ is stale for {', '.join(stats['stale'])}. Run: python3 scripts/build_css.py")
+            sys.exit(1)
+        print("✅ dist/css/ matches styles/ and the page markup.")
+        return
+
+    manifest, stats = build_css(pages=pages, force=args.force)
+    print_css_report(manifest, stats)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+from urllib.parse import quote
+
+import data_utils
+import page_graph
+import site_shards
+
+"""
+📴 SERVICE WORKER BUILD
+Generates sw.js at the site root with a precache list of every page, component, script,
+stylesheet, dist/ file and assets_manifest image (up to MAX_PRECACHE_IMAGE_BYTES), each with
+its git blob hash as revision. Cache names carry the sheet `version` tab, and the file changes
+whenever a revision does, so browsers install the new worker, which copies unchanged entries
+from the previous cache and downloads only the rest. At runtime the worker serves:
+    precached files and page navigations   cache first (query strings ignored, /services -> services.html)
+    configs/ (shards, site-data) and the
+    dist/ manifests                          stale-while-revalidate
+    other assets/ (large images, variants)   cache first per full URL (a new ?v= refetches), filled on first view
+    font and CDN hosts (RUNTIME_HOSTS)       stale-while-revalidate
+js/loader.js registers it (not on localhost unless localStorage.sw_dev is set).
+sync_engine.py regenerates it on every sync, from main's tree with --plumbing.
+
+    python3 scripts/build_sw.py            # regenerate sw.js from the checkout
+    python3 scripts/build_sw.py --check    # exit 1 if sw.js is stale
+"""
+
+SW_PATH = "sw.js"
+ROOT_FILES = ("favicon.svg",)
+PRECACHE_DIRS = ("components/", "js/", "styles/", "dist/")
+PRECACHE_EXTENSIONS = (".html", ".js", ".css", ".svg")
+# Revalidated on every load by loader.js / build tooling; served stale-while-revalidate instead
+NOT_PRECACHED = ("dist/asset-manifest.json", "dist/css/manifest.json")
+IMAGES_PREFIX = "assets/images/"
+MAX_PRECACHE_IMAGE_BYTES = 512 * 1024
+REVISION_LENGTH = 12
+# Characters left as-is in URL paths (WHATWG path percent-encode set), so entries match url.pathname
+URL_PATH_SAFE = "/!$&'()*+,;=:@[]^|~"
+RUNTIME_HOSTS = ["fonts.googleapis.com", "fonts.gstatic.com", "cdn.jsdelivr.net", "cdnjs.cloudflare.com"]
+
+SW_TEMPLATE = """/**
+ * sw.js - Service worker generated by scripts/build_sw.py. Do not edit; rerun the build.
+ */
+const VERSION = __VERSION__;
+const PRECACHE = __PRECACHE__;
+const RUNTIME_HOSTS = __RUNTIME_HOSTS__;
+const DATA_PATHS = ["/configs/", "/dist/asset-manifest.json", "/dist/css/manifest.json"];
+
+const PRECACHE_CACHE = `styleplanit-precache-${VERSION}`;
+const DATA_CACHE = `styleplanit-data-${VERSION}`;
+const RUNTIME_CACHE = `styleplanit-runtime-${VERSION}`;
+const REVISIONS = new Map(PRECACHE);
+
+function precacheKey(path, revision) {
+    return `${path}?__rev=${revision}`;
+}
+
+// Clean URLs as served by GitHub Pages: / -> /index.html, /services -> /services.html
+function pagePath(pathname) {
+    if (pathname === "/") return "/index.html";
+    const trimmed = pathname.replace(/\\/+$/, "");
+    return trimmed.split("/").pop().includes(".") ? trimmed : `${trimmed}.html`;
+}
+
+self.addEventListener("install", (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE_CACHE);
+        await Promise.all(PRECACHE.map(async ([path, revision]) => {
+            const key = precacheKey(path, revision);
+            if (await cache.match(key)) return;
+            try {
+                // An older version's cache may already hold this revision
+                const response = (await caches.match(key)) || (await fetch(path, { cache: "no-cache" }));
+                if (response.ok) await cache.put(key, response);
+            } catch (e) {
+                console.warn(`[SW] Precache failed for ${path}`, e);
+            }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil((async () => {
+        const current = [PRECACHE_CACHE, DATA_CACHE, RUNTIME_CACHE];
+        for (const name of await caches.keys()) {
+            if (name.startsWith("styleplanit-") && !current.includes(name)) await caches.delete(name);
+        }
+        const wanted = new Set(PRECACHE.map(([path, revision]) => precacheKey(path, revision)));
+        const cache = await caches.open(PRECACHE_CACHE);
+        for (const request of await cache.keys()) {
+            const url = new URL(request.url);
+            if (!wanted.has(url.pathname + url.search)) await cache.delete(request);
+        }
+        await self.clients.claim();
+    })());
+});
+
+async function cacheFirst(cacheName, request, key) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(key);
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok || response.type === "opaque") await cache.put(key, response.clone());
+    return response;
+}
+
+// Keyed by the full URL, so a new ?v=<hash> fetches the replaced file; older versions of the path are dropped
+async function cacheFirstVersioned(cacheName, request, event) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request.url);
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok || response.type === "opaque") {
+        await cache.put(request.url, response.clone());
+        event.waitUntil(cache.keys(request.url, { ignoreSearch: true }).then(keys => Promise.all(
+            keys.filter(key => key.url !== request.url).map(key => cache.delete(key)))));
+    }
+    return response;
+}
+
+async function staleWhileRevalidate(cacheName, request, key, event) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(key);
+    const network = fetch(request).then(async (response) => {
+        if (response.ok || response.type === "opaque") await cache.put(key, response.clone());
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(network.catch(() => null));
+        return cached;
+    }
+    return network;
+}
+
+self.addEventListener("fetch", (event) => {
+    const request = event.request;
+    if (request.method !== "GET") return;
+    const url = new URL(request.url);
+
+    if (url.origin !== self.location.origin) {
+        if (RUNTIME_HOSTS.includes(url.hostname)) {
+            event.respondWith(staleWhileRevalidate(RUNTIME_CACHE, request, request.url, event));
+        }
+        return;
+    }
+
+    const path = request.mode === "navigate" ? pagePath(url.pathname) : url.pathname;
+    if (REVISIONS.has(path)) {
+        event.respondWith(cacheFirst(PRECACHE_CACHE, request, precacheKey(path, REVISIONS.get(path))));
+    } else if (DATA_PATHS.some(prefix => path.startsWith(prefix))) {
+        // Query strings are cache busters (?v=<timestamp>); one entry per path
+        event.respondWith(staleWhileRevalidate(DATA_CACHE, request, url.origin + path, event));
+    } else if (path.startsWith("/assets/")) {
+        event.respondWith(cacheFirstVersioned(RUNTIME_CACHE, request, event));
+    }
+});
+"""
+
+def blob_sha(body):
+    """The git blob id of `body`, so checkout and git-tree listings agree."""
+    return hashlib.sha1(b"blob %d\0" % len(body) + body).hexdigest()
+
+def worktree_listing(root=page_graph.PROJECT_ROOT):
+    """{path: (blob_sha, size)} for the files the precache may include, read from the checkout."""
+    paths = [name for name in os.listdir(root) if name.endswith(".html") or name in ROOT_FILES]
+    for prefix in PRECACHE_DIRS + (IMAGES_PREFIX,):
+        for walk_root, _, names in os.walk(os.path.join(root, prefix)):
+            paths.extend(os.path.relpath(os.path.join(walk_root, name), root).replace(os.sep, "/") for name in names)
+    listing = {}
+    for path in paths:
+        with open(os.path.join(root, path), "rb") as f:
+            body = f.read()
+        listing[path] = (blob_sha(body), len(body))
+    return listing
+
+def manifest_images(data):
+    manifest = data.get("assets_manifest") or {}
+    return [f"{IMAGES_PREFIX}{file}" if folder == "root" else f"{IMAGES_PREFIX}{folder}/{file}"
+            for folder, files in manifest.items() for file in files]
+
+def precache_entries(listing, data):
+    """
+    Returns (entries [[url, revision], ...] sorted by url, stats). `listing` is {path: (blob_sha, size)}
+    from worktree_listing() or git_plumbing.tree_listing().
+    """
+    paths = [path for path in listing
+             if ("/" not in path and (path.endswith(".html") or path in ROOT_FILES))
+             or (path.startswith(PRECACHE_DIRS) and path.endswith(PRECACHE_EXTENSIONS) and path not in NOT_PRECACHED)]
+    stats = {"files": len(paths), "images": 0, "images_runtime": 0, "missing_images": 0, "bytes": 0}
+    for path in manifest_images(data):
+        if path not in listing:
+            stats["missing_images"] += 1
+        elif listing[path][1] > MAX_PRECACHE_IMAGE_BYTES:
+            stats["images_runtime"] += 1
+        else:
+            paths.append(path)
+            stats["images"] += 1
+    stats["bytes"] = sum(listing[path][1] for path in paths)
+    return sorted([f"/{quote(path, safe=URL_PATH_SAFE)}", listing[path][0][:REVISION_LENGTH]] for path in paths), stats
+
+def render_service_worker(listing, data):
+    """Returns (sw.js bytes, stats)."""
+    entries, stats = precache_entries(listing, data)
+    precache = "[\n" + ",\n".join(f"    {json.dumps(entry)}" for entry in entries) + "\n]"
+    body = (SW_TEMPLATE.replace("__VERSION__", json.dumps(site_shards.site_version(data)))
+            .replace("__PRECACHE__", precache)
+            .replace("__RUNTIME_HOSTS__", json.dumps(RUNTIME_HOSTS)))
+    stats["version"] = site_shards.site_version(data)
+    return body.encode("utf-8"), stats
+
+def write_service_worker(data, listing=None, path=None, root=page_graph.PROJECT_ROOT):
+    """Writes sw.js (to `path`, default the site root) if it changed. Returns (changed, stats)."""
+    body, stats = render_service_worker(worktree_listing(root) if listing is None else listing, data)
+    return data_utils.write_bytes_if_changed(path or os.path.join(root, SW_PATH), body), stats
+
+def print_sw_report(changed, stats):
+    print(f"  📴 Service worker {'updated' if changed else 'unchanged'} (version {stats['version']}): "
+          f"{stats['files'] + stats['images']} precached files ({stats['bytes'] / 1024 / 1024:.1f} MiB), "
+          f"{stats['images_runtime']} large images cached on first view"
+          + (f", {stats['missing_images']} manifest images missing" if stats["missing_images"] else ""))
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate sw.js and its precache list from the checkout and site-data.json.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if sw.js does not match the current files (no writes).")
+    args = parser.parse_args()
+
+    with open(os.path.join(page_graph.PROJECT_ROOT, page_graph.DATA_PATH), "rb") as f:
+        data = json.loads(f.read())
+    if args.check:
+        body, _ = render_service_worker(worktree_listing(), data)
+        try:
+            with open(os.path.join(page_graph.PROJECT_ROOT, SW_PATH), "rb") as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current != body:
+            print("❌ sw.js is stale. Run: python3 scripts/build_sw.py")
+            sys.exit(1)
+        print("✅ sw.js matches the precached files.")
+        return
+    print_sw_report(*write_service_worker(data))
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,438 @@
 import csv
+import hashlib
 import io
 import json
+import os
+import time
+import urllib.error
 import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
-def fetch_csv(spreadsheet_id, gid):
-    url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/pub?gid={gid}&output=csv"
+from perf_trace import span
+
+# Base URL of the published-sheets endpoint. Point SHEETS_BASE_URL (or --sheets-url)
+# at scripts/mock_sheets_server.py to exercise the fetch stage locally.
+SHEETS_BASE_URL = os.environ.get("SHEETS_BASE_URL", "https://docs.google.com/spreadsheets/d")
+
+# The published spreadsheet and the GID of each tab (shared by the sync, the diff and the mock server)
+SPREADSHEET_ID = "e/2PACX-1vSfDsGSiXAvQMmO32s5qWgQaH1GDeZXqEbnMr7bQmm-7gtdoHX-pz_jNq_y3Mb_ahS1LJ99azA84HVZ"
+GIDS = {
+    "version": "2024034979",
+    "config": "1515187439",
+    "categories": "420875592",
+    "services": "439228131",
+    "reviews": "1697858749",
+    "team": "1489131428",
+    "dialogs": "49430965",
+    "articles": "582124820"
+}
+
+# Fetch stage defaults (overridable via CLI flags, see add_fetch_arguments)
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 15
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+
+# On-disk conditional-GET cache: one <gid>.csv / <gid>.rows.json / <gid>.meta.json triple per tab.
+# Entries that have not been revalidated within the TTL are evicted and fetched in full.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "sheets")
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Category fingerprints are the sum of 128-bit row digests modulo 2**128 (an order-independent multiset hash)
+FINGERPRINT_MODULUS = 1 << 128
+
+# Read size used when spooling response bodies to the cache
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def build_csv_url(spreadsheet_id, gid, base_url=None):
+    base = (base_url or SHEETS_BASE_URL).rstrip("/")
+    return f"{base}/{spreadsheet_id}/pub?gid={gid}&output=csv"
+
+def fetch_csv(spreadsheet_id, gid, timeout=DEFAULT_TIMEOUT, base_url=None):
+    url = build_csv_url(spreadsheet_id, gid, base_url)
     try:
-        with urllib.request.urlopen(url) as response:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
             return response.read().decode('utf-8')
     except Exception as e:
         print(f"  ❌ Failed to fetch GID {gid}: {e}")
         return None
 
+def is_retryable(error):
+    """Timeouts, connection errors, 429s and 5xx responses are worth another attempt."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code == 429 or error.code >= 500
+    return True
+
+def cache_paths(gid, cache_dir=CACHE_DIR):
+    base = os.path.join(cache_dir, str(gid))
+    return {"csv": base + ".csv", "rows": base + ".rows.json", "meta": base + ".meta.json"}
+
+def write_file_atomic(path, content, mode="w"):
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, mode) as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def canonical_json(value, minified=False):
+    """
+    The one on-disk JSON format for generated data: sorted keys and literal UTF-8 (no \\u escapes),
+    indented by 2 with a trailing newline, or with no whitespace at all when minified.
+    """
+    if minified:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return (json.dumps(value, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+def write_bytes_if_changed(path, body):
+    """Atomically replaces `path` with `body` unless it already holds exactly those bytes. Returns True if written."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == body:
+                return False
+    except OSError:
+        pass
+    write_file_atomic(path, body, "wb")
+    return True
+
+def minified_twin_path(path):
+    """configs/site-data.json -> configs/site-data.min.json"""
+    return os.path.splitext(path)[0] + ".min.json"
+
+def write_json_canonical(path, value, minified_twin=None):
+    """
+    Writes `value` to `path` as canonical_json, atomically and only if the bytes changed.
+    minified_twin: True also writes the .min.json twin, False leaves it alone, and None
+    refreshes the twin only if it already exists.
+    Returns (body_bytes, changed).
+    """
+    with span(f"write {os.path.basename(path)}", "io"):
+        body = canonical_json(value)
+        changed = write_bytes_if_changed(path, body)
+        twin = minified_twin_path(path)
+        if minified_twin or (minified_twin is None and os.path.exists(twin)):
+            write_bytes_if_changed(twin, canonical_json(value, minified=True))
+    return body, changed
+
+def load_cache_entry(gid, cache_dir=CACHE_DIR, ttl=CACHE_TTL_SECONDS):
+    """Returns the cached meta dict for a tab, or None if missing, unreadable or expired."""
+    paths = cache_paths(gid, cache_dir)
+    try:
+        with open(paths["meta"], "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - meta.get("checked_at", 0) > ttl or not os.path.exists(paths["rows"]):
+        return None
+    return meta
+
+def load_cached_rows(gid, cache_dir=CACHE_DIR):
+    with open(cache_paths(gid, cache_dir)["rows"], "r") as f:
+        return json.load(f)
+
+def save_cache_entry(gid, rows, meta, cache_dir=CACHE_DIR):
+    """Stores parsed rows and meta; the raw CSV is already spooled to cache_paths()["csv"]."""
+    paths = cache_paths(gid, cache_dir)
+    tmp_path = f"{paths['rows']}.tmp{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(rows, f, ensure_ascii=False)
+    os.replace(tmp_path, paths["rows"])
+    write_file_atomic(paths["meta"], json.dumps(meta, indent=2))
+
+def touch_cache_entry(gid, meta, cache_dir=CACHE_DIR):
+    meta["checked_at"] = time.time()
+    write_file_atomic(cache_paths(gid, cache_dir)["meta"], json.dumps(meta, indent=2))
+
+def evict_cache(cache_dir=CACHE_DIR, ttl=CACHE_TTL_SECONDS):
+    """
+    Deletes cache entries that have not been revalidated within the TTL, and spool files a killed
+    fetch left behind. Returns the evicted GIDs.
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+    evicted = []
+    for name in os.listdir(cache_dir):
+        if ".part" in name:
+            path = os.path.join(cache_dir, name)
+            try:
+                # Fresh ones may still be streaming in another process
+                if time.time() - os.path.getmtime(path) > ttl:
+                    os.remove(path)
+            except OSError:
+                pass
+            continue
+        if not name.endswith(".meta.json"):
+            continue
+        gid = name[:-len(".meta.json")]
+        if load_cache_entry(gid, cache_dir, ttl) is None:
+            for path in cache_paths(gid, cache_dir).values():
+                if os.path.exists(path):
+                    os.remove(path)
+            evicted.append(gid)
+    return evicted
+
+def conditional_headers(meta):
+    headers = {}
+    if meta and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+def spool_response(response, path):
+    """Streams a response body to disk in chunks; returns its SHA-256 without holding the body in memory."""
+    hasher = hashlib.sha256()
+    tmp_path = f"{path}.part{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in iter(lambda: response.read(STREAM_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        # A connection dropped mid-body must not leave a partial spool file in the cache
+        # (and if open() itself failed there is nothing to remove, so the real error surfaces)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path, hasher.hexdigest()
+
+def iter_hashed_lines(lines, hasher):
+    for line in lines:
+        hasher.update(line.encode('utf-8'))
+        yield line
+
+def use_cached_entry(result, gid, meta, cache_dir, warm=None):
+    result["unchanged"] = True
+    result["content_hash"] = meta.get("sha256")
+    kept = warm.get(gid) if warm is not None else None
+    result["rows"] = kept["rows"] if kept and kept["sha256"] == meta.get("sha256") else load_cached_rows(gid, cache_dir)
+    result["fingerprint"] = meta.get("fingerprint")
+    result["digests"] = meta.get("digests")
+    touch_cache_entry(gid, meta, cache_dir)
+
+def fetch_tab(spreadsheet_id, key, gid, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+              backoff=DEFAULT_BACKOFF, base_url=None, cache_dir=None, warm=None):
+    """
+    Fetch a single tab with bounded retries. Returns a result dict including timing info.
+    The body is decoded and parsed as a stream and fingerprinted in the same pass, so the raw
+    CSV and the parsed rows are never held in memory together. With a cache_dir, the request is
+    conditional and the body is spooled to the cache first; tabs whose body is unchanged (304,
+    or an identical content hash) are answered from the cached rows without re-parsing.
+    A long-running caller can pass a `warm` dict ({gid: {sha256, rows}}) so unchanged tabs
+    reuse the rows already in memory instead of re-reading them from the cache.
+    """
+    url = build_csv_url(spreadsheet_id, gid, base_url)
+    result = {"key": key, "gid": gid, "rows": None, "unchanged": False, "content_hash": None,
+              "fingerprint": None, "digests": None, "attempts": 0, "elapsed": 0.0, "error": None}
+    cached_meta = load_cache_entry(gid, cache_dir) if cache_dir else None
+    request = urllib.request.Request(url, headers=conditional_headers(cached_meta))
+    start = time.perf_counter()
+    for attempt in range(retries + 1):
+        result["attempts"] = attempt + 1
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                validators = {"etag": response.headers.get("ETag"),
+                              "last_modified": response.headers.get("Last-Modified")}
+                if not cache_dir:
+                    hasher = hashlib.sha256()
+                    lines = iter_hashed_lines(io.TextIOWrapper(response, encoding='utf-8', newline=''), hasher)
+                    # Streamed: this span also covers reading the body off the socket
+                    with span(f"parse {key}", "fetch", streamed=True):
+                        result["rows"], result["fingerprint"], result["digests"] = collect_rows(iter_csv_rows(lines))
+                    result["content_hash"] = hasher.hexdigest()
+                    result["error"] = None
+                    break
+                os.makedirs(cache_dir, exist_ok=True)
+                csv_path = cache_paths(gid, cache_dir)["csv"]
+                spooled_path, content_hash = spool_response(response, csv_path)
+
+            if cached_meta and cached_meta.get("sha256") == content_hash:
+                os.remove(spooled_path)
+                cached_meta.update(validators)
+                use_cached_entry(result, gid, cached_meta, cache_dir, warm)
+            else:
+                os.replace(spooled_path, csv_path)
+                with span(f"parse {key}", "fetch", streamed=False), open(csv_path, "r", encoding='utf-8', newline='') as f:
+                    rows, fingerprint, digests = collect_rows(iter_csv_rows(f))
+                meta = {"key": key, "sha256": content_hash, "checked_at": time.time(),
+                        "fingerprint": fingerprint, "digests": digests, **validators}
+                save_cache_entry(gid, rows, meta, cache_dir)
+                result.update(rows=rows, content_hash=content_hash, fingerprint=fingerprint, digests=digests)
+            result["error"] = None
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached_meta:
+                use_cached_entry(result, gid, cached_meta, cache_dir, warm)
+                result["error"] = None
+                break
+            result["error"] = str(e)
+            if attempt == retries or not is_retryable(e):
+                break
+            time.sleep(backoff * (2 ** attempt))
+        except Exception as e:
+            result["error"] = str(e)
+            if attempt == retries or not is_retryable(e):
+                break
+            # Exponential backoff: 0.5s, 1s, 2s, ...
+            time.sleep(backoff * (2 ** attempt))
+    result["elapsed"] = time.perf_counter() - start
+    if warm is not None and result["rows"] is not None and result["content_hash"]:
+        warm[gid] = {"sha256": result["content_hash"], "rows": result["rows"]}
+    return result
+
+def traced_fetch_tab(spreadsheet_id, key, gid, *args):
+    with span(f"fetch {key}", "fetch", gid=gid):
+        return fetch_tab(spreadsheet_id, key, gid, *args)
+
+def fetch_tabs(spreadsheet_id, gids, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT,
+               retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, base_url=None, cache_dir=None, warm=None):
+    """Fetch all tabs concurrently on a bounded pool. Returns {key: result} in `gids` order."""
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="fetch") as pool:
+        futures = {
+            key: pool.submit(traced_fetch_tab, spreadsheet_id, key, gid, timeout, retries, backoff, base_url, cache_dir, warm)
+            for key, gid in gids.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+def print_fetch_report(results, wall_time=None):
+    print("  ⏱️  Fetch timings:")
+    for key, r in results.items():
+        status = "✅" if r["rows"] is not None else "❌"
+        cache_note = " (unchanged, cached)" if r["unchanged"] else ""
+        retry_note = f" ({r['attempts']} attempts)" if r["attempts"] > 1 else ""
+        error_note = f" - {r['error']}" if r["error"] else ""
+        print(f"     {status} {key:<12} {r['elapsed'] * 1000:7.0f} ms{cache_note}{retry_note}{error_note}")
+    if wall_time is not None:
+        serial_time = sum(r["elapsed"] for r in results.values())
+        print(f"     Σ {serial_time * 1000:.0f} ms of requests in {wall_time * 1000:.0f} ms wall time")
+
+def add_fetch_arguments(parser):
+    """Registers the shared fetch-stage flags on an argparse parser."""
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of tabs fetched in parallel.")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-tab request timeout in seconds.")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Retries per tab after a failed attempt.")
+    parser.add_argument("--sheets-url", default=None, help="Override the published-sheets base URL (e.g. a local mock server).")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the on-disk CSV cache and download every tab in full.")
+
+def fetch_all_tabs(spreadsheet_id, gids, args):
+    """Runs the fetch stage with CLI settings and prints the timing report."""
+    cache_dir = None if args.no_cache else CACHE_DIR
+    if cache_dir:
+        evicted = evict_cache(cache_dir)
+        if evicted:
+            print(f"  🧹 Evicted {len(evicted)} expired cache entries.")
+    print(f"📡 Fetching {len(gids)} tabs ({args.workers} workers, {args.timeout:g}s timeout)...")
+    start = time.perf_counter()
+    with span("fetch", workers=args.workers, tabs=len(gids)):
+        results = fetch_tabs(spreadsheet_id, gids, workers=args.workers, timeout=args.timeout,
+                             retries=args.retries, base_url=args.sheets_url, cache_dir=cache_dir)
+    print_fetch_report(results, time.perf_counter() - start)
+    return results
+
 def normalize_value(v):
     if v is None:
         return ""
     # Strip whitespace and normalize all newline variants to \n
     return str(v).strip().replace('\r\n', '\n').replace('\r', '\n')
 
+def iter_csv_rows(lines):
+    """
+    Lazily yields normalized row dicts from an iterable of CSV lines (a file, a decoded
+    response stream, ...). Header keys are stripped once; blank lines are skipped, short
+    rows are padded with "" and surplus cells are dropped.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    keys = [k.strip() for k in header]
+    width = len(keys)
+    for values in reader:
+        if not values:
+            continue
+        if len(values) < width:
+            values += [""] * (width - len(values))
+        yield {k: normalize_value(v) for k, v in zip(keys, values)}
+
 def parse_csv_to_list(csv_text):
-    reader = csv.DictReader(io.StringIO(csv_text))
-    processed_list = []
-    for row in reader:
-        processed_row = {k.strip(): normalize_value(v) for k, v in row.items()}
-        processed_list.append(processed_row)
-    return processed_list
-
-def normalize_dataset(data_list, headers=None):
-    """Normalizes a list of dicts for comparison by ensuring consistent keys and values."""
-    normalized_list = []
-    for item in data_list:
-        normalized_item = {k: normalize_value(v) for k, v in item.items()}
-        if headers:
-            for h in headers:
-                if h not in normalized_item:
-                    normalized_item[h] = ""
-        normalized_list.append(normalized_item)
-    # Sort by JSON string to ensure order-independent comparison
-    return sorted([json.dumps(d, sort_keys=True) for d in normalized_list])
+    return list(iter_csv_rows(io.StringIO(csv_text, newline='')))
+
+def open_csv_stream(spreadsheet_id, gid, timeout=DEFAULT_TIMEOUT, base_url=None):
+    """
+    Opens a tab and returns (response, row_iterator) for consumers that want to process rows as
+    they arrive. The caller owns the response and must close it (it is a context manager).
+    """
+    response = urllib.request.urlopen(build_csv_url(spreadsheet_id, gid, base_url), timeout=timeout)
+    return response, iter_csv_rows(io.TextIOWrapper(response, encoding='utf-8', newline=''))
+
+def row_digest(row):
+    """
+    Canonical 128-bit digest of a row. Values are normalized and empty fields are skipped,
+    so a column missing from one side compares equal to an empty cell on the other.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for k in sorted(row):
+        v = normalize_value(row[k])
+        if v:
+            h.update(f"{k}\x1f{v}\x1e".encode('utf-8'))
+    return h.hexdigest()
+
+def combine_digests(digests):
+    total = 0
+    for d in digests:
+        total += int(d, 16)
+    return format(total % FINGERPRINT_MODULUS, "032x")
+
+def fingerprint_dataset(data_list):
+    """Returns (category_fingerprint, row_digests). Order-independent and O(n): digests are summed, not sorted."""
+    digests = [row_digest(item) for item in data_list]
+    return combine_digests(digests), digests
+
+def collect_rows(row_iter):
+    """Materializes a row stream and fingerprints it in the same pass. Returns (rows, fingerprint, digests)."""
+    rows, digests = [], []
+    for row in row_iter:
+        rows.append(row)
+        digests.append(row_digest(row))
+    return rows, combine_digests(digests), digests
+
+def compare_digests(local_digests, remote_digests):
+    """
+    Multiset comparison of two row-digest lists.
+    Returns {"changed": bool, "added": [remote row indexes], "removed": [local row indexes]}.
+    """
+    unmatched = Counter(local_digests)
+    added = []
+    for i, d in enumerate(remote_digests):
+        if unmatched[d] > 0:
+            unmatched[d] -= 1
+        else:
+            added.append(i)
+    removed = []
+    for i, d in enumerate(local_digests):
+        if unmatched[d] > 0:
+            unmatched[d] -= 1
+            removed.append(i)
+    return {"changed": bool(added or removed), "added": added, "removed": removed}
+
+def fingerprint_index_path(json_path):
+    """Sidecar index next to the data file, e.g. configs/site-data.index.json."""
+    return os.path.splitext(json_path)[0] + ".index.json"
+
+def load_fingerprint_index(json_path, source_bytes):
+    """Returns {category: {"fingerprint", "digests"}} if the sidecar matches source_bytes, else None."""
+    try:
+        with open(fingerprint_index_path(json_path), "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("source_sha256") != hashlib.sha256(source_bytes).hexdigest():
+        return None
+    return index.get("categories", {})
+
+def write_fingerprint_index(json_path, source_bytes, categories):
+    with span("write fingerprint index", "io"):
+        index = {"source_sha256": hashlib.sha256(source_bytes).hexdigest(), "categories": categories}
+        write_file_atomic(fingerprint_index_path(json_path), json.dumps(index))
 
 def get_all_headers(local_list, remote_list):
     headers = set()
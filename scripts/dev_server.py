@@ -1,24 +1,303 @@
+import argparse
+import asyncio
+import errno
 import http.server
 import socketserver
 import os
 import sys
 import subprocess
 import signal
+import gzip
+import hashlib
+import io
+import queue
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, unquote
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 DEFAULT_PORT = 8000
 
+# Responses smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 1024
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+# Upper bound for the in-memory cache of compressed response bodies
+COMPRESSED_CACHE_BYTES = 64 * 1024 * 1024
+# Filenames carrying a content hash (e.g. hero.3f2a9c1b.js) never change and can be cached forever
+FINGERPRINTED_NAME = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+COPY_CHUNK_SIZE = 64 * 1024
+
+class ResponseCache:
+    """
+    Process-wide caches shared by every request: clean-URL resolution, strong ETags
+    (content hashes keyed by stat tuple) and compressed bodies (LRU bounded by bytes).
+    """
+    def __init__(self, max_compressed_bytes=COMPRESSED_CACHE_BYTES):
+        self.lock = threading.Lock()
+        self.resolved_paths = {}
+        self.etags = {}
+        self.compressed = OrderedDict()
+        self.compressed_bytes = 0
+        self.max_compressed_bytes = max_compressed_bytes
+        # Directory whose files shadow the project root (prerendered pages), if any
+        self.overlay_root = None
+        # dev_watch.LiveReloadHub in --watch mode: HTML gets the reload client, LIVE_RELOAD_PATH streams events
+        self.live_reload = None
+
+    def resolve(self, root, url_path):
+        """
+        Maps a URL path to a filesystem path, applying GitHub Pages style /page -> /page.html
+        and dir/ -> dir/index.html. Files in overlay_root take precedence over root.
+        """
+        cached = self.resolved_paths.get(url_path)
+        if cached is not None:
+            return cached
+        rel = unquote(url_path).lstrip("/")
+        parts = [p for p in rel.split("/") if p and p not in (".", "..")]
+        bases = [self.overlay_root, root] if self.overlay_root else [root]
+        for base in bases:
+            path = os.path.join(base, *parts)
+            if url_path.endswith("/"):
+                path = os.path.join(path, "")
+                if os.path.isfile(path + "index.html"):
+                    path += "index.html"
+            if not os.path.exists(path) and not os.path.splitext(path)[1] and os.path.exists(path + ".html"):
+                path += ".html"
+            if os.path.exists(path):
+                break
+        if len(self.resolved_paths) > 4096:
+            self.resolved_paths.clear()
+        self.resolved_paths[url_path] = path
+        return path
+
+    def forget(self, url_path):
+        self.resolved_paths.pop(url_path, None)
+
+    def etag(self, path, st):
+        key = (path, st.st_mtime_ns, st.st_size)
+        etag = self.etags.get(key)
+        if etag is None:
+            hasher = hashlib.sha1()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            etag = f'"{hasher.hexdigest()[:20]}"'
+            self.etags[key] = etag
+        return etag
+
+    def encoded_body(self, path, st, encoding):
+        """Returns the body in the given encoding: a fresh precompressed sibling if present, else compressed once and cached."""
+        suffix = ".br" if encoding == "br" else ".gz"
+        try:
+            pre_st = os.stat(path + suffix)
+            if pre_st.st_mtime_ns >= st.st_mtime_ns:
+                with open(path + suffix, "rb") as f:
+                    return f.read()
+        except OSError:
+            pass
+
+        key = (path, st.st_mtime_ns, st.st_size, encoding)
+        with self.lock:
+            body = self.compressed.get(key)
+            if body is not None:
+                self.compressed.move_to_end(key)
+                return body
+        with open(path, "rb") as f:
+            raw = f.read()
+        body = brotli.compress(raw) if encoding == "br" else gzip.compress(raw, compresslevel=6, mtime=0)
+        with self.lock:
+            self.compressed[key] = body
+            self.compressed_bytes += len(body)
+            while self.compressed_bytes > self.max_compressed_bytes and self.compressed:
+                _, evicted = self.compressed.popitem(last=False)
+                self.compressed_bytes -= len(evicted)
+        return body
+
+RESPONSE_CACHE = ResponseCache()
+
+def choose_encoding(accept_encoding, ctype, size):
+    if size < MIN_COMPRESS_SIZE or not ctype.startswith(COMPRESSIBLE_TYPES):
+        return None
+    accepted = {token.split(";")[0].strip() for token in (accept_encoding or "").split(",")}
+    if "br" in accepted and brotli is not None:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+def cache_control_for(path):
+    return IMMUTABLE_CACHE_CONTROL if FINGERPRINTED_NAME.search(path) else REVALIDATE_CACHE_CONTROL
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip() for tag in if_none_match.split(",")]
+
+def parse_range(range_header, size):
+    """Parses a single 'bytes=start-end' range. Returns (start, end), None if absent/unsupported, or 'invalid'."""
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", range_header or "")
+    if not match or (not match.group(1) and not match.group(2)):
+        return None
+    if match.group(1):
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else size - 1
+    else:
+        start = max(0, size - int(match.group(2)))
+        end = size - 1
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        return "invalid"
+    return start, end
+
 class CleanURLHandler(http.server.SimpleHTTPRequestHandler):
     """
     Custom handler to support GitHub Pages style routing.
     Redirects /services to /services.html automatically.
+    Serves strong ETags (304 on If-None-Match), Cache-Control, gzip/brotli bodies
+    (precompressed .gz/.br siblings or cached on-the-fly compression) and byte ranges.
     """
+    cache = RESPONSE_CACHE
+
     def do_GET(self):
-        path = self.translate_path(self.path)
-        if not os.path.exists(path) and not os.path.splitext(path)[1]:
-            html_path = path + ".html"
-            if os.path.exists(html_path):
-                self.path += ".html"
-        return super().do_GET()
+        hub = self.cache.live_reload
+        if hub and urlsplit(self.path).path == hub.path:
+            self.stream_events(hub)
+            return
+        super().do_GET()
+
+    def stream_events(self, hub):
+        """Holds a Server-Sent Events stream open until the page goes away (one thread per open page)."""
+        events = queue.Queue()
+        send = events.put
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        hub.subscribe(send)
+        try:
+            self.wfile.write(b"retry: 1000\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    payload = events.get(timeout=hub.keepalive)
+                except queue.Empty:
+                    payload = b": ping\n\n"
+                self.wfile.write(payload)
+                self.wfile.flush()
+        except OSError:
+            pass
+        finally:
+            hub.unsubscribe(send)
+            self.close_connection = True
+
+    def send_head(self):
+        url_path = urlsplit(self.path).path
+        path = self.cache.resolve(self.directory, url_path)
+        if os.path.isdir(path):
+            return super().send_head()
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self.cache.forget(url_path)
+            self.send_error(404, "File not found")
+            return None
+
+        try:
+            st = os.fstat(f.fileno())
+            ctype = self.guess_type(path)
+            live_reload = self.cache.live_reload if path.endswith(".html") else None
+            encoding = None if live_reload else choose_encoding(self.headers.get("Accept-Encoding"), ctype, st.st_size)
+            etag = self.cache.etag(path, st)
+            if encoding:
+                etag = f'{etag[:-1]}-{encoding}"'
+            elif live_reload:
+                etag = f'{etag[:-1]}-live"'
+
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                f.close()
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control_for(path))
+                self.end_headers()
+                return None
+
+            if live_reload:
+                body = live_reload.inject(f.read())
+                f.close()
+                self.send_response(200)
+                self.send_common_headers(ctype, etag, path, st)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                return io.BytesIO(body)
+
+            if encoding:
+                body = self.cache.encoded_body(path, st, encoding)
+                f.close()
+                self.send_response(200)
+                self.send_common_headers(ctype, etag, path, st)
+                self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                return io.BytesIO(body)
+
+            byte_range = None
+            if self.headers.get("Range") and self.headers.get("If-Range", etag) == etag:
+                byte_range = parse_range(self.headers.get("Range"), st.st_size)
+            if byte_range == "invalid":
+                f.close()
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{st.st_size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+            if byte_range:
+                start, end = byte_range
+                f.seek(start)
+                self.range_length = end - start + 1
+                self.send_response(206)
+                self.send_common_headers(ctype, etag, path, st)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{st.st_size}")
+                self.send_header("Content-Length", str(self.range_length))
+                self.end_headers()
+                return f
+
+            self.send_response(200)
+            self.send_common_headers(ctype, etag, path, st)
+            self.send_header("Content-Length", str(st.st_size))
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def send_common_headers(self, ctype, etag, path, st):
+        self.send_header("Content-type", ctype)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+        self.send_header("Cache-Control", cache_control_for(path))
+        self.send_header("Accept-Ranges", "bytes")
+        if ctype.startswith(COMPRESSIBLE_TYPES):
+            self.send_header("Vary", "Accept-Encoding")
+
+    def copyfile(self, source, outputfile):
+        remaining = getattr(self, "range_length", None)
+        if remaining is None:
+            return super().copyfile(source, outputfile)
+        while remaining > 0:
+            chunk = source.read(min(COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
 
 def kill_process_on_port(port):
     try:
@@ -38,21 +317,42 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
     """Handle requests in a separate thread."""
     daemon_threads = True
 
-def start_server(port):
+def print_banner(port, title):
+    print("\n" + "="*50)
+    print(f"🚀 Style Plan(it) {title}")
+    print(f"🔗 http://localhost:{port}")
+    print("Mode: Clean URLs (GitHub Pages Parity)")
+    if RESPONSE_CACHE.overlay_root:
+        print(f"Pages: prerendered from {os.path.relpath(RESPONSE_CACHE.overlay_root)}/")
+    if RESPONSE_CACHE.live_reload:
+        print(f"Watch: rebuild on save, live reload via {RESPONSE_CACHE.live_reload.path}")
+    print("="*50 + "\n")
+
+def start_server(port, use_async=False, overlay_dir=None, watch=False):
     # Ensure we run from project root
     os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+    if overlay_dir:
+        if not os.path.isdir(overlay_dir):
+            print(f"❌ {overlay_dir}/ not found. Run: python3 scripts/prerender.py")
+            sys.exit(1)
+        RESPONSE_CACHE.overlay_root = os.path.abspath(overlay_dir)
+    if watch:
+        import dev_watch
+        RESPONSE_CACHE.live_reload = dev_watch.LiveReloadHub()
+        dev_watch.start_watching(RESPONSE_CACHE.live_reload, os.getcwd(), RESPONSE_CACHE.overlay_root)
 
     while True:
         try:
-            with ThreadingHTTPServer(("", port), CleanURLHandler) as httpd:
-                print("\n" + "="*50)
-                print(f"🚀 Style Plan(it) Threaded Dev Server")
-                print(f"🔗 http://localhost:{port}")
-                print("Mode: Clean URLs (GitHub Pages Parity)")
-                print("="*50 + "\n")
-                httpd.serve_forever()
+            if use_async:
+                import async_dev_server
+                asyncio.run(async_dev_server.serve(port, os.getcwd(), on_ready=lambda: print_banner(port, "Async Dev Server"),
+                                                   cache=RESPONSE_CACHE))
+            else:
+                with ThreadingHTTPServer(("", port), CleanURLHandler) as httpd:
+                    print_banner(port, "Threaded Dev Server")
+                    httpd.serve_forever()
         except OSError as e:
-            if e.errno == 48: # Address already in use
+            if e.errno == errno.EADDRINUSE:
                 print(f"\n❌ Port {port} is already in use.")
                 choice = input(f"Would you like to (k)ill existing process, (s)witch to a new port, or (q)uit? [k/s/q]: ").lower()
                 
@@ -81,10 +381,13 @@ def start_server(port):
             sys.exit(0)
 
 if __name__ == "__main__":
-    port = DEFAULT_PORT
-    if len(sys.argv) > 1:
-        try:
-            port = int(sys.argv[1])
-        except ValueError:
-            pass
-    start_server(port)
+    parser = argparse.ArgumentParser(description="Style Plan(it) local dev server with GitHub Pages style clean URLs.")
+    parser.add_argument("port", nargs="?", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default {DEFAULT_PORT}).")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Serve with the asyncio server (keep-alive, sendfile, hot-file cache) instead of threads.")
+    parser.add_argument("--prerendered", nargs="?", const="build", metavar="DIR",
+                        help="Serve pages from the prerender output (default build/), falling back to the project root.")
+    parser.add_argument("--watch", action="store_true",
+                        help="Rebuild manifests, shards, dist/ and prerendered pages on save and live-reload open pages.")
+    args = parser.parse_args()
+    start_server(args.port, use_async=args.use_async, overlay_dir=args.prerendered, watch=args.watch)
@@ -0,0 +1,292 @@
+import json
+import os
+import re
+import threading
+import time
+
+import asset_index
+import build_assets
+import build_css
+import build_sw
+import data_utils
+import image_variants
+import page_graph
+import prerender
+import site_indexes
+import site_shards
+
+"""
+👀 DEV SERVER WATCH MODE (python3 scripts/dev_server.py --watch)
+A batched stat-polling watcher (stdlib only, no inotify dependency): directory mtimes gate
+re-listing and each file's (mtime, size) detects edits, so a poll costs one stat per watched
+entry and nothing is re-read unless it changed. Changes are debounced into one batch and
+only the affected outputs are rebuilt:
+    assets/images/**   -> assets_manifest/assets_meta + indexes in site-data.json (incremental scan) + shards
+    site-data.json     -> indexes (rewritten if stale) + shards (only sections whose content hash changed are written)
+    js/**, styles/**   -> dist/ fingerprinted files + asset manifest (if dist/ is in use)
+    styles, pages, components -> dist/css/ bundles and critical CSS (if built; only stale pages)
+    any of the above   -> sw.js precache revisions (if sw.js exists)
+    pages, components  -> prerendered pages in the --prerendered overlay (only pages whose inputs changed)
+Open pages get a small injected script that listens on /__live-reload (Server-Sent Events):
+CSS-only batches swap stylesheets in place, anything else reloads the page.
+"""
+
+POLL_INTERVAL = 0.5
+# A batch is processed once the tree has been quiet for this long (editors write files in several steps)
+DEBOUNCE_SECONDS = 0.2
+SSE_KEEPALIVE_SECONDS = 15
+LIVE_RELOAD_PATH = "/__live-reload"
+
+# (directory, recursive) relative to the project root; generated outputs are never watched
+WATCH_TARGETS = [(".", False), ("components", True), ("js", True), ("styles", True), ("configs", True), ("assets/images", True)]
+IGNORED_PREFIXES = ("configs/shards/", "configs/site-data.index.json", "configs/site-data.min.json")
+# Editor swap/backup files and in-flight atomic writes (data_utils.write_file_atomic uses <name>.tmp<pid>)
+IGNORED_NAME = re.compile(r"(\.swp|\.swx|~|\.tmp\d*|\.DS_Store)$")
+
+LIVE_RELOAD_SNIPPET = f"""<script>
+(function () {{
+  if (!window.EventSource) return;
+  var source = new EventSource('{LIVE_RELOAD_PATH}');
+  source.addEventListener('reload', function (e) {{
+    var batch = JSON.parse(e.data);
+    if (!batch.css_only) {{ location.reload(); return; }}
+    document.querySelectorAll('link[rel="stylesheet"]').forEach(function (link) {{
+      var url = new URL(link.href);
+      url.searchParams.set('livereload', Date.now());
+      link.href = url.toString();
+    }});
+  }});
+}})();
+</script>
+""".encode("utf-8")
+
+class LiveReloadHub:
+    """Fan-out of reload events to every open /__live-reload stream; subscribers are send(bytes) callables."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = set()
+        self.path = LIVE_RELOAD_PATH
+        self.snippet = LIVE_RELOAD_SNIPPET
+        self.keepalive = SSE_KEEPALIVE_SECONDS
+
+    def subscribe(self, send):
+        with self.lock:
+            self.subscribers.add(send)
+
+    def unsubscribe(self, send):
+        with self.lock:
+            self.subscribers.discard(send)
+
+    def broadcast(self, event, data):
+        payload = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for send in subscribers:
+            send(payload)
+        return len(subscribers)
+
+    def inject(self, html):
+        """Inserts the live-reload client before </body> (or appends it)."""
+        marker = html.rfind(b"</body>")
+        return html + self.snippet if marker < 0 else html[:marker] + self.snippet + html[marker:]
+
+def is_ignored(rel_path):
+    return rel_path.startswith(IGNORED_PREFIXES) or bool(IGNORED_NAME.search(rel_path)) or "/." in f"/{rel_path}"
+
+class PollingWatcher:
+    """
+    Batched stat-polling watcher. Keeps {dir: (mtime_ns, entries)} and {file: (mtime_ns, size)};
+    a directory is re-listed only when its mtime moved (entries added, removed or renamed).
+    """
+    def __init__(self, root=page_graph.PROJECT_ROOT, targets=WATCH_TARGETS):
+        self.root = root
+        self.targets = targets
+        self.dirs = {}
+        self.files = {}
+        for rel_dir, recursive in targets:
+            self.scan_dir(rel_dir, recursive, set())
+
+    def rel(self, *parts):
+        path = os.path.normpath(os.path.join(*parts)).replace(os.sep, "/")
+        return "" if path == "." else path
+
+    def scan_dir(self, rel_dir, recursive, changed):
+        """(Re)lists one directory, recording added files/subdirs in `changed`."""
+        abs_dir = os.path.join(self.root, rel_dir)
+        try:
+            dir_mtime = os.stat(abs_dir).st_mtime_ns
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            return
+        names = set()
+        for entry in entries:
+            rel_path = self.rel(rel_dir, entry.name)
+            if is_ignored(rel_path):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    names.add(entry.name + "/")
+                    if rel_path not in self.dirs:
+                        self.scan_dir(rel_path, True, changed)
+                continue
+            names.add(entry.name)
+            if rel_path not in self.files:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                self.files[rel_path] = (st.st_mtime_ns, st.st_size)
+                changed.add(rel_path)
+        self.dirs[self.rel(rel_dir)] = (dir_mtime, names, recursive)
+
+    def forget_dir(self, rel_dir, changed):
+        """Drops a removed directory and everything below it, reporting its files as changed."""
+        prefix = rel_dir + "/"
+        for path in [p for p in self.files if p.startswith(prefix)]:
+            del self.files[path]
+            changed.add(path)
+        for path in [d for d in self.dirs if d == rel_dir or d.startswith(prefix)]:
+            del self.dirs[path]
+
+    def poll(self):
+        """Returns the set of project-relative paths added, modified or removed since the last poll."""
+        changed = set()
+        for rel_dir, (mtime, names, recursive) in list(self.dirs.items()):
+            if rel_dir not in self.dirs:
+                continue  # dropped together with a removed parent during this poll
+            try:
+                current = os.stat(os.path.join(self.root, rel_dir)).st_mtime_ns
+            except OSError:
+                self.forget_dir(rel_dir, changed)
+                continue
+            if current == mtime:
+                continue
+            self.scan_dir(rel_dir, recursive, changed)
+            listed = self.dirs[rel_dir][1]
+            for name in names - listed:
+                path = self.rel(rel_dir, name.rstrip("/"))
+                if name.endswith("/"):
+                    self.forget_dir(path, changed)
+                elif self.files.pop(path, None) is not None:
+                    changed.add(path)
+
+        for path, (mtime, size) in list(self.files.items()):
+            if path in changed:
+                continue
+            try:
+                st = os.stat(os.path.join(self.root, path))
+            except OSError:
+                continue  # removal is picked up through the parent directory's listing
+            if (st.st_mtime_ns, st.st_size) != (mtime, size):
+                self.files[path] = (st.st_mtime_ns, st.st_size)
+                changed.add(path)
+        return changed
+
+    def acknowledge(self, paths):
+        """Records the current state of files the rebuild itself wrote, so they do not trigger another batch."""
+        for path in paths:
+            try:
+                st = os.stat(os.path.join(self.root, path))
+                self.files[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                self.files.pop(path, None)
+
+class Rebuilder:
+    """Maps a batch of changed paths to the minimal set of rebuild steps."""
+    def __init__(self, root=page_graph.PROJECT_ROOT, overlay_dir=None):
+        self.root = root
+        self.overlay_dir = overlay_dir
+        self.data_path = os.path.join(root, page_graph.DATA_PATH)
+
+    def load_data(self):
+        with open(self.data_path, "rb") as f:
+            return json.loads(f.read())
+
+    def update_assets(self, data):
+        """Incremental rescan: only directories whose mtime changed are re-listed, only changed images re-hashed."""
+        manifest, meta, stats = asset_index.build_assets_manifest(os.path.join(self.root, "assets", "images"))
+        image_variants.attach_variants(meta, generate=False)
+        changed = data.get("assets_manifest") != manifest or data.get("assets_meta") != meta
+        data["assets_manifest"], data["assets_meta"] = manifest, meta
+        return changed, stats
+
+    def run(self, changed):
+        """Runs the affected steps. Returns (log_lines, written_paths)."""
+        log, written = [], []
+        images = [p for p in changed if p.startswith("assets/images/")]
+        sources = [p for p in changed if p.startswith(("js/", "styles/"))]
+        data_edited = page_graph.DATA_PATH in changed
+
+        if images or data_edited:
+            data = self.load_data()
+            data_changed = False
+            if images:
+                data_changed, stats = self.update_assets(data)
+                log.append(f"🖼️  assets_manifest: {stats['dirs_rescanned']} dirs rescanned, {stats['files_hashed']} images hashed"
+                           + ("" if data_changed else " (unchanged)"))
+            if site_indexes.attach_indexes(data):
+                log.append("🗂️  indexes recompiled")
+                data_changed = True
+            if data_changed:
+                data_utils.write_json_canonical(self.data_path, data)
+                written.append(page_graph.DATA_PATH)
+            shard_stats = site_shards.write_shards(data, os.path.join(self.root, "configs", "shards"), self.root)
+            log.append(f"🧩 shards: {shard_stats['written']} written, {shard_stats['pruned']} pruned")
+
+        if sources and build_assets.load_manifest(os.path.join(self.root, "dist")) is not None:
+            existing = build_assets.load_manifest(os.path.join(self.root, "dist"))
+            manifest, outputs = build_assets.plan_assets(self.root, existing.get("minified", False), bool(existing.get("bundles")))
+            stats = build_assets.write_assets(manifest, outputs, os.path.join(self.root, "dist"), self.root)
+            log.append(f"🏷️  dist/: {stats['written']} written, {stats['pruned']} pruned")
+
+        if (changed - set(images)) and build_css.load_manifest(self.root) is not None:
+            _, stats = build_css.build_css(self.root)
+            if stats["built"]:
+                log.append(f"🎨 dist/css/: rebuilt {', '.join(stats['built'])}")
+
+        if os.path.exists(os.path.join(self.root, build_sw.SW_PATH)):
+            sw_changed, _ = build_sw.write_service_worker(self.load_data(), root=self.root)
+            if sw_changed:
+                log.append("📴 sw.js precache list updated")
+                written.append(build_sw.SW_PATH)
+
+        if self.overlay_dir and (changed - set(images)):
+            stats = prerender.build_pages(self.root, self.overlay_dir)
+            log.append(f"🧱 prerendered: {', '.join(stats['built']) or 'nothing to rebuild'}")
+        return log, written
+
+def css_only(changed):
+    return all(p.endswith(".css") for p in changed)
+
+def watch(hub, root=page_graph.PROJECT_ROOT, overlay_dir=None, interval=POLL_INTERVAL, stop=None):
+    """Polls until `stop` (a threading.Event) is set, rebuilding and broadcasting one event per batch."""
+    watcher = PollingWatcher(root)
+    rebuilder = Rebuilder(root, overlay_dir)
+    stop = stop or threading.Event()
+    print(f"👀 Watching {len(watcher.files)} files in {len(watcher.dirs)} directories (live reload on {LIVE_RELOAD_PATH})")
+    while not stop.wait(interval):
+        changed = watcher.poll()
+        if not changed:
+            continue
+        while not stop.wait(DEBOUNCE_SECONDS):
+            more = watcher.poll()
+            if not more:
+                break
+            changed |= more
+
+        start = time.perf_counter()
+        try:
+            log, written = rebuilder.run(changed)
+        except Exception as e:  # keep serving; the next save retries
+            log, written = [f"❌ Rebuild failed: {e}"], []
+        watcher.acknowledge(written)
+        clients = hub.broadcast("reload", {"paths": sorted(changed), "css_only": css_only(changed)})
+        names = ", ".join(sorted(changed)[:5]) + (f" (+{len(changed) - 5} more)" if len(changed) > 5 else "")
+        print(f"🔁 {names} → {(time.perf_counter() - start) * 1000:.0f}ms, reloaded {clients} page(s)")
+        for line in log:
+            print(f"   {line}")
+
+def start_watching(hub, root=page_graph.PROJECT_ROOT, overlay_dir=None):
+    thread = threading.Thread(target=watch, args=(hub, root, overlay_dir), name="dev-watch", daemon=True)
+    thread.start()
+    return thread
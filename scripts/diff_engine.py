@@ -0,0 +1,153 @@
+import argparse
+import sys
+
+import data_utils
+
+"""
+🔎 KEYED DIFF ENGINE
+Linear-time diff between local site-data.json rows and remote sheet rows.
+Rows are indexed by their key fields in insertion-ordered dicts, so merging keys and
+looking up a row's discrepancy are O(1) and a category diff is O(rows × headers).
+Results are plain dicts/lists and can be dumped straight to JSON.
+
+    python3 scripts/diff_engine.py --check   # diff the edge cases below and exit 1 on a wrong report
+"""
+
+IN_SYNC = "IN_SYNC"
+MISMATCH = "MISMATCH"
+LOCAL_ONLY = "LOCAL_ONLY"
+SHEETS_ONLY = "SHEETS_ONLY"
+
+# Fields that identify a row within each category
+CATEGORY_KEY_FIELDS = {
+    "version": ["key"],
+    "config": ["key"],
+    "categories": ["name"],
+    "services": ["title", "category"],
+    "reviews": ["author", "text"],
+    "dialogs": ["title"],
+    "team": ["name"],
+    "articles": ["title"]
+}
+
+def get_key_string(item, key_fields):
+    if not item: return "None"
+    return " | ".join(str(item.get(f, "N/A")) for f in key_fields)
+
+def index_rows(rows, headers, key_fields):
+    """Normalizes each row once and indexes it by its key tuple. Rows with an empty key field are dropped."""
+    index = {}
+    for item in rows:
+        norm_item = {h: data_utils.normalize_value(item.get(h, "")) for h in headers}
+        # A key column neither side has (a renamed sheet header) leaves the key empty: skipped, not an error
+        ckey = tuple(norm_item.get(f, "") for f in key_fields)
+        if all(ckey): index[ckey] = norm_item
+    return index
+
+def diff_category(category, local_list, remote_list, key_fields):
+    """
+    Diffs one category. Every key appears once in `entries` (local order first, then
+    sheet-only keys in sheet order) with a state of IN_SYNC, MISMATCH, LOCAL_ONLY or SHEETS_ONLY.
+    """
+    headers = data_utils.get_all_headers(local_list, remote_list)
+    local_map = index_rows(local_list, headers, key_fields)
+    remote_map = index_rows(remote_list, headers, key_fields)
+
+    entries = []
+    discrepancy_count = 0
+    ordered_keys = list(local_map)
+    ordered_keys.extend(k for k in remote_map if k not in local_map)
+
+    for ckey in ordered_keys:
+        local_item = local_map.get(ckey)
+        remote_item = remote_map.get(ckey)
+
+        diffs = {}
+        if local_item is not None and remote_item is not None:
+            if local_item != remote_item:
+                diffs = {h: [local_item[h], remote_item[h]] for h in headers if local_item[h] != remote_item[h]}
+            state = MISMATCH if diffs else IN_SYNC
+        elif local_item is not None:
+            state = LOCAL_ONLY
+        else:
+            state = SHEETS_ONLY
+
+        if state != IN_SYNC:
+            discrepancy_count += 1
+        entries.append({
+            "key": list(ckey),
+            "key_str": get_key_string(local_item or remote_item, key_fields),
+            "state": state,
+            "diffs": diffs,
+            "local": local_item,
+            "remote": remote_item
+        })
+
+    return {
+        "category": category,
+        "headers": headers,
+        "key_fields": key_fields,
+        "discrepancy_count": discrepancy_count,
+        "entries": entries
+    }
+
+def diff_site_data(local_data, remote_data, categories=CATEGORY_KEY_FIELDS):
+    """Diffs every category present in remote_data. Returns a JSON-serializable report."""
+    report = {"discrepancy_count": 0, "categories": {}}
+    for category, key_fields in categories.items():
+        if category not in remote_data:
+            continue
+        result = diff_category(category, local_data.get(category, []), remote_data[category], key_fields)
+        report["categories"][category] = result
+        report["discrepancy_count"] += result["discrepancy_count"]
+    return report
+
+def iter_discrepancies(report):
+    """Yields (category, entry) for every entry that needs resolution."""
+    for category, result in report["categories"].items():
+        for entry in result["entries"]:
+            if entry["state"] != IN_SYNC:
+                yield category, entry
+
+# (description, category, local rows, remote rows, expected {key_str: state})
+EDGE_CASES = [
+    ("key column missing on both sides", "team", [{"role": "Stylist"}], [{"role": "Founder"}], {}),
+    ("key column missing on one side", "team", [{"name": "Dee", "role": "Founder"}], [{"role": "Founder"}],
+     {"Dee": LOCAL_ONLY}),
+    ("empty key value", "categories", [{"name": ""}, {"name": "Elevate"}], [{"name": "Elevate"}],
+     {"Elevate": IN_SYNC}),
+    ("composite key", "services", [{"title": "Closet Edit", "category": "Elevate", "footer": "a"}],
+     [{"title": "Closet Edit", "category": "Elevate", "footer": "b"}, {"title": "Closet Edit", "category": "Icon"}],
+     {"Closet Edit | Elevate": MISMATCH, "Closet Edit | Icon": SHEETS_ONLY}),
+]
+
+def edge_case_failures():
+    """[(description, error)] for every EDGE_CASES entry whose diff raises or reports other states."""
+    failures = []
+    for description, category, local, remote, expected in EDGE_CASES:
+        try:
+            result = diff_category(category, local, remote, CATEGORY_KEY_FIELDS[category])
+        except Exception as e:
+            failures.append((description, f"{type(e).__name__}: {e}"))
+            continue
+        states = {entry["key_str"]: entry["state"] for entry in result["entries"]}
+        if states != expected:
+            failures.append((description, f"expected {expected}, got {states}"))
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyed diff engine used by diff_site_data.py.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if an edge case (e.g. a missing key column) diffs wrongly.")
+    args = parser.parse_args()
+    if not args.check:
+        parser.error("--check is the only command (diffs run through diff_site_data.py)")
+    failures = edge_case_failures()
+    for description, error in failures:
+        print(f"  ❌ {description}: {error}")
+    if failures:
+        print(f"❌ {len(failures)} diff edge cases failed.")
+        sys.exit(1)
+    print(f"✅ All {len(EDGE_CASES)} diff edge cases report the expected states.")
+
+if __name__ == "__main__":
+    main()
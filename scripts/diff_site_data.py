@@ -1,29 +1,26 @@
+import argparse
 import json
 import csv
 import io
 import os
 import sys
+import asset_index
+import build_sw
 import data_utils
+import diff_engine
+import image_variants
+import perf_trace
+import site_indexes
+import site_shards
 from collections import OrderedDict
+from data_utils import GIDS, SPREADSHEET_ID
+from perf_trace import span
 
 """
 📊 STYLEPLANIT INTERACTIVE DIFF ENGINE
 Optimized: Summarizes changes upfront and allows bulk resolution.
 """
 
-# Configuration
-SPREADSHEET_ID = "e/2PACX-1vSfDsGSiXAvQMmO32s5qWgQaH1GDeZXqEbnMr7bQmm-7gtdoHX-pz_jNq_y3Mb_ahS1LJ99azA84HVZ"
-GIDS = {
-    "version": "2024034979",
-    "config": "1515187439",
-    "categories": "420875592",
-    "services": "439228131",
-    "reviews": "1697858749",
-    "team": "1489131428",
-    "dialogs": "49430965",
-    "articles": "582124820"
-}
-
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, os.pardir))
 JSON_PATH = os.path.join(PROJECT_ROOT, "configs", "site-data.json")
@@ -36,27 +33,6 @@ def get_local_data():
     with open(JSON_PATH, "r") as f:
         return json.load(f, object_pairs_hook=OrderedDict)
 
-def generate_assets_manifest():
-    """Scan assets/images and return a structured manifest dictionary."""
-    manifest = {}
-    assets_root = os.path.join(PROJECT_ROOT, "assets", "images")
-    if os.path.exists(assets_root):
-        for root, dirs, files in os.walk(assets_root):
-            rel_path = os.path.relpath(root, assets_root)
-            if rel_path == ".":
-                folder_key = "root"
-            else:
-                folder_key = rel_path.replace(os.sep, "/")
-            
-            image_files = [f for f in files if f.lower().endswith(('.png', '.jpg', '.jpeg', '.webp', '.gif'))]
-            if image_files:
-                manifest[folder_key] = sorted(image_files)
-    return manifest
-
-def get_key_string(item, key_fields):
-    if not item: return "None"
-    return " | ".join(str(item.get(f, "N/A")) for f in key_fields)
-
 def manual_input_entry(headers, current_item):
     new_item = {}
     print("\n📝 MANUAL ENTRY (Leave blank to keep current value):")
@@ -66,13 +42,27 @@ def manual_input_entry(headers, current_item):
     return new_item
 
 def main():
-    local_full_data = get_local_data()
+    parser = argparse.ArgumentParser(description="Interactive two-way diff between site-data.json and Google Sheets.")
+    parser.add_argument("--report", help="Also write the structured diff result as JSON to this path.")
+    data_utils.add_fetch_arguments(parser)
+    perf_trace.add_profile_arguments(parser)
+    args = parser.parse_args()
+    perf_trace.start_profiling(args, "diff_site_data")
+
+    with span("read site-data", "io"):
+        local_full_data = get_local_data()
     updated_local_data = local_full_data.copy()
     
-    # Auto-generate manifest
-    current_manifest = generate_assets_manifest()
-    manifest_changed = current_manifest != local_full_data.get("assets_manifest")
+    # Auto-generate manifest (incremental: only changed directories are re-listed)
+    with span("manifest scan", hot=True):
+        current_manifest, current_meta, scan_stats = asset_index.build_assets_manifest()
+    asset_index.print_scan_report(scan_stats, current_manifest)
+    with span("image variants", generate=False):
+        image_variants.attach_variants(current_meta, generate=False)
+    manifest_changed = (current_manifest != local_full_data.get("assets_manifest")
+                        or current_meta != local_full_data.get("assets_meta"))
     updated_local_data["assets_manifest"] = current_manifest
+    updated_local_data["assets_meta"] = current_meta
     
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     # Clear previous reports
@@ -84,91 +74,33 @@ def main():
     print("📊 STYLEPLANIT INTERACTIVE DIFF ENGINE")
     print("="*60)
 
-    categories_to_check = {
-        "version": {"key_fields": ["key"]},
-        "config": {"key_fields": ["key"]},
-        "categories": {"key_fields": ["name"]},
-        "services": {"key_fields": ["title", "category"]},
-        "reviews": {"key_fields": ["author", "text"]}, 
-        "dialogs": {"key_fields": ["title"]}, 
-        "team": {"key_fields": ["name"]},
-        "articles": {"key_fields": ["title"]}
-    }
-
-    all_discrepancies = []
-    category_data = {}
+    categories_to_check = diff_engine.CATEGORY_KEY_FIELDS
 
-    print("📡 Fetching remote data...")
-    for category, settings in categories_to_check.items():
-        csv_text = data_utils.fetch_csv(SPREADSHEET_ID, GIDS[category])
-        if csv_text is None:
+    fetch_results = data_utils.fetch_all_tabs(
+        SPREADSHEET_ID, {category: GIDS[category] for category in categories_to_check}, args)
+    remote_data = {}
+    for category in categories_to_check:
+        remote_list = fetch_results[category]["rows"]
+        if remote_list is None:
             print(f"  ❌ Failed to fetch remote data for '{category}'. Skipping.")
             continue
-
-        local_list = local_full_data.get(category, [])
-        remote_list = data_utils.parse_csv_to_list(csv_text)
-        headers = data_utils.get_all_headers(local_list, remote_list)
-        key_fields = settings["key_fields"]
-
-        # Build Maps
-        local_map = OrderedDict()
-        for item in local_list:
-            norm_item = {h: data_utils.normalize_value(item.get(h, "")) for h in headers}
-            ckey = tuple(norm_item.get(f) for f in key_fields)
-            if all(ckey): local_map[ckey] = norm_item
-
-        remote_map = OrderedDict()
-        for item in remote_list:
-            norm_item = {h: data_utils.normalize_value(item.get(h, "")) for h in headers}
-            ckey = tuple(norm_item.get(f) for f in key_fields)
-            if all(ckey): remote_map[ckey] = norm_item
-
-        all_keys = list(local_map.keys())
-        for k in remote_map.keys():
-            if k not in all_keys: all_keys.append(k)
-
-        category_discrepancies = []
-        for ckey in all_keys:
-            local_item = local_map.get(ckey)
-            remote_item = remote_map.get(ckey)
-            
-            state = None
-            diffs = {}
-            if local_item and remote_item:
-                diffs = {h: (local_item[h], remote_item[h]) for h in headers if local_item[h] != remote_item[h]}
-                if diffs: state = "MISMATCH"
-            elif local_item:
-                state = "LOCAL_ONLY"
-            else:
-                state = "SHEETS_ONLY"
-
-            if state:
-                category_discrepancies.append({
-                    "ckey": ckey,
-                    "state": state,
-                    "diffs": diffs,
-                    "local": local_item,
-                    "remote": remote_item,
-                    "key_str": get_key_string(local_item or remote_item, key_fields)
-                })
-        
-        category_data[category] = {
-            "discrepancies": category_discrepancies,
-            "headers": headers,
-            "key_fields": key_fields,
-            "local_map": local_map,
-            "remote_map": remote_map,
-            "all_keys": all_keys
-        }
-        if category_discrepancies:
-            all_discrepancies.extend([(category, d) for d in category_discrepancies])
-
-    if not all_discrepancies:
+        remote_data[category] = remote_list
+
+    with span("compare", hot=True):
+        report = diff_engine.diff_site_data(local_full_data, remote_data, categories_to_check)
+    if args.report:
+        with span("write report", "io"), open(args.report, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"🧾 Diff report written to {args.report}")
+    # Everything below waits on the user; the profile covers the automatic phases only
+    perf_trace.finish_profiling()
+
+    if not report["discrepancy_count"]:
         print("\n🙌 EVERYTHING IN SYNC. No actions required.")
         return
 
-    print(f"\n🔍 FOUND {len(all_discrepancies)} DISCREPANCIES:")
-    for category, d in all_discrepancies:
+    print(f"\n🔍 FOUND {report['discrepancy_count']} DISCREPANCIES:")
+    for category, d in diff_engine.iter_discrepancies(report):
         print(f"  [{category.upper()}] {d['state']}: {d['key_str']}")
 
     print("\nHow would you like to resolve these?")
@@ -182,27 +114,23 @@ def main():
     to_delete_from_sheets = []
     changes_to_local = False
 
-    for category, data in category_data.items():
+    for category, data in report["categories"].items():
         local_category_updated = []
         category_needs_sheets_update = False
         
         headers = data["headers"]
-        key_fields = data["key_fields"]
         
         # If no discrepancies, just keep local
-        if not data["discrepancies"]:
+        if not data["discrepancy_count"]:
             updated_local_data[category] = local_full_data.get(category, [])
             continue
 
-        for ckey in data["all_keys"]:
-            local_item = data["local_map"].get(ckey)
-            remote_item = data["remote_map"].get(ckey)
-            
-            # Find if this specific key has a discrepancy
-            d = next((item for item in data["discrepancies"] if item["ckey"] == ckey), None)
-            
-            if not d:
-                if local_item: local_category_updated.append(local_item)
+        for d in data["entries"]:
+            local_item = d["local"]
+            remote_item = d["remote"]
+
+            if d["state"] == diff_engine.IN_SYNC:
+                local_category_updated.append(local_item)
                 continue
 
             choice = global_choice
@@ -277,16 +205,18 @@ def main():
 
     if changes_to_local:
         if input("\n💾 Save updates to site-data.json? (y/n): ").strip().lower() == 'y':
-            # Ensure assets_manifest is sorted consistently
-            if "assets_manifest" in updated_local_data:
-                sorted_manifest = OrderedDict()
-                for key in sorted(updated_local_data["assets_manifest"].keys()):
-                    sorted_manifest[key] = sorted(updated_local_data["assets_manifest"][key])
-                updated_local_data["assets_manifest"] = sorted_manifest
-
-            with open(JSON_PATH, "w") as f:
-                json.dump(updated_local_data, f, indent=2, ensure_ascii=False)
-            print("✅ Local site-data.json updated.")
+            try:
+                site_indexes.attach_indexes(updated_local_data)
+            except site_indexes.UnresolvedReferenceError as e:
+                print(f"❌ Not saved: {e}")
+                sys.exit(1)
+            # Same canonical bytes as sync_engine.py (sorted keys; asset_index already sorts manifest lists)
+            _, changed = data_utils.write_json_canonical(JSON_PATH, updated_local_data)
+            print("✅ Local site-data.json updated." if changed else "ℹ️ site-data.json already up to date.")
+            # The frontend reads the shards first, and sw.js precaches the manifest images
+            if changed or site_shards.shards_missing(updated_local_data):
+                site_shards.print_shards_report(site_shards.write_shards(updated_local_data))
+                build_sw.print_sw_report(*build_sw.write_service_worker(updated_local_data))
     else:
         print("\nℹ️ No local site-data.json changes to save.")
 
@@ -0,0 +1,149 @@
+import io
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import time
+
+from perf_trace import span
+
+"""
+🧱 GIT PLUMBING
+One argument-list runner for every git call the data tools make (no shell, each call timed),
+and commit_to_branch(), which commits files to a branch through a temporary index
+(read-tree → update-index → write-tree → commit-tree → update-ref). The user's checkout,
+index and stash are never touched, so syncing to main no longer needs stash/checkout/pull.
+"""
+
+class GitError(Exception):
+    """A git command exited non-zero."""
+    def __init__(self, args, returncode, stderr):
+        super().__init__(f"git {' '.join(args)} failed ({returncode}): {stderr.strip()}")
+        self.returncode = returncode
+        self.stderr = stderr
+
+# (args, seconds) for every git call in this process, reported by print_git_timings()
+GIT_TIMINGS = []
+
+def run_git(args, input=None, env=None, check=True, binary=False):
+    """
+    Runs `git <args>` without a shell and returns stripped stdout (raw bytes with binary),
+    or None if it failed and check is False. Raises GitError if check and it fails.
+    """
+    start = time.perf_counter()
+    with span(f"git {args[0]}", "git", argv=args):
+        result = subprocess.run(["git", *args], input=input, capture_output=True, text=not binary,
+                                env=dict(os.environ, **env) if env else None)
+    GIT_TIMINGS.append((args, time.perf_counter() - start))
+    if result.returncode != 0:
+        if check:
+            raise GitError(args, result.returncode, result.stderr if not binary else result.stderr.decode("utf-8", "replace"))
+        return None
+    return result.stdout if binary else result.stdout.strip()
+
+def print_git_timings():
+    if not GIT_TIMINGS:
+        return
+    total = sum(seconds for _, seconds in GIT_TIMINGS)
+    slowest = sorted(GIT_TIMINGS, key=lambda t: -t[1])[:3]
+    print(f"⏱️  git: {len(GIT_TIMINGS)} calls in {total:.2f}s (slowest: "
+          + ", ".join(f"{args[0]} {seconds:.2f}s" for args, seconds in slowest) + ")")
+
+def current_branch():
+    return run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=False)
+
+def resolve(ref):
+    return run_git(["rev-parse", "--verify", "-q", f"{ref}^{{commit}}"], check=False)
+
+def read_blob(ref, path):
+    """Returns the bytes of `path` at `ref`, or None if it does not exist there."""
+    return run_git(["cat-file", "blob", f"{ref}:{path}"], check=False, binary=True)
+
+def tree_entries(ref, prefix):
+    """{path: blob_sha} of the files under `prefix` at `ref`."""
+    output = run_git(["ls-tree", "-r", "--full-tree", ref, "--", prefix], check=False) or ""
+    entries = {}
+    for line in output.splitlines():
+        meta, path = line.split("\t", 1)
+        entries[path] = meta.split()[2]
+    return entries
+
+def tree_listing(ref):
+    """{path: (blob_sha, size)} of every file at `ref`."""
+    output = run_git(["ls-tree", "-r", "-l", "--full-tree", ref], check=False) or ""
+    listing = {}
+    for line in output.splitlines():
+        meta, path = line.split("\t", 1)
+        _, kind, sha, size = meta.split()
+        if kind == "blob":
+            listing[path] = (sha, int(size))
+    return listing
+
+def export_tree(ref, dest, exclude=()):
+    """Writes the files at `ref` into `dest` (a scratch copy for tools that read a checkout), skipping `exclude` prefixes."""
+    archive = run_git(["archive", "--format=tar", ref, "--", "."] + [f":(exclude){prefix}" for prefix in exclude], binary=True)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(dest, **({"filter": "data"} if hasattr(tarfile, "data_filter") else {}))
+
+def directory_changes(ref, prefix, sources):
+    """
+    {path: source or None} turning `prefix` at `ref` into exactly `sources` ({path: absolute_path}).
+    For content-named files (hashed shards, variants): a path already in the tree is assumed
+    unchanged and is not re-hashed.
+    """
+    existing = tree_entries(ref, prefix)
+    changes = {path: None for path in existing if path not in sources}
+    changes.update({path: source for path, source in sources.items() if path not in existing})
+    return changes
+
+def sync_base(branch, remote="origin", fetch=True):
+    """
+    Returns (parent_sha, local_sha) to commit on top of: the remote branch when local is behind
+    it (the old `git pull` fast-forward), otherwise the local branch. Raises GitError if they diverged.
+    """
+    local = resolve(f"refs/heads/{branch}")
+    if fetch and run_git(["fetch", "-q", remote, branch], check=False) is not None:
+        upstream = resolve(f"refs/remotes/{remote}/{branch}")
+        if upstream and upstream != local:
+            if local is None or run_git(["merge-base", "--is-ancestor", local, upstream], check=False) is not None:
+                return upstream, local
+            if run_git(["merge-base", "--is-ancestor", upstream, local], check=False) is None:
+                raise GitError(["merge-base", local, upstream], 1, f"{branch} and {remote}/{branch} have diverged; merge them first")
+    if local is None:
+        raise GitError(["rev-parse", branch], 1, f"branch {branch} not found")
+    return local, local
+
+def commit_to_branch(branch, parent, files, message, expected=None):
+    """
+    Commits `files` ({repo_path: absolute_source_path, or None to delete}) on top of `parent`
+    and moves `branch` to it. Returns the new commit sha, or None if the tree did not change.
+    If `branch` is checked out, its files are updated with `git reset --keep`, which refuses
+    to overwrite local edits; otherwise only the ref moves (compare-and-swap on `expected`).
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="git-plumbing-")
+    env = {"GIT_INDEX_FILE": os.path.join(tmp_dir, "index")}
+    try:
+        run_git(["read-tree", parent], env=env)
+        writes = {path: source for path, source in files.items() if source is not None}
+        deletes = [path for path, source in files.items() if source is None]
+        if writes:
+            shas = run_git(["hash-object", "-w", "--stdin-paths"], input="\n".join(writes.values()) + "\n").splitlines()
+            index_info = "".join(f"100644 {sha}\t{path}\n" for path, sha in zip(writes, shas))
+            run_git(["update-index", "--add", "--index-info"], input=index_info, env=env)
+        if deletes:
+            run_git(["update-index", "--force-remove", "--", *deletes], env=env)
+
+        tree = run_git(["write-tree"], env=env)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    if tree == run_git(["rev-parse", f"{parent}^{{tree}}"]):
+        return None
+    commit = run_git(["commit-tree", tree, "-p", parent, "-m", message])
+    if current_branch() == branch:
+        run_git(["reset", "-q", "--keep", commit])
+    else:
+        run_git(["update-ref", "-m", f"commit: {message.splitlines()[0]}", f"refs/heads/{branch}", commit]
+                + ([expected] if expected else []))
+    return commit
@@ -0,0 +1,133 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import asset_index
+
+"""
+🪄 RESPONSIVE IMAGE VARIANTS
+Encodes resized WebP/AVIF variants of every image in assets/images into assets/variants/,
+in a process pool, and records them under assets_meta[path]["variants"] so the JS features
+can emit srcset. Variant filenames embed the source content hash, so an image whose hash is
+unchanged (and whose variants exist) is skipped, and stale variants are pruned.
+Requires Pillow (AVIF needs Pillow >= 11.3 or pillow-avif-plugin); without it only existing
+variants are recorded.
+"""
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+VARIANTS_DIR = os.path.join(asset_index.PROJECT_ROOT, "assets", "variants")
+VARIANT_WIDTHS = (480, 960, 1600)
+FORMAT_QUALITY = {"webp": 80, "avif": 55}
+FORMAT_MIME = {"webp": "image/webp", "avif": "image/avif"}
+
+def available_formats():
+    if Image is None:
+        return ()
+    try:
+        import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow)
+    except ImportError:
+        pass
+    Image.init()
+    return tuple(fmt for fmt in FORMAT_QUALITY if fmt.upper() in Image.SAVE)
+
+def plan_variants(path, info, formats):
+    """Returns [(width, fmt, repo_relative_path)] for widths smaller than the source image."""
+    if not info.get("width"):
+        return []
+    folder, name = os.path.split(path)
+    stem = os.path.splitext(name)[0]
+    widths = [w for w in VARIANT_WIDTHS if w < info["width"]]
+    return [(w, fmt, "/".join(p for p in ("assets/variants", folder, f"{stem}-{w}w.{info['hash'][:8]}.{fmt}") if p))
+            for fmt in formats for w in widths]
+
+def encode_variants(source_path, targets):
+    """Process-pool worker: decodes the source once and writes each (width, fmt, abs_path) target."""
+    with Image.open(source_path) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+        for width, fmt, abs_path in targets:
+            height = round(img.height * width / img.width)
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            tmp_path = f"{abs_path}.tmp{os.getpid()}"
+            img.resize((width, height), Image.LANCZOS).save(tmp_path, fmt.upper(), quality=FORMAT_QUALITY[fmt])
+            os.replace(tmp_path, abs_path)
+    return len(targets)
+
+def prune_variants(keep):
+    removed = 0
+    if not os.path.isdir(VARIANTS_DIR):
+        return removed
+    for root, dirs, files in os.walk(VARIANTS_DIR, topdown=False):
+        for name in files:
+            abs_path = os.path.join(root, name)
+            if os.path.relpath(abs_path, asset_index.PROJECT_ROOT).replace(os.sep, "/") not in keep:
+                os.remove(abs_path)
+                removed += 1
+        if root != VARIANTS_DIR and not os.listdir(root):
+            os.rmdir(root)
+    return removed
+
+def attach_variants(assets_meta, generate=True, workers=None, root=asset_index.PROJECT_ROOT, existing=None):
+    """
+    Adds a "variants" list to each assets_meta entry. With generate=True (and Pillow available),
+    missing variants are encoded in a process pool and variants of changed or removed images are
+    pruned; otherwise only variants already on disk are recorded. Returns stats.
+    New files are written under `root`. `existing` (repo paths, e.g. main's tree) replaces the
+    on-disk check and turns pruning off, so a plumbing sync never touches the checkout.
+    """
+    encodable = available_formats() if generate else ()
+    stats = {"requested": generate, "encodable": list(encodable), "images_encoded": 0, "variants_written": 0, "variants_pruned": 0}
+    jobs, keep = {}, set()
+
+    for path, info in assets_meta.items():
+        variants = []
+        for width, fmt, rel_path in plan_variants(path, info, FORMAT_QUALITY):
+            abs_path = os.path.join(root, rel_path)
+            keep.add(rel_path)
+            if not (rel_path in existing if existing is not None else os.path.exists(abs_path)):
+                if fmt not in encodable:
+                    continue
+                jobs.setdefault(path, []).append((width, fmt, abs_path))
+            variants.append({"width": width, "type": FORMAT_MIME[fmt], "src": rel_path})
+        info["variants"] = variants
+
+    if not encodable:
+        return stats
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(encode_variants, os.path.join(asset_index.ASSETS_ROOT, path), targets)
+                       for path, targets in jobs.items()]
+            for future in futures:
+                stats["variants_written"] += future.result()
+        stats["images_encoded"] = len(jobs)
+    if existing is None:
+        stats["variants_pruned"] = prune_variants(keep)
+    return stats
+
+def print_variants_report(stats):
+    if not stats["requested"]:
+        print("  ⏭️  Image variant encoding skipped; recording existing variants only.")
+        return
+    if not stats["encodable"]:
+        print("  ⚠️  Pillow not installed; recording existing image variants only (pip install Pillow).")
+        return
+    print(f"  🪄 Variants ({'/'.join(stats['encodable'])}): {stats['images_encoded']} images encoded, "
+          f"{stats['variants_written']} files written, {stats['variants_pruned']} stale files pruned")
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode responsive WebP/AVIF variants for assets/images.")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (defaults to CPU count).")
+    args = parser.parse_args()
+
+    manifest, assets_meta, scan_stats = asset_index.build_assets_manifest()
+    asset_index.print_scan_report(scan_stats, manifest)
+    print_variants_report(attach_variants(assets_meta, workers=args.workers))
+
+if __name__ == "__main__":
+    main()
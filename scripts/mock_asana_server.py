@@ -0,0 +1,266 @@
+import argparse
+import json
+import http.server
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlparse, parse_qs
+
+from asana_tools import DEFAULT_PROJECT_ID
+
+"""
+🧪 LOCAL ASANA STAND-IN
+In-memory Asana API (/api/1.0/tasks with offset pagination and modified_since, POST/PUT/DELETE
+task mutations, /events with sync tokens) over HTTP/1.1 keep-alive, with injectable latency and 429 rate limiting, so asana_tools.py can be
+exercised offline:
+
+    python3 scripts/mock_asana_server.py --tasks 250 --rate-limit-every 20 &
+    ASANA_PAT=test ASANA_API_BASE=http://localhost:8766/api/1.0 python3 scripts/asana_tools.py list
+"""
+
+DEFAULT_PORT = 8766
+API_PREFIX = "/api/1.0"
+MAX_PAGE_SIZE = 100
+# Sync tokens older than this many events answer 412, like Asana's expired tokens
+DEFAULT_EVENT_RETENTION = 1000
+USERS = {"1001": "Deepesh Mehta", "1002": "Style Lead", "1003": "Content Editor"}
+
+def now_iso():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+class MockAsana:
+    """Thread-safe task store. Tasks keep insertion order, which is the pagination order."""
+    def __init__(self, project_id, seed_tasks=0, event_retention=DEFAULT_EVENT_RETENTION):
+        self.lock = threading.Lock()
+        self.project_id = project_id
+        self.tasks = {}
+        self.next_gid = 5000000
+        self.events = []  # [(project_gids, event)], position = sync token
+        self.event_retention = event_retention
+        for i in range(seed_tasks):
+            self.create({"name": f"Launch task {i + 1}", "notes": "",
+                         "assignee": list(USERS)[i % len(USERS)] if i % 4 else None,
+                         "due_on": f"2026-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}", "completed": i % 5 == 0,
+                         "projects": [project_id]})
+
+    def apply(self, task, fields):
+        for key in ("name", "notes", "due_on", "completed"):
+            if key in fields:
+                task[key] = fields[key]
+        if "assignee" in fields:
+            gid = fields["assignee"]
+            task["assignee"] = {"gid": gid, "name": USERS.get(gid, f"User {gid}"), "resource_type": "user"} if gid else None
+        task["modified_at"] = now_iso()
+
+    def record(self, action, task, parent=None):
+        """Appends an event; callers hold the lock."""
+        self.events.append((tuple(task["projects"]), {
+            "action": action, "created_at": now_iso(), "type": "task",
+            "resource": {"gid": task["gid"], "resource_type": "task", "name": task["name"]},
+            "parent": {"gid": parent, "resource_type": "project"} if parent else None
+        }))
+
+    def create(self, fields):
+        with self.lock:
+            gid = str(self.next_gid)
+            self.next_gid += 1
+            task = {"gid": gid, "resource_type": "task", "name": "", "notes": "", "completed": False,
+                    "assignee": None, "due_on": None, "created_at": now_iso(),
+                    "projects": fields.get("projects") or [self.project_id]}
+            self.apply(task, fields)
+            self.tasks[gid] = task
+            for project in task["projects"]:
+                self.record("added", task, project)
+            return dict(task)
+
+    def update(self, gid, fields):
+        with self.lock:
+            task = self.tasks.get(gid)
+            if task is None:
+                return None
+            self.apply(task, fields)
+            self.record("changed", task)
+            return dict(task)
+
+    def delete(self, gid):
+        with self.lock:
+            task = self.tasks.pop(gid, None)
+            if task is not None:
+                self.record("deleted", task)
+            return task
+
+    def events_since(self, project_id, token, limit=MAX_PAGE_SIZE):
+        """Returns (events, next_token, has_more), or (None, fresh_token, False) for a missing/expired token."""
+        with self.lock:
+            end = len(self.events)
+            start = int(token[5:]) if token and token.startswith("sync-") and token[5:].isdigit() else -1
+            if not 0 <= start <= end or end - start > self.event_retention:
+                return None, f"sync-{end}", False
+            events, position = [], start
+            while position < end and len(events) < limit:
+                projects, event = self.events[position]
+                position += 1
+                if project_id in projects:
+                    events.append(event)
+            return events, f"sync-{position}", position < end
+
+    def list(self, project_id, modified_since=None):
+        with self.lock:
+            return [dict(t) for t in self.tasks.values()
+                    if project_id in t["projects"] and (not modified_since or t["modified_at"] > modified_since)]
+
+def compact(task, opt_fields):
+    """Asana returns only gid/name/resource_type unless opt_fields asks for more."""
+    keep = {"gid", "name", "resource_type"} | {f.split(".")[0] for f in opt_fields.split(",") if f}
+    return {k: v for k, v in task.items() if k in keep}
+
+def make_handler(store, latency=0.0, rate_limit_every=0, retry_after=1):
+    counter = {"requests": 0}
+    lock = threading.Lock()
+
+    class MockAsanaHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def send_json(self, status, payload, headers=None):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_api_error(self, status, message, headers=None):
+            self.send_json(status, {"errors": [{"message": message}]}, headers)
+
+        def read_body(self):
+            return json.loads(self.raw_body or b"{}").get("data", {})
+
+        def gate(self):
+            """Applies latency, auth and rate limiting. Returns False if the request was answered."""
+            time.sleep(latency)
+            if not (self.headers.get("Authorization") or "").startswith("Bearer "):
+                self.send_api_error(401, "Not Authorized")
+                return False
+            with lock:
+                counter["requests"] += 1
+                throttled = rate_limit_every and counter["requests"] % rate_limit_every == 0
+            if throttled:
+                self.send_api_error(429, "Rate limit exceeded", {"Retry-After": str(retry_after)})
+                return False
+            return True
+
+        def begin(self):
+            """Returns (api_path, query) or None if the request was already answered."""
+            # Always drain the body so a rejected request cannot desync the keep-alive connection
+            self.raw_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            url = urlparse(self.path)
+            if not url.path.startswith(API_PREFIX):
+                self.send_api_error(404, "Unknown path")
+                return None
+            if not self.gate():
+                return None
+            return url.path[len(API_PREFIX):], {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        def do_GET(self):
+            request = self.begin()
+            if request is None:
+                return
+            path, query = request
+            if path == "/events":
+                events, token, has_more = store.events_since(query.get("resource", store.project_id), query.get("sync"))
+                if events is None:
+                    self.send_json(412, {"errors": [{"message": "Sync token invalid or too old."}], "sync": token})
+                else:
+                    self.send_json(200, {"data": events, "sync": token, "has_more": has_more})
+                return
+            match = re.fullmatch(r"/tasks/(\d+)", path)
+            if match:
+                task = next((t for t in store.list(store.project_id) if t["gid"] == match.group(1)), None)
+                if task is None:
+                    self.send_api_error(404, "task: Unknown object")
+                else:
+                    self.send_json(200, {"data": compact(task, query.get("opt_fields", ""))})
+                return
+            if path != "/tasks":
+                self.send_api_error(404, "Unknown path")
+                return
+
+            tasks = store.list(query.get("project", store.project_id), query.get("modified_since"))
+            limit = min(int(query.get("limit", MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+            start = int(query.get("offset", "0") or 0)
+            page = tasks[start:start + limit]
+            next_page = None
+            if start + limit < len(tasks):
+                offset = str(start + limit)
+                next_page = {"offset": offset, "path": f"/tasks?offset={offset}", "uri": f"{API_PREFIX}/tasks?offset={offset}"}
+            self.send_json(200, {"data": [compact(t, query.get("opt_fields", "")) for t in page], "next_page": next_page})
+
+        def do_POST(self):
+            request = self.begin()
+            if request is None:
+                return
+            path, _ = request
+            if path != "/tasks":
+                self.send_api_error(404, "Unknown path")
+                return
+            fields = self.read_body()
+            if not fields.get("name"):
+                self.send_api_error(400, "name: Missing input")
+                return
+            self.send_json(201, {"data": store.create(fields)})
+
+        def do_PUT(self):
+            request = self.begin()
+            if request is None:
+                return
+            path, _ = request
+            match = re.fullmatch(r"/tasks/(\d+)", path)
+            task = store.update(match.group(1), self.read_body()) if match else None
+            if task is None:
+                self.send_api_error(404, "task: Unknown object")
+                return
+            self.send_json(200, {"data": task})
+
+        def do_DELETE(self):
+            request = self.begin()
+            if request is None:
+                return
+            path, _ = request
+            match = re.fullmatch(r"/tasks/(\d+)", path)
+            if not match or store.delete(match.group(1)) is None:
+                self.send_api_error(404, "task: Unknown object")
+                return
+            self.send_json(200, {"data": {}})
+
+        def log_message(self, format, *args):
+            sys.stderr.write(f"  [mock-asana] {format % args}\n")
+
+    return MockAsanaHandler
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an in-memory Asana API for offline testing.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--project", default=DEFAULT_PROJECT_ID, help="Project GID the seeded tasks belong to.")
+    parser.add_argument("--tasks", type=int, default=150, help="Number of seeded tasks.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request.")
+    parser.add_argument("--rate-limit-every", type=int, default=0, metavar="N", help="Answer every Nth request with 429.")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429 responses.")
+    parser.add_argument("--event-retention", type=int, default=DEFAULT_EVENT_RETENTION,
+                        help="Events a sync token may lag behind before /events answers 412.")
+    args = parser.parse_args()
+
+    store = MockAsana(args.project, args.tasks, args.event_retention)
+    handler = make_handler(store, args.latency, args.rate_limit_every, args.retry_after)
+    with http.server.ThreadingHTTPServer(("127.0.0.1", args.port), handler) as httpd:
+        print(f"🧪 Mock Asana serving {len(store.tasks)} tasks on http://localhost:{args.port}{API_PREFIX}")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Mock Asana stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import argparse
+import csv
+import email.utils
+import hashlib
+import http.server
+import io
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+
+from data_utils import GIDS
+
+"""
+🧪 LOCAL GOOGLE SHEETS STAND-IN
+Serves canned CSVs on the published-sheets URL shape (/<id>/pub?gid=...&output=csv)
+with ETag validators and injectable per-tab delays and failures, so the fetch stage can be exercised offline:
+
+    python3 scripts/mock_sheets_server.py --delay services=3 --flaky reviews=2 &
+    python3 scripts/sync_engine.py --no-branch-switch --no-push --sheets-url http://localhost:8765
+"""
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, os.pardir))
+JSON_PATH = os.path.join(PROJECT_ROOT, "configs", "site-data.json")
+DEFAULT_PORT = 8765
+
+def rows_to_csv(rows):
+    headers = []
+    for row in rows:
+        for k in row.keys():
+            if k not in headers:
+                headers.append(k)
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=headers)
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
+
+def load_canned_csvs(csv_dir=None):
+    """Returns {gid: csv_text}. Reads <key>.csv / <gid>.csv from csv_dir, else derives from site-data.json."""
+    canned = {}
+    if csv_dir:
+        for key, gid in GIDS.items():
+            for name in (f"{key}.csv", f"{gid}.csv"):
+                path = os.path.join(csv_dir, name)
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        canned[gid] = f.read()
+                    break
+    else:
+        with open(JSON_PATH, "r") as f:
+            site_data = json.load(f)
+        for key, gid in GIDS.items():
+            canned[gid] = rows_to_csv(site_data.get(key, []))
+    return canned
+
+def parse_tab_values(pairs, cast):
+    """Parses ["services=3", ...] into {gid: cast(value)}; keys may be tab names or GIDs."""
+    parsed = {}
+    for pair in pairs or []:
+        name, _, value = pair.partition("=")
+        parsed[GIDS.get(name, name)] = cast(value)
+    return parsed
+
+def make_handler(canned, delays, default_delay, flaky, validators=True):
+    failures_left = dict(flaky)
+    lock = threading.Lock()
+    started_at = email.utils.formatdate(usegmt=True)
+
+    class MockSheetsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            gid = parse_qs(urlparse(self.path).query).get("gid", [None])[0]
+            time.sleep(delays.get(gid, default_delay))
+
+            with lock:
+                should_fail = failures_left.get(gid, 0) > 0
+                if should_fail:
+                    failures_left[gid] -= 1
+            if should_fail:
+                self.send_error(503, "Injected failure")
+                return
+            if gid not in canned:
+                self.send_error(404, f"Unknown gid {gid}")
+                return
+
+            body = canned[gid].encode("utf-8")
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if validators and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            if validators:
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", started_at)
+            self.send_header("Content-Type", "text/csv; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            sys.stderr.write(f"  [mock-sheets] {format % args}\n")
+
+    return MockSheetsHandler
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve canned CSVs in place of published Google Sheets.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--csv-dir", help="Directory of <key>.csv or <gid>.csv files (defaults to site-data.json contents).")
+    parser.add_argument("--delay", action="append", metavar="TAB=SECONDS", help="Inject a delay for one tab (repeatable).")
+    parser.add_argument("--default-delay", type=float, default=0.0, help="Delay applied to every tab without an explicit --delay.")
+    parser.add_argument("--flaky", action="append", metavar="TAB=COUNT", help="Answer the first COUNT requests for a tab with 503.")
+    parser.add_argument("--no-validators", action="store_true", help="Omit ETag/Last-Modified (forces content-hash cache checks).")
+    args = parser.parse_args()
+
+    canned = load_canned_csvs(args.csv_dir)
+    handler = make_handler(canned, parse_tab_values(args.delay, float), args.default_delay,
+                           parse_tab_values(args.flaky, int), validators=not args.no_validators)
+
+    with http.server.ThreadingHTTPServer(("127.0.0.1", args.port), handler) as httpd:
+        print(f"🧪 Mock Sheets serving {len(canned)} tabs on http://localhost:{args.port}")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Mock Sheets stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import json
+import os
+import re
+
+"""
+🕸️ PAGE REQUEST GRAPH
+Static model of what a browser requests when it loads each top-level page, mirroring
+js/loader.js: the page HTML and its local <script>/<link> assets, the site data (the shard
+index then the page's shards, or site-data.json), the data-component tree (one round trip per nesting level), the feature scripts chosen by
+loader.js's selector rules, and the images those features and config keys render.
+Imported by bench_server.py, prerender.py, perf_budget.py, the asset/CSS/service-worker
+builds and the sync's shard and index writers, which share its page list and loader rules.
+"""
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+COMPONENTS_DIR = "components"
+DATA_PATH = "configs/site-data.json"
+SHARDS_INDEX_PATH = "configs/shards/index.json"
+ASSET_MANIFEST_PATH = "dist/asset-manifest.json"
+
+# <tag ... data-component="name" ...></tag> as written in pages and components (always empty)
+COMPONENT_ELEMENT = re.compile(r'<(\w+)([^>]*?\bdata-component="([^"]+)"[^>]*)>\s*</\1>')
+LOCAL_REF = re.compile(r'<(?:script|link|img)\b[^>]*?\b(?:src|href)="(?!https?:|//|data:|#|mailto:)([^"?#]+)', re.I)
+CONFIG_IMAGE_KEY = re.compile(r'\b(?:style-bg|src)-config-key="([^"]+)"')
+
+# Same order and selectors as the feature detection in js/loader.js
+FEATURE_RULES = [
+    ("hero", [".hero-bg"]),
+    ("logos", ["#logos-container"]),
+    ("home-services", ["#home-categories-container"]),
+    ("portfolio", ["#portfolio-carousel"]),
+    ("reviews", ["#reviews-container"]),
+    ("team", ["#team-container"]),
+    ("subscribe", ["#subscribe-container", ".subscribe-form"]),
+    ("services", ["#services", "#experience-intro", "#icon-service-container"]),
+    ("icon-service", ["#icon-service-container"]),
+    ("learn", ["#wiki-article-container"]),
+    ("dialogs", None)
+]
+
+# assets_manifest folders whose images each feature renders
+FEATURE_IMAGE_FOLDERS = {
+    "hero": ["home-page/hero-images"],
+    "logos": ["home-page/logos"],
+    "portfolio": ["portfolio"],
+    "team": ["meet-team-page"]
+}
+
+def list_pages(root=PROJECT_ROOT):
+    """Top-level page names (index, services, ...) served under clean URLs."""
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(root) if name.endswith(".html"))
+
+def read_text(rel_path, root=PROJECT_ROOT):
+    with open(os.path.join(root, rel_path), encoding="utf-8") as f:
+        return f.read()
+
+def component_path(name):
+    return f"{COMPONENTS_DIR}/{name}.html"
+
+def load_component(name, root=PROJECT_ROOT):
+    """Returns a component's HTML, or None when loader.js would fail to fetch it."""
+    try:
+        return read_text(component_path(name), root)
+    except OSError:
+        return None
+
+def component_names(html):
+    return [m.group(3) for m in COMPONENT_ELEMENT.finditer(html) if m.group(3) != "loader" and "data-loaded" not in m.group(2)]
+
+def inline_components(html, root=PROJECT_ROOT, used=None):
+    """
+    Recursively replaces every empty data-component element with the component's HTML and
+    marks it data-loaded="true" so loader.js skips it. Missing components are left for the
+    client. `used` (a set) collects every component name that was inlined.
+    """
+    used = set() if used is None else used
+
+    def expand(match):
+        tag, attrs, name = match.groups()
+        if name == "loader" or "data-loaded" in attrs:
+            return match.group(0)
+        inner = load_component(name, root)
+        if inner is None:
+            return match.group(0)
+        used.add(name)
+        return f'<{tag}{attrs} data-loaded="true">{inline_components(inner, root, used)}</{tag}>'
+
+    return COMPONENT_ELEMENT.sub(expand, html)
+
+def component_levels(html, root=PROJECT_ROOT):
+    """Component fetches grouped by round trip: loader.js fetches each nesting level in parallel."""
+    levels = []
+    pending = component_names(html)
+    while pending:
+        levels.append(pending)
+        nested = []
+        for name in pending:
+            inner = load_component(name, root)
+            if inner:
+                nested.extend(component_names(inner))
+        pending = nested
+    return levels
+
+def matches_selector(html, selector):
+    name = re.escape(selector[1:])
+    if selector.startswith("#"):
+        return re.search(rf'\bid="{name}"', html) is not None
+    return re.search(rf'\bclass="[^"]*(?<![\w-]){name}(?![\w-])', html) is not None
+
+def detect_features(html):
+    """Feature scripts loader.js would inject for the fully inlined page HTML."""
+    return [feature for feature, selectors in FEATURE_RULES
+            if selectors is None or any(matches_selector(html, s) for s in selectors)]
+
+def local_refs(html):
+    refs = []
+    for ref in LOCAL_REF.findall(html):
+        ref = ref.lstrip("/")
+        if ref and ref not in refs:
+            refs.append(ref)
+    return refs
+
+def load_site_data(root=PROJECT_ROOT):
+    try:
+        with open(os.path.join(root, DATA_PATH), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def data_waves(page, root=PROJECT_ROOT):
+    """Data.loadMasterData() requests: the shard index then this page's shards, else site-data.json."""
+    try:
+        with open(os.path.join(root, SHARDS_INDEX_PATH), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return [[DATA_PATH]]
+    shards_dir = os.path.dirname(SHARDS_INDEX_PATH)
+    sections = index["pages"].get(page, list(index["sections"]))
+    return [[SHARDS_INDEX_PATH], [f"{shards_dir}/{index['sections'][s]}" for s in sections]]
+
+def load_asset_manifest(root=PROJECT_ROOT):
+    try:
+        with open(os.path.join(root, ASSET_MANIFEST_PATH), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def feature_sources(page, features, manifest):
+    """Feature script URLs as loader.js picks them: the page bundle, hashed files or the sources."""
+    if manifest is None:
+        return [f"js/features/{feature}.js" for feature in features]
+    bundle = manifest.get("bundles", {}).get(page)
+    if bundle and all(feature in bundle["features"] for feature in features):
+        return [bundle["src"]]
+    return [manifest["files"].get(f"js/features/{f}.js", f"js/features/{f}.js") for f in features]
+
+def is_local_asset(value):
+    return isinstance(value, str) and value.startswith("assets/")
+
+def feature_images(feature, data):
+    manifest = data.get("assets_manifest", {})
+    if feature in FEATURE_IMAGE_FOLDERS:
+        return [f"assets/images/{folder}/{name}" for folder in FEATURE_IMAGE_FOLDERS[feature]
+                for name in manifest.get(folder, [])]
+    if feature == "home-services":
+        return [c["image_url"] for c in data.get("categories", [])
+                if str(c.get("showOnHomePage", "")).upper() == "TRUE" and is_local_asset(c.get("image_url"))]
+    if feature == "services":
+        rows = data.get("categories", []) + data.get("services", [])
+        return [row["image_url"] for row in rows if is_local_asset(row.get("image_url"))]
+    return []
+
+def page_graph(page, root=PROJECT_ROOT, data=None, page_root=None):
+    """
+    Returns {"page", "waves": [[path, ...], ...], "components", "features"} where each wave is
+    a set of requests the browser issues in parallel once the previous wave has completed.
+    Paths are root-relative URL paths ("" is the page itself under its clean URL).
+    page_root reads the page HTML from elsewhere (e.g. the prerendered build/).
+    """
+    data = load_site_data(root) if data is None else data
+    page_html = read_text(f"{page}.html", page_root or root)
+    full_html = inline_components(page_html, root)
+    features = detect_features(full_html)
+    config = {item.get("key"): item.get("value") for item in data.get("config", [])}
+
+    images = [config[key] for key in CONFIG_IMAGE_KEY.findall(full_html) if is_local_asset(config.get(key))]
+    for feature in features:
+        images.extend(feature_images(feature, data))
+    images.extend(ref for ref in local_refs(full_html) if ref.startswith("assets/"))
+
+    # loader.js awaits the site data before it starts on components
+    levels = component_levels(page_html, root)
+    waves = [[page if page != "index" else ""], [ref for ref in local_refs(page_html) if not ref.startswith("assets/")]]
+    waves.extend(data_waves(page, root))
+    asset_manifest = load_asset_manifest(root)
+    if asset_manifest is not None:
+        waves[2].append(ASSET_MANIFEST_PATH)
+    waves.extend([component_path(name) for name in level] for level in levels)
+    waves.append(feature_sources(page, features, asset_manifest))
+    waves.append(list(dict.fromkeys(images)))
+    return {
+        "page": page,
+        "waves": [wave for wave in waves if wave],
+        "components": sorted({name for level in levels for name in level}),
+        "features": features
+    }
+
+def all_page_graphs(root=PROJECT_ROOT, pages=None, page_root=None):
+    data = load_site_data(root)
+    return {page: page_graph(page, root, data, page_root) for page in (pages or list_pages(root))}
+
+if __name__ == "__main__":
+    for page, graph in all_page_graphs().items():
+        total = sum(len(wave) for wave in graph["waves"])
+        print(f"📄 {page}: {total} requests in {len(graph['waves'])} waves, features: {', '.join(graph['features'])}")
@@ -0,0 +1,269 @@
+import argparse
+import gzip
+import json
+import os
+import sys
+
+import build_assets
+import build_css
+import data_utils
+import page_graph
+
+"""
+📏 PAGE WEIGHT BUDGET
+Statically resolves everything a first visit to each page downloads and totals it per page:
+    - the page HTML and the scripts and stylesheets it links, plus their @imports
+    - the site data (shard index and the page's shards, or site-data.json) and asset manifest
+    - the data-component tree, and the feature scripts loader.js selects for the result
+    - the images those features render from site-data.json (hero, logos, portfolio, team,
+      categories and services), images named by *-config-key attributes, <img> tags, and the
+      url()s of stylesheet rules whose selectors match the page markup
+Requests and bytes are grouped by kind (REQUEST_KINDS). "transfer" is the gzipped size of text
+files and the raw size of images. Images count at their original size, the widest candidate when
+WebP variants exist. Nothing fetched after load counts: the lazy search shard and the service worker's
+background precache are left out.
+
+The budget file (configs/perf-budget.json) records the accepted numbers per page. A page regresses
+when it makes more requests than recorded, or when its transfer bytes (total or for one kind) grow
+beyond the recorded value plus the file's tolerance. Regressions exit 1. The report is plain,
+deterministic text, so two commits can be compared with diff.
+
+    python3 scripts/perf_budget.py              # per-page breakdown, exit 1 on regressions
+    python3 scripts/perf_budget.py --files      # also list every request with its size
+    python3 scripts/perf_budget.py --check      # verdict only (test.sh)
+    python3 scripts/perf_budget.py --update     # accept the current numbers as the budget
+"""
+
+BUDGET_PATH = "configs/perf-budget.json"
+BUDGET_VERSION = 1
+DEFAULT_TOLERANCE = 0.05
+REQUEST_KINDS = ["html", "css", "js", "data", "component", "image", "other"]
+TEXT_EXTENSIONS = (".html", ".css", ".js", ".json", ".svg", ".txt", ".xml")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".svg", ".ico")
+# Budget keys of a page: prerendered builds are a separate set of numbers
+BUDGET_SECTIONS = {False: "pages", True: "prerendered_pages"}
+
+def request_kind(path):
+    if path.startswith("configs/") or path == page_graph.ASSET_MANIFEST_PATH:
+        return "data"
+    if path.startswith(f"{page_graph.COMPONENTS_DIR}/"):
+        return "component"
+    if path.endswith(".html"):
+        return "html"
+    if path.endswith(".css"):
+        return "css"
+    if path.endswith(".js"):
+        return "js"
+    if path.lower().endswith(IMAGE_EXTENSIONS):
+        return "image"
+    return "other"
+
+def css_url_path(url):
+    """Root-relative file path of a url() from flattened CSS, or None for remote and data: URLs."""
+    if not url.startswith("/") or url.startswith("//"):
+        return None
+    return url.split("?")[0].split("#")[0].lstrip("/")
+
+def rule_urls(nodes, tokens, found):
+    """Collects the url()s of rules matching `tokens` (and of every @font-face) into `found`."""
+    for node in nodes:
+        if node[0] == "group":
+            rule_urls(node[2], tokens, found)
+        elif node[0] == "rule" and (node[1].startswith("@font-face")
+                                    or (not node[1].startswith("@") and build_css.selector_matches(node[1], tokens))):
+            for _, url in build_css.CSS_URL.findall(node[2]):
+                path = css_url_path(url)
+                if path and path not in found:
+                    found.append(path)
+    return found
+
+def stylesheet_requests(stylesheets, root, tokens):
+    """(imports, assets): stylesheets pulled in by @import, and the url() files the page's rules use."""
+    seen = []
+    flat = "".join(build_css.flatten_css(rel_path, root, seen) for rel_path in stylesheets)
+    nodes, _ = build_css.parse_css(build_assets.minify_css(flat))
+    return [path for path in seen if path not in stylesheets], rule_urls(nodes, tokens, [])
+
+def page_requests(page, root=page_graph.PROJECT_ROOT, data=None, page_root=None):
+    """The page's requests in load order as [(path, kind)]; the page itself is "<page>.html"."""
+    graph = page_graph.page_graph(page, root, data, page_root)
+    paths = [f"{page}.html"] + [path for wave in graph["waves"][1:] for path in wave]
+
+    # Missing stylesheets still count as requests (below); they just have nothing to resolve
+    stylesheets = [path for path in paths if path.endswith(".css") and os.path.exists(os.path.join(root, path))]
+    if stylesheets:
+        full_html = page_graph.inline_components(page_graph.read_text(f"{page}.html", page_root or root), root)
+        scripts = [page_graph.read_text(path, root) for path in paths
+                   if path.endswith(".js") and os.path.exists(os.path.join(root, path))]
+        tokens = build_css.used_tokens([full_html], scripts)
+        imports, assets = stylesheet_requests(stylesheets, root, tokens)
+        position = paths.index(stylesheets[-1]) + 1
+        paths[position:position] = imports
+        paths.extend(assets)
+    return [(path, request_kind(path)) for path in dict.fromkeys(paths)]
+
+def file_sizes(path, cache):
+    """(bytes, transfer bytes) of one file, or None when it does not exist; cached by path."""
+    if path not in cache:
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except OSError:
+            cache[path] = None
+        else:
+            text = path.lower().endswith(TEXT_EXTENSIONS)
+            cache[path] = (len(body), len(gzip.compress(body)) if text else len(body))
+    return cache[path]
+
+def empty_totals():
+    return {"requests": 0, "bytes": 0, "transfer_bytes": 0}
+
+def measure_page(page, root=page_graph.PROJECT_ROOT, data=None, page_root=None, cache=None):
+    """
+    Returns {"requests", "bytes", "transfer_bytes", "kinds": {kind: totals}, "files": [...],
+    "missing": [...]}. Missing files still count as requests (the browser gets a 404).
+    """
+    cache = {} if cache is None else cache
+    result = {**empty_totals(), "kinds": {}, "files": [], "missing": []}
+    for path, kind in page_requests(page, root, data, page_root):
+        base = page_root if page_root and path == f"{page}.html" else root
+        sizes = file_sizes(os.path.join(base, path), cache)
+        if sizes is None:
+            result["missing"].append(path)
+            sizes = (0, 0)
+        totals = result["kinds"].setdefault(kind, empty_totals())
+        for target in (result, totals):
+            target["requests"] += 1
+            target["bytes"] += sizes[0]
+            target["transfer_bytes"] += sizes[1]
+        result["files"].append({"path": path, "kind": kind, "bytes": sizes[0], "transfer_bytes": sizes[1]})
+    result["kinds"] = {kind: result["kinds"][kind] for kind in REQUEST_KINDS if kind in result["kinds"]}
+    return result
+
+def measure_pages(root=page_graph.PROJECT_ROOT, pages=None, data=None, page_root=None):
+    data = page_graph.load_site_data(root) if data is None else data
+    cache = {}
+    return {page: measure_page(page, root, data, page_root, cache) for page in (pages or page_graph.list_pages(page_root or root))}
+
+def load_budget(path=None):
+    try:
+        with open(path or os.path.join(page_graph.PROJECT_ROOT, BUDGET_PATH), "r") as f:
+            budget = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return budget if budget.get("version") == BUDGET_VERSION else None
+
+def budget_entry(measurement):
+    """What the budget file records for one page."""
+    return {**{key: measurement[key] for key in empty_totals()}, "kinds": measurement["kinds"]}
+
+def compare_totals(label, current, allowed, tolerance):
+    problems = []
+    if current["requests"] > allowed.get("requests", current["requests"]):
+        problems.append(f"{label}requests {allowed['requests']} -> {current['requests']}")
+    limit = allowed.get("transfer_bytes")
+    if limit is not None and current["transfer_bytes"] > limit * (1 + tolerance):
+        problems.append(f"{label}transfer {format_kb(limit)} -> {format_kb(current['transfer_bytes'])} "
+                        f"(+{(current['transfer_bytes'] - limit) / max(limit, 1) * 100:.0f}%)")
+    return problems
+
+def check_budget(measurements, budget, prerendered=False):
+    """{page: [regression, ...]} for pages over budget; pages without a budget are not checked."""
+    tolerance = budget.get("tolerance", DEFAULT_TOLERANCE)
+    recorded = budget.get(BUDGET_SECTIONS[prerendered], {})
+    regressions = {}
+    for page, measurement in measurements.items():
+        allowed = recorded.get(page)
+        if allowed is None:
+            continue
+        problems = compare_totals("", measurement, allowed, tolerance)
+        for kind, totals in measurement["kinds"].items():
+            problems.extend(compare_totals(f"{kind} ", totals, allowed.get("kinds", {}).get(kind, empty_totals()), tolerance))
+        if problems:
+            regressions[page] = problems
+    return regressions
+
+def update_budget(measurements, budget, prerendered=False, path=None):
+    """Records the measured pages in the budget file (other pages and settings are kept). Returns True if written."""
+    budget = budget or {"version": BUDGET_VERSION, "tolerance": DEFAULT_TOLERANCE}
+    section = budget.setdefault(BUDGET_SECTIONS[prerendered], {})
+    section.update({page: budget_entry(measurement) for page, measurement in measurements.items()})
+    return data_utils.write_bytes_if_changed(path or os.path.join(page_graph.PROJECT_ROOT, BUDGET_PATH),
+                                             data_utils.canonical_json(budget))
+
+def format_kb(size):
+    return f"{size / 1024:.1f} KB"
+
+def print_page_report(page, measurement, allowed=None, show_files=False):
+    print(f"{page}: {measurement['requests']} requests, {format_kb(measurement['bytes'])} "
+          f"({format_kb(measurement['transfer_bytes'])} transferred)"
+          + (f", budget {allowed['requests']} requests / {format_kb(allowed['transfer_bytes'])}" if allowed else ""))
+    for kind, totals in measurement["kinds"].items():
+        print(f"    {kind:<10} {totals['requests']:>4}  {format_kb(totals['bytes']):>12}  {format_kb(totals['transfer_bytes']):>12}")
+    if show_files:
+        for entry in measurement["files"]:
+            print(f"        {entry['kind']:<10} {format_kb(entry['bytes']):>12}  {entry['path']}")
+    for path in measurement["missing"]:
+        print(f"    ⚠️  missing: {path}")
+
+def print_sync_check(data, root=page_graph.PROJECT_ROOT):
+    """One-line budget check for sync_engine.py: new sheet images are the usual reason a page grows."""
+    budget = load_budget(os.path.join(root, BUDGET_PATH))
+    if budget is None:
+        return
+    regressions = check_budget(measure_pages(root, data=data), budget)
+    if not regressions:
+        print(f"  📏 All pages within the weight budget ({BUDGET_PATH})")
+        return
+    for page, problems in sorted(regressions.items()):
+        print(f"  ⚠️  {page} is over its weight budget: {'; '.join(problems)}")
+    print("     See what grew with: python3 scripts/perf_budget.py --files (accept it with --update)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Total each page's requests and bytes and check them against the budget file.")
+    parser.add_argument("--pages", help="Comma-separated page names (default: every top-level page).")
+    parser.add_argument("--budget", help=f"Budget file (default {BUDGET_PATH}).")
+    parser.add_argument("--update", action="store_true", help="Write the current numbers to the budget file instead of checking.")
+    parser.add_argument("--check", action="store_true", help="Only print the verdict (no per-page breakdown).")
+    parser.add_argument("--files", action="store_true", help="List every request with its size under its page.")
+    parser.add_argument("--json", help="Write the measurements (with per-file sizes) as JSON to this path.")
+    parser.add_argument("--prerendered", nargs="?", const="build", metavar="DIR",
+                        help="Measure the prerendered pages (default build/) against their own budget.")
+    args = parser.parse_args()
+
+    page_root = os.path.abspath(os.path.join(page_graph.PROJECT_ROOT, args.prerendered)) if args.prerendered else None
+    prerendered = page_root is not None
+    measurements = measure_pages(pages=args.pages.split(",") if args.pages else None, page_root=page_root)
+    budget = load_budget(args.budget)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(measurements, f, indent=2)
+
+    if args.update:
+        written = update_budget(measurements, budget, prerendered, args.budget)
+        print(f"📏 Budget {'updated' if written else 'unchanged'} for {len(measurements)} pages ({args.budget or BUDGET_PATH})")
+        return
+
+    recorded = (budget or {}).get(BUDGET_SECTIONS[prerendered], {})
+    if not args.check:
+        print(f"📏 Page weight ({'prerendered ' + args.prerendered if prerendered else 'source pages'}): "
+              "requests, bytes, transferred")
+        for page, measurement in measurements.items():
+            print_page_report(page, measurement, recorded.get(page), args.files)
+
+    if budget is None:
+        print(f"❌ No budget file at {args.budget or BUDGET_PATH}. Create it with: python3 scripts/perf_budget.py --update")
+        sys.exit(1)
+    unbudgeted = [page for page in measurements if page not in recorded]
+    if unbudgeted:
+        print(f"⚠️  No budget yet for: {', '.join(unbudgeted)} (add with --update)")
+    regressions = check_budget(measurements, budget, prerendered)
+    if regressions:
+        for page, problems in regressions.items():
+            print(f"❌ {page} over budget: {'; '.join(problems)}")
+        sys.exit(1)
+    print(f"✅ {len(measurements) - len(unbudgeted)} pages within budget (tolerance {budget.get('tolerance', DEFAULT_TOLERANCE):.0%}).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+"""
+⏱️ PERF TRACE
+Span instrumentation shared by the data tools. `with span("compare"):` records one timed
+phase (name, category, thread, start, duration, args); spans nest and are thread-safe, so the
+per-tab fetch workers and every git command show up on their own rows. Nothing is recorded
+until a tool enables the tracer with --profile, which then writes:
+    - a Chrome trace-event JSON (open in chrome://tracing or https://ui.perfetto.dev)
+    - a per-phase summary table (calls, total, max, share of wall time)
+    - one line in scripts/.cache/profiles/history.jsonl, to follow sync latency across runs
+--cprofile additionally runs the hot phases (hot=True spans on the main thread) under
+cProfile and prints their slowest functions next to a .pstats dump.
+"""
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "profiles")
+HISTORY_NAME = "history.jsonl"
+CPROFILE_TOP = 15
+
+class Tracer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.enabled = False
+        self.tool = None
+        self.trace_path = None
+        self.events = []
+        self.origin = time.perf_counter()
+        self.started_at = None
+        self.profiler = None
+        self.profiling = False
+
+    def start(self, tool, trace_path=None, cprofile=False):
+        with self.lock:
+            self.enabled = True
+            self.tool = tool
+            self.trace_path = trace_path
+            self.events = []
+            self.origin = time.perf_counter()
+            self.started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            self.profiler = cProfile.Profile() if cprofile else None
+
+    def record(self, name, cat, start, end, args):
+        thread = threading.current_thread()
+        with self.lock:
+            self.events.append({"name": name, "cat": cat, "start": start - self.origin, "dur": end - start,
+                                "tid": thread.ident, "thread": thread.name, "args": args})
+
+    @contextmanager
+    def span(self, name, cat="phase", hot=False, **args):
+        """Times the block as one span. hot=True spans are also cProfiled when --cprofile is on."""
+        if not self.enabled:
+            yield
+            return
+        profile = (hot and self.profiler is not None and not self.profiling
+                   and threading.current_thread() is threading.main_thread())
+        if profile:
+            self.profiling = True
+            self.profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if profile:
+                self.profiler.disable()
+                self.profiling = False
+            self.record(name, cat, start, end, args)
+
+    def wall_time(self):
+        return time.perf_counter() - self.origin
+
+    def summary(self):
+        """[(name, cat, calls, total, max)] ordered by total time."""
+        rows = {}
+        for event in self.events:
+            row = rows.setdefault(event["name"], [event["cat"], 0, 0.0, 0.0])
+            row[1] += 1
+            row[2] += event["dur"]
+            row[3] = max(row[3], event["dur"])
+        return sorted(((name, *row) for name, row in rows.items()), key=lambda r: -r[3])
+
+    def chrome_trace(self, wall):
+        """Trace-event JSON: one complete ("X") event per span plus thread-name metadata, times in µs."""
+        pid = os.getpid()
+        threads = {}
+        trace = []
+        for event in sorted(self.events, key=lambda e: e["start"]):
+            threads.setdefault(event["tid"], event["thread"])
+            trace.append({"name": event["name"], "cat": event["cat"], "ph": "X", "pid": pid, "tid": event["tid"],
+                          "ts": round(event["start"] * 1e6, 1), "dur": round(event["dur"] * 1e6, 1),
+                          "args": event["args"]})
+        trace.append({"name": self.tool, "cat": "run", "ph": "X", "pid": pid, "tid": threading.main_thread().ident,
+                      "ts": 0, "dur": round(wall * 1e6, 1), "args": {"started_at": self.started_at}})
+        meta = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in threads.items()]
+        meta.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.tool}})
+        return {"traceEvents": meta + trace, "displayTimeUnit": "ms"}
+
+TRACER = Tracer()
+
+def span(name, cat="phase", hot=False, **args):
+    return TRACER.span(name, cat, hot, **args)
+
+def add_profile_arguments(parser):
+    """Registers --profile / --cprofile on an argparse parser."""
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="TRACE_JSON",
+                        help="Time every phase; write a Chrome trace (default scripts/.cache/profiles/) and print a summary.")
+    parser.add_argument("--cprofile", action="store_true", help="With --profile, also cProfile the hot phases.")
+
+def start_profiling(args, tool):
+    if args.profile is not None:
+        TRACER.start(tool, args.profile or None, args.cprofile)
+
+def print_summary(rows, wall):
+    print(f"⏱️  Profile ({wall * 1000:.0f} ms wall; nested spans overlap, so shares do not add up to 100%):")
+    print(f"     {'phase':<28} {'cat':<6} {'calls':>5} {'total ms':>9} {'max ms':>8} {'% wall':>7}")
+    for name, cat, calls, total, longest in rows:
+        print(f"     {name[:28]:<28} {cat:<6} {calls:>5} {total * 1000:>9.1f} {longest * 1000:>8.1f} {total / wall * 100:>6.1f}%")
+
+def print_cprofile(profiler, path):
+    profiler.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(CPROFILE_TOP)
+    lines = [line for line in out.getvalue().splitlines() if line.strip()]
+    start = next((i for i, line in enumerate(lines) if line.lstrip().startswith("ncalls")), 0)
+    print(f"🔬 cProfile of hot phases (top {CPROFILE_TOP} by cumulative time, full stats in {os.path.relpath(path)}):")
+    for line in lines[start:]:
+        print(f"     {line}")
+
+def finish_profiling():
+    """Writes the trace, the summary and the history line. Safe to call more than once (later calls do nothing)."""
+    if not TRACER.enabled:
+        return None
+    TRACER.enabled = False
+    wall = TRACER.wall_time()
+    rows = TRACER.summary()
+    stamp = TRACER.started_at.replace(":", "").replace("-", "")
+    path = TRACER.trace_path or os.path.join(PROFILE_DIR, f"{TRACER.tool}-{stamp}.trace.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(TRACER.chrome_trace(wall), f)
+
+    print_summary(rows, wall)
+    print(f"🧾 Chrome trace written to {os.path.relpath(path)} ({len(TRACER.events)} spans)")
+    if TRACER.profiler is not None:
+        print_cprofile(TRACER.profiler, os.path.splitext(path)[0] + ".pstats")
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    entry = {"tool": TRACER.tool, "started_at": TRACER.started_at, "wall_ms": round(wall * 1000, 1),
+             "phases": {name: round(total * 1000, 1) for name, cat, _, total, _ in rows if cat != "fetch"}}
+    with open(os.path.join(PROFILE_DIR, HISTORY_NAME), "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+    return path
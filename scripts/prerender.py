@@ -0,0 +1,143 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+
+import build_css
+import data_utils
+import page_graph
+
+"""
+🧱 STATIC PRERENDER BUILD
+Resolves the data-component tree of every top-level page and writes fully inlined HTML to
+build/, with each inlined element marked data-loaded="true" so js/loader.js skips the
+component fetch waterfall. Local script/stylesheet references are pointed at their
+fingerprinted dist/ copies when scripts/build_assets.py has been run. When scripts/build_css.py
+has been run, the page's stylesheet links are replaced by its inlined critical CSS and a
+non-blocking load of the CSS bundle. Fragment hashes are recorded in build/.prerender.json and a page
+is rebuilt only when its own HTML or one of the fragments it pulls in has changed.
+Serve the output with: python3 scripts/dev_server.py --prerendered
+"""
+
+BUILD_DIR = os.path.join(page_graph.PROJECT_ROOT, "build")
+MANIFEST_NAME = ".prerender.json"
+MANIFEST_VERSION = 2
+
+ASSET_REF = re.compile(r'\b(src|href)="(/?)((?:js|styles)/[^"?#]+)"')
+STYLESHEET_LINK = re.compile(r'([ \t]*)<link\b[^>]*\brel="stylesheet"[^>]*>(\n?)')
+LINK_HREF = re.compile(r'\bhref="/?([^"?#]+)"')
+
+def content_hash(rel_path, root=page_graph.PROJECT_ROOT):
+    try:
+        with open(os.path.join(root, rel_path), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return None
+
+def load_manifest(build_dir):
+    try:
+        with open(os.path.join(build_dir, MANIFEST_NAME), "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "fragments": {}, "pages": {}}
+
+def page_dependencies(page, root, fragment_hashes):
+    """{rel_path: hash} for the page and every fragment it references (None when missing)."""
+    deps = {f"{page}.html": content_hash(f"{page}.html", root)}
+    for level in page_graph.component_levels(page_graph.read_text(f"{page}.html", root), root):
+        for name in level:
+            rel_path = page_graph.component_path(name)
+            if rel_path not in fragment_hashes:
+                fragment_hashes[rel_path] = content_hash(rel_path, root)
+            deps[rel_path] = fragment_hashes[rel_path]
+    return deps
+
+def rewrite_asset_refs(html, asset_manifest):
+    if not asset_manifest:
+        return html
+    files = asset_manifest["files"]
+    return ASSET_REF.sub(lambda m: f'{m.group(1)}="{m.group(2)}{files[m.group(3)]}"' if m.group(3) in files else m.group(0), html)
+
+def inline_critical_css(html, css_entry, root=page_graph.PROJECT_ROOT):
+    """Swaps the page's local stylesheet links for <style> with its critical CSS plus a preload of the bundle."""
+    if not css_entry:
+        return html
+    links = [m for m in STYLESHEET_LINK.finditer(html)
+             if LINK_HREF.search(m.group(0)) and LINK_HREF.search(m.group(0)).group(1) in css_entry["stylesheets"]]
+    if len(links) != len(css_entry["stylesheets"]):
+        return html
+    indent, bundle = links[0].group(1), f"/{css_entry['bundle']}"
+    critical = page_graph.read_text(css_entry["critical"], root).strip()
+    replacement = (f"{indent}<style data-critical-css>{critical}</style>\n"
+                   f"{indent}<link rel=\"preload\" href=\"{bundle}\" as=\"style\" onload=\"this.onload=null;this.rel='stylesheet'\">\n"
+                   f"{indent}<noscript><link rel=\"stylesheet\" href=\"{bundle}\"></noscript>\n")
+    for match in reversed(links[1:]):
+        html = html[:match.start()] + html[match.end():]
+    return html[:links[0].start()] + replacement + html[links[0].end():]
+
+def build_pages(root=page_graph.PROJECT_ROOT, build_dir=BUILD_DIR, pages=None, force=False):
+    """Prerenders pages into build_dir. Returns stats {built, unchanged, removed, changed_fragments}."""
+    os.makedirs(build_dir, exist_ok=True)
+    manifest = load_manifest(build_dir)
+    full_build = not pages
+    pages = pages or page_graph.list_pages(root)
+    fragment_hashes = {}
+    asset_manifest = page_graph.load_asset_manifest(root)
+    css_manifest = build_css.load_manifest(root) or {"pages": {}}
+    stats = {"built": [], "unchanged": [], "removed": [], "changed_fragments": []}
+
+    for page in pages:
+        deps = page_dependencies(page, root, fragment_hashes)
+        deps[page_graph.ASSET_MANIFEST_PATH] = asset_manifest and asset_manifest["files"]
+        css_entry = css_manifest["pages"].get(page)
+        deps[build_css.CSS_DIST] = css_entry and [css_entry["bundle"], css_entry["critical"]]
+        key = hashlib.sha256(json.dumps(deps, sort_keys=True).encode()).hexdigest()
+        out_path = os.path.join(build_dir, f"{page}.html")
+        if not force and manifest["pages"].get(page, {}).get("key") == key and os.path.exists(out_path):
+            stats["unchanged"].append(page)
+            continue
+        html = page_graph.inline_components(page_graph.read_text(f"{page}.html", root), root)
+        html = inline_critical_css(html, css_entry, root)
+        html = rewrite_asset_refs(html, asset_manifest)
+        data_utils.write_file_atomic(out_path, html.encode("utf-8"), "wb")
+        manifest["pages"][page] = {"key": key, "fragments": sorted(d for d in deps if d.startswith(page_graph.COMPONENTS_DIR))}
+        stats["built"].append(page)
+
+    if full_build:
+        for page in [p for p in manifest["pages"] if p not in pages]:
+            stale_path = os.path.join(build_dir, f"{page}.html")
+            if os.path.exists(stale_path):
+                os.remove(stale_path)
+            del manifest["pages"][page]
+            stats["removed"].append(page)
+
+    stats["changed_fragments"] = sorted(rel for rel, h in fragment_hashes.items()
+                                        if rel in manifest["fragments"] and manifest["fragments"][rel] != h)
+    manifest["fragments"].update(fragment_hashes)
+    data_utils.write_json_canonical(os.path.join(build_dir, MANIFEST_NAME), manifest, minified_twin=False)
+    return stats
+
+def print_build_report(stats, build_dir):
+    print(f"🧱 Prerendered {len(stats['built'])} pages into {os.path.relpath(build_dir)}/ "
+          f"({len(stats['unchanged'])} unchanged, {len(stats['removed'])} removed)")
+    if stats["changed_fragments"]:
+        print(f"  ✏️  Changed fragments: {', '.join(stats['changed_fragments'])}")
+    for page in stats["built"]:
+        print(f"  ✅ {page}.html")
+
+def main():
+    parser = argparse.ArgumentParser(description="Inline data-component fragments into static pages.")
+    parser.add_argument("--out", default=BUILD_DIR, help="Output directory (default build/).")
+    parser.add_argument("--pages", help="Comma-separated pages to build (default: every top-level page).")
+    parser.add_argument("--force", action="store_true", help="Rebuild every page even if its fragments are unchanged.")
+    args = parser.parse_args()
+
+    stats = build_pages(build_dir=os.path.abspath(args.out), pages=args.pages.split(",") if args.pages else None, force=args.force)
+    print_build_report(stats, os.path.abspath(args.out))
+
+if __name__ == "__main__":
+    main()
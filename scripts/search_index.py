@@ -0,0 +1,222 @@
+import argparse
+import bisect
+import html
+import json
+import math
+import os
+import re
+import sys
+import unicodedata
+
+import page_graph
+
+"""
+🔎 SEARCH INDEX
+Compiles the learn articles and the services into a compact inverted index, written at sync
+time as its own lazily-fetched shard (configs/shards/search.<hash>.json, listed under "lazy"
+in the shard index) so pages that never search never download it:
+    docs   [[section, position], ...]            one entry per article / service
+    terms  {stem: [doc, score, doc, score, ...]}  flat postings, doc ids ascending
+A posting's score is the term frequency weighted by field (FIELD_WEIGHTS); idf is applied at
+query time. Text is lowercased, accent-folded, split on non-alphanumerics, stop-word filtered
+and suffix-stemmed. js/utils.js (Search) mirrors analyze()/stem() exactly; change both together.
+
+    python3 scripts/search_index.py "colour analysis"   # query the current site-data.json
+    python3 scripts/search_index.py --check             # every typed prefix still finds its document
+"""
+
+INDEX_VERSION = 1
+FIELD_WEIGHTS = {"title": 3, "category": 2, "body": 1}
+# Which columns feed each field, per site-data section
+SEARCH_SECTIONS = {
+    "articles": {"title": ["title"], "category": ["category"], "body": ["content"]},
+    "services": {"title": ["title"], "category": ["category"],
+                 "body": ["short_description", "long_description", "footer"]},
+}
+MIN_TOKEN_LENGTH = 2
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have", "he", "her",
+    "his", "how", "i", "if", "in", "into", "is", "it", "its", "ll", "me", "my", "no", "not", "of", "on",
+    "or", "our", "re", "she", "so", "that", "the", "their", "them", "then", "there", "they", "this",
+    "to", "us", "ve", "was", "we", "were", "what", "when", "which", "who", "will", "with", "you", "your",
+}
+# First match wins; the remaining stem must keep at least MIN_STEM_LENGTH characters
+SUFFIXES = [
+    ("ational", "ate"), ("ization", "ize"), ("iveness", "ive"), ("fulness", "ful"), ("ousness", "ous"),
+    ("sses", "ss"), ("ies", "y"), ("ing", ""), ("edly", ""), ("ed", ""), ("ment", ""), ("ness", ""),
+    ("ly", ""), ("s", ""),
+]
+MIN_STEM_LENGTH = 3
+KEEP_DOUBLE = set("lsz")
+TAG_RE = re.compile(r"<[^>]*>")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def fold(text):
+    """Lowercase, accents removed and HTML tags/entities dropped."""
+    text = html.unescape(TAG_RE.sub(" ", str(text or "")))
+    text = text.lower()
+    if text.isascii():
+        return text
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+def stem(word):
+    """Light suffix stripper: styling/styles/style -> styl, dresses -> dress, shopping -> shop."""
+    for suffix, replacement in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            if suffix == "s" and word[-2] in "isu":
+                break
+            word = word[:len(word) - len(suffix)] + replacement
+            break
+    if word.endswith("e") and len(word) > MIN_STEM_LENGTH + 1:
+        word = word[:-1]
+    if len(word) > MIN_STEM_LENGTH and word[-1] == word[-2] and word[-1] not in KEEP_DOUBLE and not word[-1].isdigit():
+        word = word[:-1]
+    return word
+
+def tokens(text):
+    """The folded, stop-word filtered words of `text`, in order, before stemming."""
+    return [token for token in TOKEN_RE.findall(fold(text)) if len(token) >= MIN_TOKEN_LENGTH and token not in STOPWORDS]
+
+def analyze(text):
+    """The stemmed terms of `text`, in order (duplicates kept)."""
+    return [stem(token) for token in tokens(text)]
+
+def build_search_index(data):
+    """The search shard for `data` (articles and services)."""
+    docs, postings = [], {}
+    for section, fields in SEARCH_SECTIONS.items():
+        for position, row in enumerate(data.get(section) or []):
+            doc = len(docs)
+            docs.append([section, position])
+            scores = {}
+            for field, columns in fields.items():
+                for column in columns:
+                    for term in analyze(row.get(column)):
+                        scores[term] = scores.get(term, 0) + FIELD_WEIGHTS[field]
+            for term, score in scores.items():
+                postings.setdefault(term, []).extend((doc, score))
+    return {"version": INDEX_VERSION, "fields": FIELD_WEIGHTS, "docs": docs, "terms": postings}
+
+class SearchIndex:
+    """Query API over a built (or loaded) search shard."""
+    def __init__(self, index):
+        self.docs = index["docs"]
+        self.terms = index["terms"]
+        self.sorted_terms = sorted(self.terms)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(json.loads(f.read()))
+
+    def expand(self, term):
+        """Indexed terms starting with `term` (as-you-type matching of the last query word)."""
+        start = bisect.bisect_left(self.sorted_terms, term)
+        end = bisect.bisect_left(self.sorted_terms, term + "\uffff")
+        return self.sorted_terms[start:end]
+
+    def completions(self, word):
+        """
+        Indexed stems that `word` may be cut short of but does not prefix, because typing has
+        gone past the stem into its stripped suffix: stylin -> styl(ing), shoppi -> shop(ping),
+        storie -> story (ies).
+        """
+        found = set()
+        for end in range(MIN_STEM_LENGTH, len(word)):
+            base, rest = word[:end], word[end:]
+            # Doubled final consonants and a trailing "e" are dropped by stem() as well
+            tails = {rest, rest[1:] if rest[0] in (base[-1], "e") else rest}
+            for suffix, replacement in SUFFIXES:
+                if not any(suffix.startswith(tail) for tail in tails):
+                    continue
+                term = base + replacement
+                for candidate in (term, term[:-1] if term.endswith("e") else term):
+                    if candidate in self.terms:
+                        found.add(candidate)
+        return found
+
+    def prefix_terms(self, token):
+        """Indexed terms a partly typed `token` may become: prefix matches of it and of its stem, plus completions()."""
+        return set(self.expand(stem(token))) | set(self.expand(token)) | self.completions(token)
+
+    def term_scores(self, terms):
+        """{doc: idf-weighted score} for documents containing any of `terms`."""
+        scores = {}
+        for term in terms:
+            postings = self.terms.get(term, [])
+            idf = math.log(1 + len(self.docs) / (len(postings) // 2))
+            for i in range(0, len(postings), 2):
+                doc = postings[i]
+                scores[doc] = max(scores.get(doc, 0), postings[i + 1] * idf)
+        return scores
+
+    def search(self, query, limit=10, prefix=True):
+        """
+        Documents matching every query word, best first: [{section, position, score}].
+        With prefix=True the last word also matches longer terms, so partial input finds results.
+        """
+        words = tokens(query)
+        if not words:
+            return []
+        totals = None
+        for i, word in enumerate(words):
+            terms = self.prefix_terms(word) if prefix and i == len(words) - 1 else [stem(word)]
+            scores = self.term_scores([term for term in terms if term in self.terms])
+            totals = scores if totals is None else {doc: totals[doc] + score for doc, score in scores.items() if doc in totals}
+            if not totals:
+                return []
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [{"section": self.docs[doc][0], "position": self.docs[doc][1], "score": round(score, 3)}
+                for doc, score in ranked]
+
+def prefix_misses(data, index=None):
+    """
+    [(typed, word, section, position)] for every partial input that loses a document: each prefix
+    of each indexed word, typed as the last query word, must still find the document it is in.
+    """
+    index = index or build_search_index(data)
+    engine = SearchIndex(index)
+    found, misses = {}, []
+    for doc, (section, position) in enumerate(index["docs"]):
+        row = data[section][position]
+        words = {word for columns in SEARCH_SECTIONS[section].values() for column in columns for word in tokens(row.get(column))}
+        for word in sorted(words):
+            for end in range(MIN_TOKEN_LENGTH, len(word) + 1):
+                typed = word[:end]
+                if typed in STOPWORDS:
+                    continue
+                if typed not in found:
+                    found[typed] = {(hit["section"], hit["position"]) for hit in engine.search(typed, limit=len(index["docs"]))}
+                if (section, position) not in found[typed]:
+                    misses.append((typed, word, section, position))
+    return misses
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the search index built from site-data.json.")
+    parser.add_argument("query", nargs="?", help="Words to search for.")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum number of results.")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit 1 if some partly typed word stops finding its document (as-you-type regression check).")
+    args = parser.parse_args()
+    if not args.query and not args.check:
+        parser.error("a query or --check is required")
+
+    with open(os.path.join(page_graph.PROJECT_ROOT, page_graph.DATA_PATH), "rb") as f:
+        data = json.loads(f.read())
+    index = build_search_index(data)
+    if args.check:
+        misses = prefix_misses(data, index)
+        for typed, word, section, position in misses[:20]:
+            print(f"  ❌ {typed!r} (typing {word!r}) loses [{section}] {data[section][position].get('title')}")
+        if misses:
+            print(f"❌ {len(misses)} partial inputs lose a document.")
+            sys.exit(1)
+        print("✅ Every partly typed word still finds its document.")
+        return
+    print(f"🔎 {len(index['docs'])} documents, {len(index['terms'])} terms")
+    for hit in SearchIndex(index).search(args.query, args.limit):
+        row = data[hit["section"]][hit["position"]]
+        print(f"  {hit['score']:7.2f}  [{hit['section']}] {row.get('title')}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import sys
+
+import data_utils
+import page_graph
+
+"""
+🗂️ SITE-DATA INDEXES
+Compiles the sheet rows into the lookup tables the client would otherwise rebuild on every
+page, stored as the `indexes` section of site-data.json (and its own shard):
+    config               {KEY: value} (the last row wins, as Utils.getConfig did)
+    config_lists         pipe-delimited config values pre-split (LIST_CONFIG_KEYS)
+    services_by_category {category: [positions in services]}
+    service_by_title     {title: position in services}
+    service_inclusions   each service's comma-separated footer, pre-split (aligned with services)
+    home_categories      positions in categories with showOnHomePage TRUE
+    team_images          meet-team-page image matched to each team member (aligned with team)
+    assets               {reference: {src, width, height}} for every assets/images/ path the
+                         sheets mention, resolved against assets_manifest (hash-versioned src)
+A service whose category is not in categories, or an asset reference missing from the
+manifest, raises UnresolvedReferenceError so the sync fails before anything is written.
+
+    python3 scripts/site_indexes.py            # recompute indexes in configs/site-data.json
+    python3 scripts/site_indexes.py --check    # exit 1 if they are stale or a reference is unresolved
+"""
+
+ASSET_PREFIX = "assets/images/"
+# Config values that hold a list, with their delimiter
+LIST_CONFIG_KEYS = {"LOADER_PHRASES": "|"}
+INCLUSIONS_DELIMITER = ","
+TEAM_IMAGE_FOLDER = "meet-team-page"
+
+class UnresolvedReferenceError(ValueError):
+    """site-data refers to a category or an image that does not exist."""
+    def __init__(self, problems):
+        super().__init__(f"{len(problems)} unresolved reference(s) in site-data:\n"
+                         + "\n".join(f"     - {problem}" for problem in problems))
+        self.problems = problems
+
+def split_list(value, delimiter):
+    return [part.strip() for part in str(value or "").split(delimiter) if part.strip()]
+
+def asset_path(ref):
+    """Path below assets/images/ for a local image reference, or None for anything else (URLs, text)."""
+    ref = str(ref or "").strip().lstrip("/").split("?", 1)[0]
+    return ref[len(ASSET_PREFIX):] if ref.startswith(ASSET_PREFIX) else None
+
+def resolve_asset(path, manifest, meta):
+    folder, file = path.rsplit("/", 1) if "/" in path else ("root", path)
+    if file not in manifest.get(folder, []):
+        return None
+    info = meta.get(path) or {}
+    asset = {"src": f"{ASSET_PREFIX}{path}" + (f"?v={info['hash']}" if info.get("hash") else "")}
+    if info.get("width") and info.get("height"):
+        asset.update(width=info["width"], height=info["height"])
+    return asset
+
+def match_team_image(name, images):
+    """The image whose filename contains the member's first name (e.g. "Ayushi Vyas" -> ayushi.jpg), else the first one."""
+    first_name = str(name or "").split(" ")[0].lower()
+    return next((image for image in images if first_name and first_name in image.lower()), images[0] if images else None)
+
+def build_indexes(data):
+    """Returns the `indexes` section for `data`. Raises UnresolvedReferenceError listing every bad reference."""
+    manifest = data.get("assets_manifest") or {}
+    meta = data.get("assets_meta") or {}
+    problems = []
+    assets = {}
+
+    def reference(where, ref):
+        path = asset_path(ref)
+        if path is None:
+            return
+        asset = resolve_asset(path, manifest, meta)
+        if asset is None:
+            problems.append(f"{where}: {ref} is not in assets_manifest")
+        else:
+            assets[ref] = asset
+
+    config = {}
+    for row in data.get("config", []):
+        if row.get("key"):
+            config[row["key"]] = row.get("value", "")
+            reference(f"config {row['key']}", row.get("value"))
+
+    categories = data.get("categories", [])
+    services_by_category = {c.get("name"): [] for c in categories if c.get("name")}
+    for i, category in enumerate(categories):
+        reference(f"categories[{i}] {category.get('name')!r} image_url", category.get("image_url"))
+
+    service_by_title, inclusions = {}, []
+    for i, service in enumerate(data.get("services", [])):
+        title = service.get("title", "")
+        if service.get("category") in services_by_category:
+            services_by_category[service["category"]].append(i)
+        else:
+            problems.append(f"services[{i}] {title!r}: category {service.get('category')!r} is not in categories")
+        service_by_title.setdefault(title, i)
+        inclusions.append(split_list(service.get("footer"), INCLUSIONS_DELIMITER))
+        reference(f"services[{i}] {title!r} image_url", service.get("image_url"))
+
+    if problems:
+        raise UnresolvedReferenceError(problems)
+
+    team_images = manifest.get(TEAM_IMAGE_FOLDER, [])
+    return {
+        "config": config,
+        "config_lists": {key: split_list(config[key], delimiter) for key, delimiter in LIST_CONFIG_KEYS.items() if key in config},
+        "services_by_category": services_by_category,
+        "service_by_title": service_by_title,
+        "service_inclusions": inclusions,
+        "home_categories": [i for i, c in enumerate(categories) if str(c.get("showOnHomePage", "")).upper() == "TRUE"],
+        "team_images": [match_team_image(member.get("name"), team_images) for member in data.get("team", [])],
+        "assets": assets,
+    }
+
+def attach_indexes(data):
+    """Recomputes data["indexes"] in place. Returns True if it changed."""
+    indexes = build_indexes(data)
+    changed = data.get("indexes") != indexes
+    data["indexes"] = indexes
+    return changed
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute the precomputed lookup indexes in site-data.json.")
+    parser.add_argument("--check", action="store_true", help="Only verify; exit 1 if the indexes are stale or a reference is unresolved.")
+    args = parser.parse_args()
+
+    path = os.path.join(page_graph.PROJECT_ROOT, page_graph.DATA_PATH)
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    try:
+        changed = attach_indexes(data)
+    except UnresolvedReferenceError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if args.check:
+        print("❌ indexes in site-data.json are stale. Run: python3 scripts/site_indexes.py" if changed else "✅ indexes are up to date.")
+        sys.exit(1 if changed else 0)
+    data_utils.write_json_canonical(path, data)
+    print(f"🗂️  indexes {'updated' if changed else 'already up to date'} in {page_graph.DATA_PATH}"
+          " (regenerate shards with python3 scripts/site_shards.py)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+
+import data_utils
+import page_graph
+import search_index
+
+"""
+🧩 SITE-DATA SHARDS
+Splits site-data.json into minified, content-hashed shards (configs/shards/<section>.<hash>.json)
+plus a small index.json mapping each section to its shard and each page to the sections it
+needs. Shard names change only when their content does, so clients can cache them forever
+and fetch only what the current page renders; site-data.json stays the complete copy.
+Derived shards that no page loads up front (the search index) are listed under "lazy" and
+fetched on first use.
+"""
+
+SHARDS_DIR = os.path.join(page_graph.PROJECT_ROOT, "configs", "shards")
+INDEX_NAME = "index.json"
+
+# Sections every page needs: the version, and the precomputed indexes (config map, loader phrases, lookups)
+BASE_SECTIONS = ["version", "indexes"]
+# Sections each feature script reads through Data.fetch / Data.loadMasterData
+FEATURE_SECTIONS = {
+    "hero": ["assets_manifest", "assets_meta"],
+    "logos": ["assets_manifest", "assets_meta"],
+    "home-services": ["categories"],
+    "portfolio": ["assets_manifest", "assets_meta"],
+    "reviews": ["reviews"],
+    "team": ["team", "assets_manifest", "assets_meta"],
+    "services": ["services", "categories"],
+    "learn": ["articles"],
+    "dialogs": ["dialogs"]
+}
+
+def minified_json(value):
+    return data_utils.canonical_json(value, minified=True)
+
+def shard_name(section, body):
+    return f"{section}.{hashlib.sha256(body).hexdigest()[:12]}.json"
+
+def page_sections(data, root=page_graph.PROJECT_ROOT):
+    """{page: [sections]} from the features each page loads (see page_graph.detect_features)."""
+    pages = {}
+    for page, graph in page_graph.all_page_graphs(root).items():
+        sections = list(BASE_SECTIONS)
+        for feature in graph["features"]:
+            sections.extend(s for s in FEATURE_SECTIONS.get(feature, []) if s not in sections)
+        pages[page] = [s for s in sections if s in data]
+    return pages
+
+def site_version(data):
+    version = data.get("version") or [{}]
+    return version[0].get("value") or version[0].get("version") or "0.0.0"
+
+def write_shards(data, shards_dir=SHARDS_DIR, root=page_graph.PROJECT_ROOT):
+    """
+    Writes one shard per top-level section of `data` and the index, skipping shards whose
+    content-hashed file already exists and pruning shards no longer referenced.
+    Returns stats {sections, written, pruned, bytes, page_bytes}.
+    """
+    os.makedirs(shards_dir, exist_ok=True)
+    index = {"version": site_version(data), "sections": {}, "pages": page_sections(data, root), "lazy": {}}
+    stats = {"sections": 0, "written": 0, "pruned": 0, "bytes": 0, "page_bytes": {}, "lazy_bytes": {}}
+    section_bytes = {}
+
+    for section, value in data.items():
+        body = minified_json(value)
+        name = shard_name(section, body)
+        index["sections"][section] = name
+        stats["sections"] += 1
+        stats["bytes"] += len(body)
+        section_bytes[section] = len(body)
+        path = os.path.join(shards_dir, name)
+        if not os.path.exists(path):
+            data_utils.write_file_atomic(path, body, "wb")
+            stats["written"] += 1
+
+    for name, value in (("search", search_index.build_search_index(data)),):
+        body = minified_json(value)
+        index["lazy"][name] = shard_name(name, body)
+        stats["lazy_bytes"][name] = len(body)
+        path = os.path.join(shards_dir, index["lazy"][name])
+        if not os.path.exists(path):
+            data_utils.write_file_atomic(path, body, "wb")
+            stats["written"] += 1
+
+    stats["page_bytes"] = {page: sum(section_bytes[s] for s in sections) for page, sections in index["pages"].items()}
+
+    data_utils.write_bytes_if_changed(os.path.join(shards_dir, INDEX_NAME), minified_json(index))
+
+    keep = set(index["sections"].values()) | set(index["lazy"].values()) | {INDEX_NAME}
+    for name in os.listdir(shards_dir):
+        if name not in keep and name.endswith(".json"):
+            os.remove(os.path.join(shards_dir, name))
+            stats["pruned"] += 1
+    return stats
+
+def shards_stale(data, index_body, names):
+    """
+    True unless `index_body` (index.json bytes, or None) maps every section of `data` to the
+    shard of its current content and every shard it names is among `names`.
+    """
+    if index_body is None:
+        return True
+    try:
+        index = json.loads(index_body)
+    except ValueError:
+        return True
+    expected = {section: shard_name(section, minified_json(value)) for section, value in data.items()}
+    if index.get("sections") != expected:
+        return True
+    return not set(expected.values()) | set(index.get("lazy", {}).values()) <= set(names)
+
+def shards_missing(data, shards_dir=SHARDS_DIR):
+    """shards_stale() against the shards written in `shards_dir`."""
+    try:
+        with open(os.path.join(shards_dir, INDEX_NAME), "rb") as f:
+            index_body = f.read()
+    except OSError:
+        return True
+    return shards_stale(data, index_body, os.listdir(shards_dir))
+
+def print_shards_report(stats):
+    print(f"  🧩 Shards: {stats['sections']} sections ({stats['bytes'] / 1024:.1f} KB minified), "
+          f"{stats['written']} written, {stats['pruned']} pruned")
+    for page, size in stats["page_bytes"].items():
+        print(f"     {page:<16} {size / 1024:6.1f} KB")
+    for name, size in stats["lazy_bytes"].items():
+        print(f"     {name + ' (lazy)':<16} {size / 1024:6.1f} KB")
+
+if __name__ == "__main__":
+    with open(os.path.join(page_graph.PROJECT_ROOT, page_graph.DATA_PATH), "r") as f:
+        site_data = json.load(f)
+    print_shards_report(write_shards(site_data))
@@ -0,0 +1,189 @@
+import http.server
+import json
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+"""
+🛰️ SYNC DAEMON (python3 scripts/sync_engine.py --daemon)
+Keeps the sync warm in one long-running process instead of a cold run per double-click:
+    - every --interval seconds the tabs are revalidated with conditional GETs; unchanged tabs
+      reuse the rows and fingerprints already in memory, so an idle poll parses nothing
+    - a poll whose fingerprints differ from the last commit starts a pending change; further
+      edits keep it open, and it is committed once the sheets have been quiet for --debounce
+      seconds (or after --max-wait at the latest), so a burst of edits becomes one commit
+    - when a tab is unreachable or the commit fails, polling backs off exponentially up to
+      --max-backoff and never commits partial data
+    - GET /health (200, or 503 while failing) and GET /metrics (JSON) on 127.0.0.1:--health-port
+The first poll after start-up commits straight away, catching up on edits made while it was down.
+"""
+
+DEFAULT_INTERVAL = 60
+DEFAULT_DEBOUNCE = 120
+DEFAULT_MAX_WAIT = 600
+DEFAULT_MAX_BACKOFF = 900
+DEFAULT_HEALTH_PORT = 8767
+
+def utc_iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ") if timestamp else None
+
+class SyncDaemon:
+    """
+    Poll/debounce/commit loop. `poll()` returns fetch results ({key: result} from
+    data_utils.fetch_tabs); `commit(results)` publishes them and returns the new commit sha,
+    or None if the branch already had that content. Exceptions from either count as failures.
+    """
+    def __init__(self, poll, commit, interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE,
+                 max_wait=DEFAULT_MAX_WAIT, max_backoff=DEFAULT_MAX_BACKOFF):
+        self.poll = poll
+        self.commit = commit
+        self.interval = interval
+        self.debounce = debounce
+        self.max_wait = max_wait
+        self.max_backoff = max_backoff
+        self.lock = threading.Lock()
+        self.committed = None  # {key: fingerprint} last published
+        self.pending = None  # {snapshot, first_seen, last_change}
+        self.stats = {"started_at": time.time(), "polls": 0, "commits": 0, "consecutive_failures": 0,
+                      "last_poll_at": None, "last_poll_ms": None, "last_ok_at": None, "last_sync_at": None,
+                      "last_commit": None, "last_error": None, "last_error_at": None, "next_poll_at": None, "tabs": {}}
+
+    def update(self, **fields):
+        with self.lock:
+            self.stats.update(fields)
+
+    def failed(self, message):
+        with self.lock:
+            self.stats["consecutive_failures"] += 1
+            failures = self.stats["consecutive_failures"]
+            self.stats.update(last_error=message, last_error_at=time.time())
+        delay = min(self.interval * 2 ** (failures - 1), self.max_backoff)
+        print(f"⚠️  {message}; retrying in {delay:.0f}s (failure {failures})")
+        return delay
+
+    def tick(self):
+        """One poll (and commit, if due). Returns the number of seconds until the next poll."""
+        start = time.perf_counter()
+        try:
+            results = self.poll()
+        except Exception as e:
+            return self.failed(f"Poll failed: {e}")
+        now = time.time()
+        with self.lock:
+            self.stats["polls"] += 1
+            self.stats.update(last_poll_at=now, last_poll_ms=round((time.perf_counter() - start) * 1000, 1),
+                              tabs={key: {"rows": len(r["rows"]) if r["rows"] is not None else None, "unchanged": r["unchanged"],
+                                          "ms": round(r["elapsed"] * 1000, 1), "error": r["error"]} for key, r in results.items()})
+        unreachable = [key for key, r in results.items() if r["rows"] is None]
+        if unreachable:
+            return self.failed(f"{len(unreachable)} tab(s) unreachable ({', '.join(unreachable)}: "
+                               f"{results[unreachable[0]]['error']}), nothing committed")
+
+        snapshot = {key: r["fingerprint"] for key, r in results.items()}
+        if snapshot == self.committed:
+            self.pending = None
+            self.update(consecutive_failures=0, last_ok_at=now)
+            return self.interval
+
+        if self.pending is None or self.pending["snapshot"] != snapshot:
+            first_seen = self.pending["first_seen"] if self.pending else now
+            self.pending = {"snapshot": snapshot, "first_seen": first_seen, "last_change": now}
+            if self.committed is not None:
+                changed = [key for key in snapshot if snapshot[key] != self.committed.get(key)]
+                print(f"✏️  Sheet edits in {', '.join(changed)}; committing after {self.debounce:.0f}s without further edits")
+        quiet = now - self.pending["last_change"]
+        waited = now - self.pending["first_seen"]
+        if self.committed is not None and quiet < self.debounce and waited < self.max_wait:
+            self.update(consecutive_failures=0, last_ok_at=now)
+            # Poll more often while a change is pending so the quiet period is measured, not guessed
+            return max(1.0, min(self.interval, self.debounce - quiet, self.max_wait - waited))
+
+        try:
+            commit = self.commit(results)
+        except Exception as e:
+            return self.failed(f"Commit failed: {e}")
+        self.committed, self.pending = snapshot, None
+        with self.lock:
+            self.stats.update(consecutive_failures=0, last_ok_at=now, last_sync_at=time.time(), last_error=None)
+            if commit:
+                self.stats["commits"] += 1
+                self.stats["last_commit"] = commit
+        return self.interval
+
+    def metrics(self):
+        with self.lock:
+            stats = dict(self.stats)
+            pending = dict(self.pending) if self.pending else None
+        now = time.time()
+        stats["healthy"] = stats["last_ok_at"] is not None and stats["consecutive_failures"] == 0
+        stats["uptime_s"] = round(now - stats["started_at"])
+        for key in ("started_at", "last_poll_at", "last_ok_at", "last_sync_at", "last_error_at", "next_poll_at"):
+            stats[key] = utc_iso(stats[key])
+        stats["pending"] = None if pending is None else {
+            "since": utc_iso(pending["first_seen"]), "quiet_s": round(now - pending["last_change"])}
+        stats["config"] = {"interval": self.interval, "debounce": self.debounce, "max_wait": self.max_wait, "max_backoff": self.max_backoff}
+        return stats
+
+    def run(self, stop):
+        while not stop.is_set():
+            delay = self.tick()
+            self.update(next_poll_at=time.time() + delay)
+            stop.wait(delay)
+
+def make_health_handler(daemon):
+    class HealthHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = urlparse(self.path).path
+            if path not in ("/health", "/metrics"):
+                self.send_error(404)
+                return
+            metrics = daemon.metrics()
+            if path == "/health":
+                payload = {key: metrics[key] for key in ("healthy", "last_ok_at", "last_sync_at", "last_commit",
+                                                         "consecutive_failures", "last_error")}
+            else:
+                payload = metrics
+            body = (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+            self.send_response(503 if path == "/health" and not metrics["healthy"] else 200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return HealthHandler
+
+def add_daemon_arguments(parser):
+    """Registers the --daemon tuning flags on an argparse parser."""
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Daemon: seconds between polls of the sheets.")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="Daemon: commit once the sheets were quiet this many seconds.")
+    parser.add_argument("--max-wait", type=float, default=DEFAULT_MAX_WAIT, help="Daemon: commit a pending change after this long even if edits continue.")
+    parser.add_argument("--max-backoff", type=float, default=DEFAULT_MAX_BACKOFF, help="Daemon: longest wait between retries while failing.")
+    parser.add_argument("--health-port", type=int, default=DEFAULT_HEALTH_PORT, help="Daemon: port for /health and /metrics on 127.0.0.1 (0 disables).")
+
+def serve(args, poll, commit):
+    """Runs the daemon until Ctrl-C or SIGTERM, with the health endpoint on a background thread."""
+    daemon = SyncDaemon(poll, commit, args.interval, args.debounce, args.max_wait, args.max_backoff)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    httpd = None
+    if args.health_port:
+        httpd = http.server.ThreadingHTTPServer(("127.0.0.1", args.health_port), make_health_handler(daemon))
+        threading.Thread(target=httpd.serve_forever, name="sync-health", daemon=True).start()
+        print(f"🩺 Health on http://127.0.0.1:{args.health_port}/health (metrics at /metrics)")
+    print(f"🛰️  Sync daemon polling every {args.interval:g}s (debounce {args.debounce:g}s, max wait {args.max_wait:g}s)")
+    try:
+        daemon.run(stop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if httpd:
+            httpd.shutdown()
+        if daemon.pending:
+            print("⏸️  A pending sheet change was not committed; it is picked up on the next start.")
+        print("👋 Sync daemon stopped.")
@@ -1,39 +1,45 @@
 import os
+import sys
 import json
-import subprocess
 import argparse
+import shutil
+import tempfile
 from datetime import datetime
 import data_utils
+import asset_index
+import build_sw
+import git_plumbing
+import image_variants
+import perf_budget
+import perf_trace
+import site_indexes
+import site_shards
+import sync_daemon
+from data_utils import GIDS, SPREADSHEET_ID
+from perf_trace import span
 
-# Configuration
-SPREADSHEET_ID = "e/2PACX-1vSfDsGSiXAvQMmO32s5qWgQaH1GDeZXqEbnMr7bQmm-7gtdoHX-pz_jNq_y3Mb_ahS1LJ99azA84HVZ"
-GIDS = {
-    "version": "2024034979",
-    "config": "1515187439",
-    "categories": "420875592",
-    "services": "439228131",
-    "reviews": "1697858749",
-    "team": "1489131428",
-    "dialogs": "49430965",
-    "articles": "582124820"
-}
-
-def run_command(cmd, silent=False):
-    if silent:
-        result = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
-    else:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-    
-    if result.returncode != 0 and not silent:
-        print(f"Error: {result.stderr}")
+JSON_PATH = "configs/site-data.json"
+SHARDS_PATH = "configs/shards"
+IMAGES_PATH = "assets/images"
+VARIANTS_PATH = "assets/variants"
+SYNC_BRANCH = "main"
+
+def run_command(args, silent=False):
+    """Runs one git command (argument list, timed by git_plumbing); prints git's error unless silent."""
+    try:
+        return git_plumbing.run_git(args)
+    except git_plumbing.GitError as e:
+        if not silent:
+            print(f"Error: {e.stderr}")
         return None
-    return result.stdout.strip()
 
 def load_local_json(json_path):
+    """Returns (data, raw_bytes); raw bytes are kept to validate the fingerprint sidecar."""
     if not os.path.exists(json_path):
-        return {}
-    with open(json_path, 'r') as f:
-        return json.load(f)
+        return {}, b""
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    return json.loads(raw), raw
 
 def get_version_value(data_list):
     if data_list and isinstance(data_list, list) and len(data_list) > 0:
@@ -41,118 +47,325 @@ def get_version_value(data_list):
         return version_item.get('value') or version_item.get('version')
     return None
 
-def main():
-    parser = argparse.ArgumentParser(description="Sync Google Sheets to local JSON.")
-    parser.add_argument("--no-push", action="store_true", help="Commit changes locally but do not push to remote.")
-    parser.add_argument("--no-branch-switch", action="store_true", help="Do not switch to main or pull; sync on the current branch.")
-    args = parser.parse_args()
-
-    print("🔄 Starting Data Sync Workflow...")
-    
-    # 1. Capture current state
-    original_branch = run_command("git rev-parse --abbrev-ref HEAD", silent=True)
-    has_changes = run_command("git status --porcelain", silent=True) != ""
-    
-    if not original_branch:
-        print("Error: Could not determine current Git branch.")
-        return
-
-    # 2. Stash changes if any
-    if has_changes:
-        print("📥 Stashing current changes...")
-        run_command("git stash", silent=True)
-
-    # 3. Branch Management
-    if not args.no_branch_switch:
-        print("🔀 Switching to main...")
-        run_command("git checkout main")
-        run_command("git pull origin main")
-    else:
-        print(f"📍 Syncing on current branch: {original_branch}")
+def commit_message():
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return f"data: bulk update site-data.json from google sheets ({timestamp})"
 
+def build_site_data(args, existing_local_full_data, existing_raw, shards_missing, fetch_results=None, variants=None):
+    """
+    Fetches every tab (unless `fetch_results` from an earlier fetch are passed in), rescans
+    assets and compares against the existing data. `variants` holds root/existing overrides
+    for image_variants.attach_variants (plumbing syncs keep new variants out of the checkout).
+    Returns (changes_detected, new_data, new_fingerprint_index).
+    """
     # 4. Fetch and Consolidate Data
     remote_master_data = {}
-    for key, gid in GIDS.items():
-        print(f"  📡 Fetching {key}...")
-        csv_text = data_utils.fetch_csv(SPREADSHEET_ID, gid)
-        if csv_text:
-            remote_master_data[key] = data_utils.parse_csv_to_list(csv_text)
+    if fetch_results is None:
+        fetch_results = data_utils.fetch_all_tabs(SPREADSHEET_ID, GIDS, args)
+    for key, result in fetch_results.items():
+        if result["rows"] is not None:
+            remote_master_data[key] = result["rows"]
         else:
             print(f"  ❌ Skipping {key} due to fetch failure.")
 
-    # 5. Load existing local data for comparison
-    json_path = "configs/site-data.json"
-    existing_local_full_data = load_local_json(json_path)
-    
-    # 5b. Scan local assets
-    assets_manifest = {}
-    assets_root = "assets/images"
-    if os.path.exists(assets_root):
-        for root, dirs, files in os.walk(assets_root):
-            # Get relative path from assets_root
-            rel_path = os.path.relpath(root, assets_root)
-            if rel_path == ".":
-                folder_key = "root"
-            else:
-                folder_key = rel_path.replace(os.sep, "/")
-            
-            # Filter for common image extensions
-            image_files = [f for f in files if f.lower().endswith(('.png', '.jpg', '.jpeg', '.webp', '.gif'))]
-            if image_files:
-                assets_manifest[folder_key] = sorted(image_files)
+    # 5. Reuse the fingerprints of the existing data when the sidecar matches it
+    local_index = data_utils.load_fingerprint_index(JSON_PATH, existing_raw) or {}
+
+    # 5b. Scan local assets (incremental: only changed directories are re-listed)
+    with span("manifest scan", hot=True):
+        assets_manifest, assets_meta, scan_stats = asset_index.build_assets_manifest()
+    asset_index.print_scan_report(scan_stats, assets_manifest)
+    with span("image variants", generate=not args.skip_images):
+        variant_stats = image_variants.attach_variants(assets_meta, generate=not args.skip_images, **(variants or {}))
+    image_variants.print_variants_report(variant_stats)
     
     changes_detected = False
     new_local_full_data_to_write = existing_local_full_data.copy() 
     new_local_full_data_to_write["assets_manifest"] = assets_manifest
+    new_local_full_data_to_write["assets_meta"] = assets_meta
+
+    # Compare category by category using order-independent row fingerprints
+    new_index = {}
+    with span("compare", hot=True):
+        for category in GIDS.keys():
+            local_list = existing_local_full_data.get(category, [])
+            remote_list = remote_master_data.get(category, [])
+
+            local_fp = local_index.get(category)
+            if local_fp is None:
+                fingerprint, digests = data_utils.fingerprint_dataset(local_list)
+                local_fp = {"fingerprint": fingerprint, "digests": digests}
 
-    # Compare category by category using robust logic
-    for category in GIDS.keys():
-        local_list = existing_local_full_data.get(category, [])
-        remote_list = remote_master_data.get(category, [])
+            result = fetch_results.get(category, {})
+            if result.get("digests") is not None and result.get("rows") is remote_list:
+                remote_fp = {"fingerprint": result["fingerprint"], "digests": result["digests"]}
+            else:
+                fingerprint, digests = data_utils.fingerprint_dataset(remote_list)
+                remote_fp = {"fingerprint": fingerprint, "digests": digests}
+
+            if local_fp["fingerprint"] != remote_fp["fingerprint"]:
+                change = data_utils.compare_digests(local_fp["digests"], remote_fp["digests"])
+                if change["changed"]:
+                    changes_detected = True
+                    print(f"  ✏️  {category}: {len(change['added'])} rows added/changed, {len(change['removed'])} rows removed/replaced")
 
-        sorted_headers = data_utils.get_all_headers(local_list, remote_list)
-        normalized_local = data_utils.normalize_dataset(local_list, headers=sorted_headers)
-        normalized_remote = data_utils.normalize_dataset(remote_list, headers=sorted_headers)
+            # Strictly use remote data for managed categories (purges removed keys)
+            new_local_full_data_to_write[category] = remote_list
+            new_index[category] = remote_fp
 
-        if normalized_local != normalized_remote:
+    # Compile the client lookup indexes; an unresolved category or image reference aborts the sync here
+    with span("indexes"):
+        if site_indexes.attach_indexes(new_local_full_data_to_write):
             changes_detected = True
-        
-        # Strictly use remote data for managed categories (purges removed keys)
-        new_local_full_data_to_write[category] = remote_list
 
-    # Force change if manifest differs
-    if existing_local_full_data.get("assets_manifest") != assets_manifest:
+    # Force change if manifest or image metadata differs
+    if (existing_local_full_data.get("assets_manifest") != assets_manifest
+            or existing_local_full_data.get("assets_meta") != assets_meta):
+        changes_detected = True
+    if shards_missing:
         changes_detected = True
 
-    if not changes_detected:
+    if not changes_detected and not local_index and existing_raw:
+        # Warm the sidecar so the next run can skip fingerprinting the existing file
+        data_utils.write_fingerprint_index(JSON_PATH, existing_raw, new_index)
+    return changes_detected, new_local_full_data_to_write, new_index
+
+def checkout_sync(args, original_branch):
+    """Classic flow: stash, switch to main and pull, write the files in the checkout, commit, switch back."""
+    has_changes = run_command(["status", "--porcelain"], silent=True) != ""
+
+    # 2. Stash changes if any
+    if has_changes:
+        print("📥 Stashing current changes...")
+        run_command(["stash"], silent=True)
+
+    # 3. Branch Management
+    if not args.no_branch_switch:
+        print(f"🔀 Switching to {SYNC_BRANCH}...")
+        run_command(["checkout", SYNC_BRANCH])
+        run_command(["pull", "origin", SYNC_BRANCH])
+    else:
+        print(f"📍 Syncing on current branch: {original_branch}")
+
+    with span("read site-data", "io"):
+        existing_local_full_data, existing_raw = load_local_json(JSON_PATH)
+    ok = True
+    try:
+        changes_detected, new_data, new_index = build_site_data(args, existing_local_full_data, existing_raw,
+                                                                site_shards.shards_missing(existing_local_full_data))
+    except site_indexes.UnresolvedReferenceError as e:
+        print(f"❌ Sync aborted before writing anything: {e}")
+        changes_detected = ok = False
+
+    if ok and not changes_detected:
         print("🙌 No meaningful changes detected in Google Sheets compared to local. Skipping commit.")
-        if original_branch != "main":
-            run_command(f"git checkout {original_branch}", silent=True)
-        if has_changes:
-            run_command("git stash pop", silent=True)
-        return
+    elif ok:
+        body, changed = data_utils.write_json_canonical(JSON_PATH, new_data, args.minified_twin or None)
+        data_utils.write_fingerprint_index(JSON_PATH, body, new_index)
+        print(f"✅ Data consolidated into {JSON_PATH}" if changed else f"✅ {JSON_PATH} already holds this data (not rewritten)")
+        with span("shards"):
+            shard_stats = site_shards.write_shards(new_data)
+        site_shards.print_shards_report(shard_stats)
+        with span("service worker"):
+            sw_changed, sw_stats = build_sw.write_service_worker(new_data)
+        build_sw.print_sw_report(sw_changed, sw_stats)
+        with span("page budget"):
+            perf_budget.print_sync_check(new_data)
 
-    with open(json_path, 'w') as f:
-        json.dump(new_local_full_data_to_write, f, indent=2)
-    print(f"✅ Data consolidated into {json_path}")
+        # 6. Commit
+        print(f"🚀 Committing updates to {SYNC_BRANCH}...")
+        run_command(["add", JSON_PATH])
+        if os.path.exists(data_utils.minified_twin_path(JSON_PATH)):
+            run_command(["add", data_utils.minified_twin_path(JSON_PATH)])
+        run_command(["add", "-A", SHARDS_PATH])
+        run_command(["add", build_sw.SW_PATH])
+        if os.path.isdir(image_variants.VARIANTS_DIR):
+            run_command(["add", "-A", VARIANTS_PATH])
+        run_command(["commit", "-m", commit_message()])
 
-    # 6. Commit
-    print("🚀 Committing updates to main...")
-    run_command(f"git add {json_path}")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    run_command(f'git commit -m "data: bulk update site-data.json from google sheets ({timestamp})"')
-    
-    if not args.no_push:
-        print("📤 Pushing to origin main...")
-        run_command("git push origin main")
+        if not args.no_push:
+            print(f"📤 Pushing to origin {SYNC_BRANCH}...")
+            run_command(["push", "origin", SYNC_BRANCH])
 
     # 7. Restore original state
-    if original_branch != "main":
-        run_command(f"git checkout {original_branch}", silent=True)
+    if original_branch != SYNC_BRANCH:
+        run_command(["checkout", original_branch], silent=True)
     
     if has_changes:
-        run_command("git stash pop", silent=True)
+        run_command(["stash", "pop"], silent=True)
+    return ok
+
+def committed_tree(parent, files, dest):
+    """
+    Writes the tree commit_to_branch() will commit (`parent` plus `files`) into `dest`, so checks
+    run against main rather than the checkout. assets/images links to the checkout's, which must match main's.
+    """
+    git_plumbing.export_tree(parent, dest, exclude=[IMAGES_PATH])
+    for path, source in files.items():
+        target = os.path.join(dest, path)
+        if source is None:
+            if os.path.exists(target):
+                os.remove(target)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+    os.makedirs(os.path.dirname(os.path.join(dest, IMAGES_PATH)), exist_ok=True)
+    os.symlink(os.path.abspath(IMAGES_PATH), os.path.join(dest, IMAGES_PATH))
+
+def plumbing_sync(args, fetch_results=None):
+    """
+    Commits the new site-data.json, shards and variants straight onto main through a temporary
+    index (git_plumbing.commit_to_branch): no stash, no checkout, and nothing tracked is written
+    in the checkout (only the git-ignored caches: sheets CSVs, asset index, fingerprint sidecar).
+    Returns False if the sync could not run.
+    """
+    print(f"🧱 Committing straight to {SYNC_BRANCH} with git plumbing (your checkout is left alone)...")
+    parent, local = git_plumbing.sync_base(SYNC_BRANCH)
+
+    # The asset scan reads assets/images from the checkout, so it must match main's images
+    if run_command(["diff", "--quiet", parent, "--", IMAGES_PATH], silent=True) is None:
+        print(f"❌ assets/images in your checkout differs from {SYNC_BRANCH}. "
+              "Commit or merge the image changes first, or sync without --plumbing.")
+        return False
+
+    existing_raw = git_plumbing.read_blob(parent, JSON_PATH) or b""
+    existing_data = json.loads(existing_raw) if existing_raw else {}
+    shards_missing = site_shards.shards_stale(existing_data, git_plumbing.read_blob(parent, f"{SHARDS_PATH}/{site_shards.INDEX_NAME}"),
+                                              [path.rsplit("/", 1)[-1] for path in git_plumbing.tree_entries(parent, SHARDS_PATH)])
+    with tempfile.TemporaryDirectory(prefix="styleplanit-sync-") as tmp_dir:
+        # New variants are encoded into tmp_dir; those already on main are only recorded
+        variants = {"root": tmp_dir, "existing": set(git_plumbing.tree_entries(parent, VARIANTS_PATH))}
+        changes_detected, new_data, new_index = build_site_data(args, existing_data, existing_raw, shards_missing,
+                                                                fetch_results, variants)
+        if not changes_detected:
+            print(f"🙌 No meaningful changes detected in Google Sheets compared to {SYNC_BRANCH}. Skipping commit.")
+            return True
+
+        data_file = os.path.join(tmp_dir, "site-data.json")
+        with span("write site-data.json", "io"):
+            body = data_utils.canonical_json(new_data)
+            data_utils.write_file_atomic(data_file, body, "wb")
+        data_utils.write_fingerprint_index(JSON_PATH, body, new_index)
+        shards_dir = os.path.join(tmp_dir, "shards")
+        with span("shards"):
+            shard_stats = site_shards.write_shards(new_data, shards_dir)
+        site_shards.print_shards_report(shard_stats)
+
+        # Shard and variant names are content hashes: only new names need to be hashed into blobs
+        files = {JSON_PATH: data_file}
+        twin_path = data_utils.minified_twin_path(JSON_PATH)
+        if args.minified_twin or git_plumbing.tree_entries(parent, twin_path):
+            twin_file = os.path.join(tmp_dir, "site-data.min.json")
+            data_utils.write_file_atomic(twin_file, data_utils.canonical_json(new_data, minified=True), "wb")
+            files[twin_path] = twin_file
+        files.update(git_plumbing.directory_changes(parent, SHARDS_PATH, {
+            f"{SHARDS_PATH}/{name}": os.path.join(shards_dir, name) for name in os.listdir(shards_dir)}))
+        files[f"{SHARDS_PATH}/{site_shards.INDEX_NAME}"] = os.path.join(shards_dir, site_shards.INDEX_NAME)
+        # Precache revisions come from main's tree, not the checkout
+        with span("service worker"):
+            sw_body, sw_stats = build_sw.render_service_worker(git_plumbing.tree_listing(parent), new_data)
+        sw_changed = sw_body != git_plumbing.read_blob(parent, build_sw.SW_PATH)
+        if sw_changed:
+            sw_file = os.path.join(tmp_dir, build_sw.SW_PATH)
+            data_utils.write_file_atomic(sw_file, sw_body, "wb")
+            files[build_sw.SW_PATH] = sw_file
+        build_sw.print_sw_report(sw_changed, sw_stats)
+        # Exactly the variants the new assets_meta references: unreferenced ones are deleted from main
+        files.update(git_plumbing.directory_changes(parent, VARIANTS_PATH, {
+            variant["src"]: os.path.join(tmp_dir, variant["src"])
+            for info in new_data.get("assets_meta", {}).values() for variant in info.get("variants", [])}))
+
+        with span("page budget"):
+            budget_root = os.path.join(tmp_dir, "tree")
+            committed_tree(parent, files, budget_root)
+            perf_budget.print_sync_check(new_data, budget_root)
+
+        print(f"🚀 Committing {sum(1 for s in files.values() if s)} changed files to {SYNC_BRANCH}...")
+        with span("commit", files=len(files)):
+            commit = git_plumbing.commit_to_branch(SYNC_BRANCH, parent, files, commit_message(), expected=local)
+
+    if commit is None:
+        print(f"🙌 {SYNC_BRANCH} already has this content. Skipping commit.")
+        return True
+    print(f"✅ {SYNC_BRANCH} is now at {commit[:10]}")
+    if not args.no_push:
+        print(f"📤 Pushing to origin {SYNC_BRANCH}...")
+        git_plumbing.run_git(["push", "origin", f"{commit}:refs/heads/{SYNC_BRANCH}"])
+    return True
+
+def run_daemon(args):
+    """--daemon: polls with warm in-memory tabs (sync_daemon.py) and publishes each debounced change with plumbing_sync."""
+    cache_dir = None if args.no_cache else data_utils.CACHE_DIR
+    if cache_dir:
+        data_utils.evict_cache(cache_dir)
+    warm = {}
+
+    def poll():
+        return data_utils.fetch_tabs(SPREADSHEET_ID, GIDS, workers=args.workers, timeout=args.timeout, retries=args.retries,
+                                     base_url=args.sheets_url, cache_dir=cache_dir, warm=warm)
+
+    def commit(results):
+        before = git_plumbing.resolve(f"refs/heads/{SYNC_BRANCH}")
+        # --profile traces each commit on its own; polls are not traced, so nothing accumulates between them
+        perf_trace.start_profiling(args, "sync_engine")
+        try:
+            if not plumbing_sync(args, results):
+                raise RuntimeError("the sync could not run (see above)")
+        finally:
+            git_plumbing.print_git_timings()
+            git_plumbing.GIT_TIMINGS.clear()
+            perf_trace.finish_profiling()
+        after = git_plumbing.resolve(f"refs/heads/{SYNC_BRANCH}")
+        return after if after != before else None
+
+    sync_daemon.serve(args, poll, commit)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync Google Sheets to local JSON.")
+    parser.add_argument("--no-push", action="store_true", help="Commit changes locally but do not push to remote.")
+    parser.add_argument("--no-branch-switch", action="store_true", help="Do not switch to main or pull; sync on the current branch.")
+    parser.add_argument("--plumbing", action="store_true",
+                        help="Commit to main with git plumbing instead of stash/checkout/pull (ignored with --no-branch-switch).")
+    parser.add_argument("--minified-twin", action="store_true",
+                        help="Also write configs/site-data.min.json (kept up to date automatically once it exists).")
+    parser.add_argument("--skip-images", action="store_true", help="Do not encode responsive image variants (existing ones are still recorded).")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep running: poll the sheets and commit each burst of edits once, with git plumbing (see sync_daemon.py).")
+    sync_daemon.add_daemon_arguments(parser)
+    data_utils.add_fetch_arguments(parser)
+    perf_trace.add_profile_arguments(parser)
+    args = parser.parse_args()
+    if args.daemon:
+        run_daemon(args)
+        return
+    perf_trace.start_profiling(args, "sync_engine")
+
+    print("🔄 Starting Data Sync Workflow...")
+    
+    # 1. Capture current state
+    original_branch = git_plumbing.current_branch()
+    if not original_branch:
+        print("Error: Could not determine current Git branch.")
+        return
+
+    ok = True
+    try:
+        if args.plumbing and not args.no_branch_switch:
+            ok = plumbing_sync(args)
+        else:
+            ok = checkout_sync(args, original_branch)
+    except site_indexes.UnresolvedReferenceError as e:
+        print(f"❌ Sync aborted before writing anything: {e}")
+        ok = False
+    except git_plumbing.GitError as e:
+        print(f"❌ {e}")
+        ok = False
+    finally:
+        git_plumbing.print_git_timings()
+        perf_trace.finish_profiling()
 
+    if not ok:
+        sys.exit(1)
     print("✨ Workflow Complete!")
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+/**
+ * sw.js - Service worker generated by scripts/build_sw.py. Do not edit; rerun the build.
+ */
+const VERSION = "4.6.0";
+const PRECACHE = [
+    ["/assets/images/home-page/logos/NYFW_SHOWS_LOCKUP_HORIZONTAL_black%20(1).png", "e8e0aeaa92d6"],
+    ["/assets/images/home-page/logos/ahemdabad-mirror.png", "0ad1f12b9e93"],
+    ["/assets/images/home-page/logos/harlem-fashion-week.png", "4ed8eb3b6857"],
+    ["/assets/images/home-page/logos/miss_universe-logo_brandlogos.net_rl7b5-512x512.png", "0bc98f7cfb0a"],
+    ["/assets/images/home-page/og-preview.jpg", "2f55c766dcfb"],
+    ["/assets/images/meet-team-page/deepesh-intro.jpg", "89bc0637b094"],
+    ["/assets/images/portfolio/dee_before.jpg", "569f6a081d83"],
+    ["/assets/images/portfolio/riddhe.jpg", "2e2b8026b791"],
+    ["/assets/images/portfolio/riesha_after.jpg", "23578a9e17b6"],
+    ["/assets/images/portfolio/riesha_before.jpg", "86f370f96e66"],
+    ["/assets/images/portfolio/sam_after.jpg", "b7a531caeaf9"],
+    ["/assets/images/portfolio/sam_before.jpg", "e214f74baa38"],
+    ["/assets/images/services-by-category/Elevate/30_min_style_revamp.jpeg", "acee3597769d"],
+    ["/assets/images/services-by-category/Elevate/build_your_signature_self.jpg", "1f5f2956d3a6"],
+    ["/assets/images/services-by-category/Elevate/homepage_hero.jpg", "79973f3cca81"],
+    ["/assets/images/services-by-category/Elevate/ooo_edit.jpg", "c508f444759d"],
+    ["/assets/images/services-by-category/Elevate/showstopper.jpg", "5c3762c3fecf"],
+    ["/assets/images/services-by-category/Elevate/signature_foundations.jpeg", "34499d4f5564"],
+    ["/assets/images/services-by-category/Elevate/single_occasion.jpg", "d62c4bfcb912"],
+    ["/assets/images/services-by-category/Elevate/style_concierge_in_person.jpg", "f6c29d47faa3"],
+    ["/assets/images/services-by-category/Elevate/style_concierge_virtual.jpg", "d494139a7178"],
+    ["/assets/images/services-by-category/Elevate/tone_audit_in_person.jpg", "aba4e6c1c834"],
+    ["/assets/images/services-by-category/Elevate/tone_audit_virtual.jpg", "f00ddee29577"],
+    ["/assets/images/services-by-category/Establish/hired_look.jpg", "269e844c3a3f"],
+    ["/assets/images/services-by-category/Establish/homepage_hero.jpg", "6f12b0c2e86a"],
+    ["/assets/images/services-by-category/Establish/newcomer_essentials.jpeg", "766ab8ae89d3"],
+    ["/assets/images/services-by-category/Establish/refine_and_align.jpg", "8a7020b86e53"],
+    ["/components/book-now-floating.html", "3022a6b316a2"],
+    ["/components/footer.html", "3c494fc9de7c"],
+    ["/components/header.html", "3607a4e26862"],
+    ["/components/hero-section.html", "d2f3fc724f61"],
+    ["/components/icon-auth-gate.html", "dadf4e0372a9"],
+    ["/components/icon-section.html", "6d4b3084b983"],
+    ["/components/icon-service-layout.html", "b373e9e6b4a6"],
+    ["/components/logo-band.html", "3feb98a805e3"],
+    ["/components/portfolio-section.html", "97f49688052e"],
+    ["/components/programs-section.html", "7826db4c3807"],
+    ["/components/reviews-section.html", "58e4e2efe515"],
+    ["/components/subscribe.html", "962ce2e836d0"],
+    ["/components/value-section.html", "b29a368a95a3"],
+    ["/dist/bundles/icon-service.45be80dd20.js", "4d7e742140c2"],
+    ["/dist/bundles/index.79f123e252.js", "264817f5c71f"],
+    ["/dist/bundles/learn.33b8865009.js", "3f7e42f178b6"],
+    ["/dist/bundles/meet-the-team.b726113589.js", "5f401555ccb3"],
+    ["/dist/bundles/reviews.d2738f50f0.js", "502b1ed4c8ab"],
+    ["/dist/bundles/services.094484e8e9.js", "931c71c2c7eb"],
+    ["/dist/css/icon-service.critical.3c54651a15.css", "a957a38c18c7"],
+    ["/dist/css/index.critical.7582915334.css", "2814a5135ab4"],
+    ["/dist/css/learn.critical.ec8ee3f1c5.css", "b74e1fe7d546"],
+    ["/dist/css/meet-the-team.critical.e5d95397f4.css", "b0802393a78d"],
+    ["/dist/css/reviews.critical.6e4f95a111.css", "08e11ead3710"],
+    ["/dist/css/services.critical.15a52b4039.css", "bc516f369389"],
+    ["/dist/css/styles.bb2f61d290.css", "eb542aeaa078"],
+    ["/dist/js/app.7e1e8f7132.js", "0078c64b9b81"],
+    ["/dist/js/config.e67dc75303.js", "dd3c3a2a1dc2"],
+    ["/dist/js/features/analytics.019c2f11c5.js", "e447b4a3dc60"],
+    ["/dist/js/features/dialogs.14ad174e43.js", "d31ee3cd5f6d"],
+    ["/dist/js/features/hero.5eba45423c.js", "2eab090702f4"],
+    ["/dist/js/features/home-services.80610f1185.js", "a7bb536d954a"],
+    ["/dist/js/features/icon-service.dec4091fae.js", "4aba8fce3e44"],
+    ["/dist/js/features/learn.44194a9d62.js", "aaa53bfbce7c"],
+    ["/dist/js/features/logos.a96e591ff8.js", "1d603af0799f"],
+    ["/dist/js/features/portfolio.b99cbc1369.js", "87739864e644"],
+    ["/dist/js/features/reviews.9b67dbf170.js", "6c14d40ac127"],
+    ["/dist/js/features/services.d8e1cea071.js", "79208d821d14"],
+    ["/dist/js/features/subscribe.ea02d0bedb.js", "92d15ef2218f"],
+    ["/dist/js/features/team.49165b1c83.js", "109fb5f2b8de"],
+    ["/dist/js/loader.14c1c35d6f.js", "71b009f0ec7d"],
+    ["/dist/js/utils.4cc12e9f26.js", "a89437882c9b"],
+    ["/dist/styles/common.c23c1d9231.css", "b24485c84a86"],
+    ["/dist/styles/desktop.6048fee76c.css", "d586402d222d"],
+    ["/dist/styles/mobile.417522cac2.css", "17632932106c"],
+    ["/dist/styles/styles.2a847ad30e.css", "df3e69e0cc72"],
+    ["/dist/styles/variables.a31ecd9f72.css", "506cf386b4ca"],
+    ["/favicon.svg", "92688fe2fa90"],
+    ["/icon-service.html", "a5ad0a83896b"],
+    ["/index.html", "01f09528adf3"],
+    ["/js/app.js", "95470242e0ef"],
+    ["/js/config.js", "e48cbdae8f9e"],
+    ["/js/features/analytics.js", "5150825b8ee4"],
+    ["/js/features/dialogs.js", "fdfbf963c9e5"],
+    ["/js/features/hero.js", "4260a100521a"],
+    ["/js/features/home-services.js", "e0d96ca82953"],
+    ["/js/features/icon-service.js", "9917b79658a5"],
+    ["/js/features/learn.js", "0a23628389c1"],
+    ["/js/features/logos.js", "d60aa27076f1"],
+    ["/js/features/portfolio.js", "cca6ff1053e3"],
+    ["/js/features/reviews.js", "86d588daa4de"],
+    ["/js/features/services.js", "405b9783f760"],
+    ["/js/features/subscribe.js", "8562c746cbea"],
+    ["/js/features/team.js", "a7ae8a46d303"],
+    ["/js/loader.js", "3c9c37dac16d"],
+    ["/js/utils.js", "dbf86405186e"],
+    ["/learn.html", "f33a053739ee"],
+    ["/meet-the-team.html", "d3ff83ae95fe"],
+    ["/reviews.html", "8775b33d99ee"],
+    ["/services.html", "738a631726f3"],
+    ["/styles/common.css", "de6c63ccd65f"],
+    ["/styles/desktop.css", "5ac051a72bba"],
+    ["/styles/mobile.css", "c922f06ef9ec"],
+    ["/styles/styles.css", "cc44cb3d4c31"],
+    ["/styles/variables.css", "73bb7417cf75"]
+];
+const RUNTIME_HOSTS = ["fonts.googleapis.com", "fonts.gstatic.com", "cdn.jsdelivr.net", "cdnjs.cloudflare.com"];
+const DATA_PATHS = ["/configs/", "/dist/asset-manifest.json", "/dist/css/manifest.json"];
+
+const PRECACHE_CACHE = `styleplanit-precache-${VERSION}`;
+const DATA_CACHE = `styleplanit-data-${VERSION}`;
+const RUNTIME_CACHE = `styleplanit-runtime-${VERSION}`;
+const REVISIONS = new Map(PRECACHE);
+
+function precacheKey(path, revision) {
+    return `${path}?__rev=${revision}`;
+}
+
+// Clean URLs as served by GitHub Pages: / -> /index.html, /services -> /services.html
+function pagePath(pathname) {
+    if (pathname === "/") return "/index.html";
+    const trimmed = pathname.replace(/\/+$/, "");
+    return trimmed.split("/").pop().includes(".") ? trimmed : `${trimmed}.html`;
+}
+
+self.addEventListener("install", (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE_CACHE);
+        await Promise.all(PRECACHE.map(async ([path, revision]) => {
+            const key = precacheKey(path, revision);
+            if (await cache.match(key)) return;
+            try {
+                // An older version's cache may already hold this revision
+                const response = (await caches.match(key)) || (await fetch(path, { cache: "no-cache" }));
+                if (response.ok) await cache.put(key, response);
+            } catch (e) {
+                console.warn(`[SW] Precache failed for ${path}`, e);
+            }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil((async () => {
+        const current = [PRECACHE_CACHE, DATA_CACHE, RUNTIME_CACHE];
+        for (const name of await caches.keys()) {
+            if (name.startsWith("styleplanit-") && !current.includes(name)) await caches.delete(name);
+        }
+        const wanted = new Set(PRECACHE.map(([path, revision]) => precacheKey(path, revision)));
+        const cache = await caches.open(PRECACHE_CACHE);
+        for (const request of await cache.keys()) {
+            const url = new URL(request.url);
+            if (!wanted.has(url.pathname + url.search)) await cache.delete(request);
+        }
+        await self.clients.claim();
+    })());
+});
+
+async function cacheFirst(cacheName, request, key) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(key);
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok || response.type === "opaque") await cache.put(key, response.clone());
+    return response;
+}
+
+// Keyed by the full URL, so a new ?v=<hash> fetches the replaced file; older versions of the path are dropped
+async function cacheFirstVersioned(cacheName, request, event) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request.url);
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok || response.type === "opaque") {
+        await cache.put(request.url, response.clone());
+        event.waitUntil(cache.keys(request.url, { ignoreSearch: true }).then(keys => Promise.all(
+            keys.filter(key => key.url !== request.url).map(key => cache.delete(key)))));
+    }
+    return response;
+}
+
+async function staleWhileRevalidate(cacheName, request, key, event) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(key);
+    const network = fetch(request).then(async (response) => {
+        if (response.ok || response.type === "opaque") await cache.put(key, response.clone());
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(network.catch(() => null));
+        return cached;
+    }
+    return network;
+}
+
+self.addEventListener("fetch", (event) => {
+    const request = event.request;
+    if (request.method !== "GET") return;
+    const url = new URL(request.url);
+
+    if (url.origin !== self.location.origin) {
+        if (RUNTIME_HOSTS.includes(url.hostname)) {
+            event.respondWith(staleWhileRevalidate(RUNTIME_CACHE, request, request.url, event));
+        }
+        return;
+    }
+
+    const path = request.mode === "navigate" ? pagePath(url.pathname) : url.pathname;
+    if (REVISIONS.has(path)) {
+        event.respondWith(cacheFirst(PRECACHE_CACHE, request, precacheKey(path, REVISIONS.get(path))));
+    } else if (DATA_PATHS.some(prefix => path.startsWith(prefix))) {
+        // Query strings are cache busters (?v=<timestamp>); one entry per path
+        event.respondWith(staleWhileRevalidate(DATA_CACHE, request, url.origin + path, event));
+    } else if (path.startsWith("/assets/")) {
+        event.respondWith(cacheFirstVersioned(RUNTIME_CACHE, request, event));
+    }
+});
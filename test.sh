@@ -4,8 +4,16 @@
 PORT=8000
 SERVER_URL="http://localhost:$PORT"
 
+echo "🏷️  Checking fingerprinted assets..."
+python3 scripts/build_assets.py --check || exit 1
+python3 scripts/build_css.py --check || exit 1
+python3 scripts/build_sw.py --check || exit 1
+python3 scripts/perf_budget.py --check || exit 1
+python3 scripts/search_index.py --check || exit 1
+python3 scripts/diff_engine.py --check || exit 1
+
 echo "🚀 Starting dev server on port $PORT..."
-python3 scripts/dev_server.py > /dev/null 2>&1 &
+python3 scripts/dev_server.py "$@" > /dev/null 2>&1 &
 SERVER_PID=$!
 
 sleep 2
@@ -43,6 +51,8 @@ test_endpoint "js/config.js"
 test_endpoint "js/utils.js"
 test_endpoint "js/app.js"
 test_endpoint "configs/site-data.json"
+test_endpoint "configs/shards/index.json"
+test_endpoint "dist/asset-manifest.json"
 test_endpoint "sync-styleplanit.command"
 
 echo "✨ All production-grade endpoint tests passed!"